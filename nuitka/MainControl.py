@@ -46,21 +46,23 @@ from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.AppDirs import getCacheDir
 from nuitka.utils.FileOperations import (
     deleteFile,
+    getFileContents,
     hasFilenameExtension,
     listDir,
     makePath,
     removeDirectory,
 )
 from nuitka.utils.ModuleNames import ModuleName
+from nuitka.utils.Timing import withPhaseReport, writePhaseReport
 from nuitka.utils.Utils import isWin32Windows
 
 from . import ModuleRegistry, Options, OutputDirectories, TreeXML
-from .build import SconsInterface
-from .codegen import CodeGeneration, ConstantCodes, Reports
+from .build import NinjaInterface, SconsInterface
+from .codegen import CodeGeneration, ConstantCodes, ModuleCodeCache, Reports
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
 from .freezer.Standalone import copyUsedDLLs
-from .optimizations import Optimization
+from .optimizations import Optimization, ParallelOptimization
 from .tree import Building
 
 
@@ -73,6 +75,11 @@ def createNodeTree(filename):
 
     """
 
+    # Optimize the modules in worker processes first, so building and
+    # optimizing them here restores them from the module cache.
+    if ParallelOptimization.isParallelOptimizationEnabled():
+        ParallelOptimization.preOptimizeModules(filename)
+
     # First, build the raw node tree from the source code.
     main_module = Building.buildModuleTree(
         filename=filename,
@@ -97,7 +104,9 @@ def createNodeTree(filename):
         removeDirectory(path=standalone_dir, ignore_errors=True)
         makePath(standalone_dir)
 
-    deleteFile(path=OutputDirectories.getResultFullpath(), must_exist=False)
+    # Ninja decides itself if the result is outdated, only relinks then.
+    if not Options.shallUseNinja():
+        deleteFile(path=OutputDirectories.getResultFullpath(), must_exist=False)
 
     # Second, do it for the directories given.
     for plugin_filename in Options.getShallFollowExtra():
@@ -157,6 +166,12 @@ def dumpTreeXML(tree):
     TreeXML.dump(xml_root)
 
 
+def _shallKeepSourceFiles():
+    # With the code cache and for ninja, generated files and objects are kept
+    # between compilations, so unchanged files need not be compiled again.
+    return ModuleCodeCache.isCodeCacheEnabled() or Options.shallUseNinja()
+
+
 def cleanSourceDirectory(source_dir):
     extensions = (
         ".bin",
@@ -175,6 +190,16 @@ def cleanSourceDirectory(source_dir):
         ".txt",
     )
 
+    # With the code cache or ninja, generated files and objects are kept, files
+    # are only overwritten if their contents change, so the C compilation of
+    # unchanged modules can be avoided. Outdated files are removed later.
+    if _shallKeepSourceFiles():
+        extensions = tuple(
+            extension
+            for extension in extensions
+            if extension not in (".bin", ".c", ".cpp", ".h", ".o", ".obj", ".os")
+        )
+
     def check(path):
         if hasFilenameExtension(path, extensions):
             deleteFile(path, must_exist=True)
@@ -196,6 +221,39 @@ def cleanSourceDirectory(source_dir):
                 check(path)
 
 
+def removeOutdatedSourceFiles(source_dir):
+    """ Remove generated source files not written in this compilation.
+
+    With the code cache or ninja, the source directory is not cleaned, but
+    files of e.g. modules no longer included must not be compiled.
+    """
+
+    def check(path):
+        if not hasFilenameExtension(path, (".c", ".cpp")):
+            return
+
+        # The constants blob as C code is written by the C build itself, only
+        # when it changed, so removing it would cause a recompilation.
+        if os.path.basename(path) in ("__constants_data.c", "__constants_data.cpp"):
+            return
+
+        # Scons renames the C files to C++ files, if it has to use that.
+        if path.endswith(".cpp") and path[:-2] in _written_filenames:
+            return
+
+        if path not in _written_filenames:
+            deleteFile(path, must_exist=True)
+
+    for path, _filename in listDir(source_dir):
+        check(path)
+
+    plugins_dir = os.path.join(source_dir, "plugins")
+
+    if os.path.exists(plugins_dir):
+        for path, _filename in listDir(plugins_dir):
+            check(path)
+
+
 def pickSourceFilenames(source_dir, modules):
     """ Pick the names for the C files of each module.
 
@@ -324,9 +382,10 @@ def makeSourceDirectory(main_module):
             general.warning("Not recursing to unused '%s'." % any_case_module)
 
     # Prepare code generation, i.e. execute finalization for it.
-    for module in ModuleRegistry.getDoneModules():
-        if module.isCompiledPythonModule():
-            Finalization.prepareCodeGeneration(module)
+    with withPhaseReport("finalization"):
+        for module in ModuleRegistry.getDoneModules():
+            if module.isCompiledPythonModule():
+                Finalization.prepareCodeGeneration(module)
 
     # Pick filenames.
     source_dir = OutputDirectories.getSourceDirectoryPath()
@@ -344,12 +403,20 @@ def makeSourceDirectory(main_module):
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
+            if ModuleCodeCache.isCodeCacheEnabled():
+                prepare_module_code = ModuleCodeCache.prepareModuleCodeCached
+            else:
+                prepare_module_code = CodeGeneration.prepareModuleCode
+
             try:
-                prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
-                    global_context=global_context,
-                    module=module,
-                    module_name=module.getFullName(),
-                )
+                with withPhaseReport(
+                    "c_generation", module_name=str(module.getFullName())
+                ):
+                    prepared_modules[c_filename] = prepare_module_code(
+                        global_context=global_context,
+                        module=module,
+                        module_name=module.getFullName(),
+                    )
             except Exception:
                 general.warning("Problem creating code for module %r." % module)
                 raise
@@ -400,10 +467,13 @@ def makeSourceDirectory(main_module):
         else:
             assert False, module
 
-    writeSourceCode(
-        filename=os.path.join(source_dir, "__constants.c"),
-        source_code=ConstantCodes.getConstantsDefinitionCode(context=global_context),
-    )
+    with withPhaseReport("constants_blob"):
+        writeSourceCode(
+            filename=os.path.join(source_dir, "__constants.c"),
+            source_code=ConstantCodes.getConstantsDefinitionCode(
+                context=global_context
+            ),
+        )
 
     helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode(
         ModuleRegistry.getDoneUserModules()
@@ -518,6 +588,12 @@ def runScons(main_module, quiet):
     if Options.isProfile():
         options["profile_mode"] = "true"
 
+    if Options.isProfileNative():
+        options["profile_native_mode"] = "true"
+
+    if Options.isFreelistStats():
+        options["freelist_stats_mode"] = "true"
+
     if "no_warnings" in getPythonFlags():
         options["no_python_warnings"] = "true"
 
@@ -553,6 +629,10 @@ def runScons(main_module, quiet):
         options["abiflags"] = abiflags
 
     cpp_defines = Plugins.getPreprocessorSymbols()
+
+    for kind, count in sorted(Options.getFreelistLimits().items()):
+        cpp_defines["MAX_%s_FREE_LIST_COUNT" % kind.upper()] = str(count)
+
     if cpp_defines:
         options["cpp_defines"] = ",".join(
             "%s%s%s" % (key, "=" if value else "", value or "")
@@ -563,29 +643,61 @@ def runScons(main_module, quiet):
     if link_libraries:
         options["link_libraries"] = ",".join(link_libraries)
 
+    if Options.shallUseNinja():
+        return NinjaInterface.runNinja(options, quiet), options
+
     return SconsInterface.runScons(options, quiet), options
 
 
-def writeSourceCode(filename, source_code):
+# Files written in this compilation.
+_written_filenames = set()
+
+
+def _checkWrittenFilename(filename):
     # Prevent accidental overwriting. When this happens the collision detection
     # or something else has failed.
-    assert not os.path.isfile(filename), filename
+    assert filename not in _written_filenames, filename
+    _written_filenames.add(filename)
+
+    # With the code cache or ninja, files from previous compilations are kept.
+    if not _shallKeepSourceFiles():
+        assert not os.path.isfile(filename), filename
+
+
+def _isUnchangedFile(filename, contents, mode):
+    # Not touching unchanged files, keeps their timestamp, so the C compiler
+    # will consider them up to date.
+    return (
+        _shallKeepSourceFiles()
+        and os.path.isfile(filename)
+        and getFileContents(filename, mode) == contents
+    )
+
+
+def writeSourceCode(filename, source_code):
+    _checkWrittenFilename(filename)
 
     if python_version >= 300:
-        with open(filename, "wb") as output_file:
-            output_file.write(source_code.encode("latin1"))
+        source_code = source_code.encode("latin1")
+        mode = "b"
     else:
-        with open(filename, "w") as output_file:
-            output_file.write(source_code)
+        mode = ""
+
+    if _isUnchangedFile(filename, source_code, "r" + mode):
+        return
+
+    with open(filename, "w" + mode) as output_file:
+        output_file.write(source_code)
 
 
 def writeBinaryData(filename, binary_data):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not os.path.isfile(filename), filename
+    _checkWrittenFilename(filename)
 
     assert type(binary_data) is bytes
 
+    if _isUnchangedFile(filename, binary_data, "rb"):
+        return
+
     with open(filename, "wb") as output_file:
         output_file.write(binary_data)
 
@@ -655,10 +767,14 @@ def compileTree(main_module):
             )
 
         if not isWin32Windows():
-            writeBinaryData(
-                filename=os.path.join(source_dir, "__constants.bin"),
-                binary_data=ConstantCodes.stream_data.getBytes(),
-            )
+            with withPhaseReport("constants_blob"):
+                writeBinaryData(
+                    filename=os.path.join(source_dir, "__constants.bin"),
+                    binary_data=ConstantCodes.stream_data.getBytes(),
+                )
+
+        if _shallKeepSourceFiles():
+            removeOutdatedSourceFiles(source_dir)
     else:
         source_dir = OutputDirectories.getSourceDirectoryPath()
 
@@ -682,7 +798,10 @@ def compileTree(main_module):
         return True, {}
 
     # Run the Scons to build things.
-    result, options = runScons(main_module=main_module, quiet=not Options.isShowScons())
+    with withPhaseReport("scons"):
+        result, options = runScons(
+            main_module=main_module, quiet=not Options.isShowScons()
+        )
 
     return result, options
 
@@ -744,18 +863,24 @@ def main():
         # XML output only.
         for module in ModuleRegistry.getDoneModules():
             dumpTreeXML(module)
+
+        writePhaseReport()
     else:
         # Make the actual compilation.
         result, options = compileTree(main_module=main_module)
 
         # Exit if compilation failed.
         if not result:
+            writePhaseReport()
+
             sys.exit(1)
 
         if Options.shallNotDoExecCCompilerCall():
             if Options.isShowMemory():
                 MemoryUsage.showMemoryTrace()
 
+            writePhaseReport()
+
             sys.exit(0)
 
         executePostProcessing(OutputDirectories.getResultFullpath())
@@ -821,6 +946,9 @@ __name__ = ...
                     }
                 )
 
+        # Before executing, which replaces the process.
+        writePhaseReport()
+
         # Execute the module immediately if option was given.
         if Options.shallExecuteImmediately():
             if Options.shallMakeModule():
@@ -26,6 +26,7 @@
 """
 
 import os
+from contextlib import contextmanager
 
 from nuitka.containers.oset import OrderedSet
 from nuitka.PythonVersions import python_version
@@ -43,6 +44,11 @@ done_modules = set()
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Module being restored from XML, not necessarily registered anywhere yet, and
+# the handler for its outlines.
+restoring_module = None
+restoring_outline_handler = None
+
 
 def addRootModule(module):
     root_modules.add(module)
@@ -174,12 +180,60 @@ def removeDoneModule(module):
     done_modules.remove(module)
 
 
+@contextmanager
+def withRestoringModule(module, outline_handler):
+    """ Context for restoring a module from XML.
+
+    Args:
+        module - module being restored, found by code name in this context
+        outline_handler - called with outline ID and node, when restored
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global restoring_module, restoring_outline_handler
+
+    old_restoring_module = restoring_module
+    old_restoring_outline_handler = restoring_outline_handler
+
+    restoring_module = module
+    restoring_outline_handler = outline_handler
+
+    try:
+        yield
+    finally:
+        restoring_module = old_restoring_module
+        restoring_outline_handler = old_restoring_outline_handler
+
+
+def onRestoredOutline(outline_id, outline):
+    restoring_outline_handler(outline_id, outline)
+
+
 def getModuleFromCodeName(code_name):
+    if restoring_module is not None and restoring_module.getCodeName() == code_name:
+        return restoring_module
+
     # TODO: We need something to just load modules.
     for module in root_modules:
         if module.getCodeName() == code_name:
             return module
 
+    for module in active_modules:
+        if module.getCodeName() == code_name:
+            return module
+
+    for module in done_modules:
+        if module.getCodeName() == code_name:
+            return module
+
+    # Restored module trees may reference helpers before the internal module
+    # got used for the first time.
+    if code_name == "__internal__":
+        from nuitka.tree.InternalModule import getInternalModule
+
+        return getInternalModule()
+
     assert False, code_name
 
 
@@ -440,6 +440,41 @@ debug_group.add_option(
 Enable vmprof based profiling of time spent. Defaults to off.""",
 )
 
+debug_group.add_option(
+    "--profile-native",
+    action="store_true",
+    dest="profile_native",
+    default=False,
+    help="""\
+Enable built-in profiling of calls and time spent in compiled functions. The
+created binary writes "nuitka-profile.pstats" at exit, or the file given in
+the "NUITKA_PROFILE_FILENAME" environment variable, for use with the "pstats"
+module. Defaults to off.""",
+)
+
+debug_group.add_option(
+    "--freelist-stats",
+    action="store_true",
+    dest="freelist_stats",
+    default=False,
+    help="""\
+Report usage statistics of the free lists of compiled objects, e.g. frames,
+to stderr at program exit. Use it to find values for "--freelist-limit".
+Defaults to off.""",
+)
+
+debug_group.add_option(
+    "--freelist-limit",
+    action="append",
+    dest="freelist_limits",
+    metavar="KIND=COUNT",
+    default=[],
+    help="""\
+Set the maximum number of objects kept in the free list of a kind of compiled
+objects, e.g. "frame=200". The kinds are listed by "--freelist-stats". Can be
+given multiple times. Default empty.""",
+)
+
 debug_group.add_option(
     "--graph",
     action="store_true",
@@ -449,6 +484,20 @@ debug_group.add_option(
 Create graph of optimization process. Defaults to off.""",
 )
 
+debug_group.add_option(
+    "--trace-optimization",
+    action="store",
+    dest="optimization_trace_filename",
+    metavar="TRACE_FILENAME",
+    default=None,
+    help="""\
+Write a timeline of the optimization to the given filename, in the Chrome
+trace event format, which e.g. Perfetto or "chrome://tracing" can display.
+It shows the micro passes of every module and the tags they emitted. The
+pre-optimization done by workers of "--experimental=parallel_optimization"
+is not recorded. Defaults to off.""",
+)
+
 debug_group.add_option(
     "--trace-execution",
     action="store_true",
@@ -501,30 +550,29 @@ debug_group.add_option(
     help=SUPPRESS_HELP,
 )
 
-if os.name == "nt":
-    debug_group.add_option(
-        "--disable-dll-dependency-cache",
-        action="store_true",
-        dest="no_dependency_cache",
-        default=False,
-        help="""\
-Disable the dependency walker cache. Will result in much longer times to create
-the distribution folder, but might be used in case the cache is suspect to cause
-errors.
+debug_group.add_option(
+    "--disable-dll-dependency-cache",
+    action="store_true",
+    dest="no_dependency_cache",
+    default=False,
+    help="""\
+Disable the DLL dependency cache of dependency walker or ldd. Will result in
+much longer times to create the distribution folder, but might be used in case
+the cache is suspect to cause errors.
 """,
-    )
+)
 
-    debug_group.add_option(
-        "--force-dll-dependency-cache-update",
-        action="store_true",
-        dest="update_dependency_cache",
-        default=False,
-        help="""\
-For an update of the dependency walker cache. Will result in much longer times
-to create the distribution folder, but might be used in case the cache is suspect
-to cause errors or known to need an update.
+debug_group.add_option(
+    "--force-dll-dependency-cache-update",
+    action="store_true",
+    dest="update_dependency_cache",
+    default=False,
+    help="""\
+For an update of the DLL dependency cache of dependency walker or ldd. Will
+result in much longer times to create the distribution folder, but might be
+used in case the cache is suspect to cause errors or known to need an update.
 """,
-    )
+)
 
 # This is for testing framework, "coverage.py" hates to loose the process. And
 # we can use it to make sure it's not done unknowingly.
@@ -597,6 +645,18 @@ Use link time optimizations if available and usable (gcc 4.6 and higher).
 Defaults to off.""",
 )
 
+c_compiler_group.add_option(
+    "--ninja",
+    action="store_true",
+    dest="ninja",
+    default=False,
+    help="""\
+Use ninja instead of Scons to build the C code, for gcc and clang on
+non-Windows only. Requires "ninja" in PATH. Files in the build directory
+are then kept, so rebuilds only compile what changed.
+Defaults to off.""",
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(parser, "Tracing features")
@@ -630,6 +690,17 @@ Defaults to off.""",
 )
 
 
+tracing_group.add_option(
+    "--report",
+    action="store",
+    dest="report_filename",
+    metavar="REPORT_FILENAME",
+    default=None,
+    help="""\
+Write a JSON report with wall time, CPU time and memory usage of each
+compilation phase to the given filename. Default is off.""",
+)
+
 tracing_group.add_option(
     "--show-modules",
     action="store_true",
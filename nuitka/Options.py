@@ -98,6 +98,12 @@ Error, '--nofollow-import-to' takes only module names, not directory path '%s'."
                 % no_case_module
             )
 
+    if shallUseNinja() and Utils.getOS() == "Windows":
+        sys.exit(
+            """\
+Error, the '--ninja' backend is not supported on Windows, use Scons there."""
+        )
+
     scons_python = getPythonPathForScons()
 
     if scons_python is not None and not os.path.exists(scons_python):
@@ -121,6 +127,23 @@ Error, icon path "%s" does not exist."""
                 % icon_path
             )
 
+    for freelist_limit in options.freelist_limits:
+        kind, _sep, count = freelist_limit.partition("=")
+
+        if not kind.replace("_", "").isalpha() or not count.isdigit():
+            sys.exit(
+                """\
+Error, '--freelist-limit' takes values like 'frame=200', not '%s'."""
+                % freelist_limit
+            )
+
+        if kind not in freelist_kinds:
+            sys.exit(
+                """\
+Error, '--freelist-limit' kind '%s' is unknown, use one of %s."""
+                % (kind, ", ".join("'%s'" % kind for kind in freelist_kinds))
+            )
+
     is_debug = isDebug()
     is_nondebug = not is_debug
     is_fullcompat = isFullCompat()
@@ -309,12 +332,61 @@ def isProfile():
     return options.profile
 
 
+def isProfileNative():
+    """ *bool* = "--profile-native"
+    """
+    return options.profile_native
+
+
+def isFreelistStats():
+    """ *bool* = "--freelist-stats"
+    """
+    return options.freelist_stats
+
+
+# The kinds of free lists, for which "--freelist-limit" can be given.
+freelist_kinds = (
+    "asyncgen",
+    "asyncgen_asend",
+    "asyncgen_athrow",
+    "asyncgen_value_wrapper",
+    "cell",
+    "coroutine",
+    "coroutine_aiter_wrapper",
+    "coroutine_wrapper",
+    "frame",
+    "function",
+    "generator",
+    "loader",
+    "method",
+    "traceback",
+)
+
+
+def getFreelistLimits():
+    """ *dict* = "--freelist-limit" values, kind to count
+    """
+    result = {}
+
+    for freelist_limit in options.freelist_limits:
+        kind, count = freelist_limit.split("=", 1)
+        result[kind] = int(count)
+
+    return result
+
+
 def shallCreateGraph():
     """ *bool* = "--graph"
     """
     return options.graph
 
 
+def getOptimizationTraceFilename():
+    """ *str* = "--trace-optimization", or None
+    """
+    return options.optimization_trace_filename
+
+
 def getOutputFilename():
     """ *str*, value of "-o"
     """
@@ -420,6 +492,12 @@ def isClang():
     return options.clang
 
 
+def shallUseNinja():
+    """ *bool* = "--ninja"
+    """
+    return options.ninja
+
+
 def isMingw64():
     """ *bool* = "--mingw64"
     """
@@ -456,6 +534,12 @@ def isShowMemory():
     return options is not None and options.show_memory
 
 
+def getReportFilename():
+    """ *str* = "--report", or None
+    """
+    return options.report_filename if options is not None else None
+
+
 def isShowInclusion():
     """ *bool* = "--show-modules"
     """
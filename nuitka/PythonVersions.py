@@ -99,24 +99,6 @@ def f():
         return e.message.replace("'f'", "'%s'")
 
 
-def getComplexCallSequenceErrorTemplate():
-    if not hasattr(getComplexCallSequenceErrorTemplate, "result"):
-        try:
-            # We are doing this on purpose, to get the exception.
-            # pylint: disable=  not-an-iterable,not-callable
-            f = None
-            f(*None)
-        except TypeError as e:
-            result = (
-                e.args[0].replace("NoneType object", "%s").replace("NoneType", "%s")
-            )
-            getComplexCallSequenceErrorTemplate.result = result
-        else:
-            sys.exit("Error, cannot detect expected error message.")
-
-    return getComplexCallSequenceErrorTemplate.result
-
-
 def needsSetLiteralReverseInsertion():
     try:
         value = eval("{1,1.0}.pop()")  # pylint: disable=eval-used
@@ -29,6 +29,9 @@ from nuitka.utils import InstanceCounters, Utils
 
 complete = False
 
+# Variables whose usage state changed, only tracked if a set is given.
+changed_usage_variables = None
+
 
 class Variable(object):
 
@@ -184,6 +187,11 @@ class Variable(object):
             elif trace.isUninitTrace() and owner is not self.owner:
                 writers.add(owner)
 
+        if changed_usage_variables is not None and (
+            writers != self.writers or users != self.users
+        ):
+            changed_usage_variables.add(self)
+
         self.writers = writers
         self.users = users
 
@@ -0,0 +1,868 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Ninja interface.
+
+Alternative to Scons for gcc and clang on non-Windows platforms. From the
+same options that are given to Scons, a "build.ninja" file is written to
+the build directory and "ninja" is run on it. The flags follow what the
+"SingleExe.scons" file does for these compilers.
+
+Ninja only looks at file modification times and the command lines used, and
+the header dependencies are taken from files written by the C compiler, so
+no-op and incremental rebuilds are fast.
+"""
+
+import os
+import platform
+import re
+import subprocess
+import sys
+
+from nuitka import Options, Tracing
+from nuitka.PythonVersions import python_version
+from nuitka.Tracing import ninja_logger
+from nuitka.utils import Execution, Utils
+from nuitka.utils.FileOperations import deleteFile, getFileContents, makePath
+
+if python_version < 300:
+    from pipes import quote as _quoteShell  # pylint: disable=I0021,deprecated-module
+else:
+    from shlex import quote as _quoteShell  # pylint: disable=I0021,no-name-in-module
+
+# Prefix of the progress lines of ninja, these are not shown in quiet mode.
+_ninja_status_prefix = "[ninja %f/%t] "
+
+
+def _getBoolOption(options, option_name):
+    return options.get(option_name, "false") == "true"
+
+
+def _getNinjaBinary():
+    # Fedora and others name it differently.
+    for candidate in ("ninja", "ninja-build"):
+        ninja_binary = Execution.getExecutablePath(candidate)
+
+        if ninja_binary is not None:
+            return ninja_binary
+
+    sys.exit(
+        "Error, the Ninja backend was requested, but 'ninja' is not found in PATH."
+    )
+
+
+def _getCcacheBinary():
+    """ Return ccache binary to use, if any.
+
+    The "NUITKA_CCACHE_BINARY" environment variable takes precedence over
+    one found in PATH.
+    """
+
+    if "NUITKA_CCACHE_BINARY" in os.environ:
+        candidate = os.environ["NUITKA_CCACHE_BINARY"]
+
+        if os.path.exists(candidate):
+            return candidate
+
+    return Execution.getExecutablePath("ccache")
+
+
+def _getCommandOutput(command):
+    """ Output of a command as str, or None if it cannot be run. """
+
+    with open(os.devnull, "w") as devnull:
+        try:
+            output = Execution.check_output(command, stderr=devnull)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    if str is not bytes:
+        output = output.decode("utf8", "replace")
+
+    return output
+
+
+def _getCompilerVersion(compiler):
+    """ Return the version of the gcc or clang compiler as a tuple of ints. """
+
+    output = _getCommandOutput([compiler, "-dumpversion"])
+
+    if output is None:
+        return None
+
+    match = re.search(r"[0-9]+(?:\.[0-9]+)*", output)
+
+    if match is None:
+        return None
+
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+def _isGccName(cc_name):
+    return "gcc" in cc_name or "g++" in cc_name or "gnu-cc" in cc_name
+
+
+def _getCompiler(clang_mode):
+    """ Find the C compiler to use, and its version.
+
+    Like for Scons, the "CC" environment variable is respected. Only C11
+    capable compilers are used, there is no fallback to C++ mode.
+    """
+
+    if "CC" in os.environ:
+        candidates = [os.path.expanduser(os.path.normpath(os.environ["CC"]))]
+    elif clang_mode:
+        candidates = ["clang"]
+    else:
+        candidates = [
+            "gcc",
+            "cc",
+            "gcc-6.5",
+            "gcc-6.3",
+            "gcc-6.1",
+            "gcc-5.5",
+            "gcc-5.3",
+            "gcc-5.1",
+        ]
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            compiler = candidate
+        else:
+            compiler = Execution.getExecutablePath(candidate)
+
+            if compiler is None:
+                continue
+
+        cc_name = os.path.basename(compiler)
+
+        # Could be e.g. "cc" pointing to clang.
+        if "clang" not in cc_name and not _isGccName(cc_name):
+            cc_name = os.path.basename(os.path.realpath(compiler))
+
+        gcc_version = _getCompilerVersion(compiler)
+
+        if "clang" in cc_name:
+            return compiler, cc_name, True, gcc_version
+
+        # Ignore gcc before gcc version 5, no C11 support.
+        if gcc_version is not None and gcc_version >= (5,):
+            return compiler, cc_name, False, gcc_version
+
+    sys.exit(
+        """\
+Error, the Ninja backend requires gcc 5 or higher or clang as a C compiler, \
+use Scons for others."""
+    )
+
+
+def _getPythonPrefix(python_prefix, python_version_str):
+    """ Find the Python installation to compile against.
+
+    For Nuitka, it generally is OK to break out of the virtualenv, and use
+    the original install, where the headers and libraries live.
+    """
+
+    # Some virtualenv, at least on macOS, have such handy links, pointing to
+    # the Python installation.
+    if os.path.islink(os.path.join(python_prefix, ".Python")):
+        python_prefix = os.path.normpath(
+            os.path.join(os.readlink(os.path.join(python_prefix, ".Python")), "..")
+        )
+
+    # Some virtualenv created by "venv" have library and include files outside
+    # of it.
+    if python_version >= 330 and os.path.exists(
+        os.path.join(python_prefix, "bin/activate")
+    ):
+        python_binary = os.path.realpath(os.path.join(python_prefix, "bin", "python"))
+
+        python_prefix = os.path.normpath(os.path.join(python_binary, "..", ".."))
+
+    # Some virtualenv contain the "orig-prefix.txt" as a textual link to the
+    # target.
+    candidate = os.path.join(
+        python_prefix, "lib/python%s/orig-prefix.txt" % python_version_str
+    )
+
+    if os.path.exists(candidate):
+        python_prefix = getFileContents(candidate)
+
+    return python_prefix
+
+
+def _detectHostMultiarch():
+    output = _getCommandOutput(["dpkg-architecture"])
+
+    if output is None:
+        return None
+
+    for line in output.splitlines():
+        line = line.strip()
+
+        if line.startswith("DEB_HOST_MULTIARCH="):
+            return line.split("=", 1)[1]
+
+    return None
+
+
+def _getLinkerArch():
+    """ Linker format of the running Python, to link the constants blob. """
+
+    if "linux" not in sys.platform:
+        return None
+
+    output = _getCommandOutput(["objdump", "-f", sys.executable])
+
+    if output is None:
+        return None
+
+    for line in output.splitlines():
+        if " file format " in line:
+            return line.split(" file format ")[-1].strip()
+
+    return None
+
+
+def _writeFileIfChanged(filename, contents):
+    # Not touching unchanged files, keeps their timestamp, so ninja will
+    # consider what depends on them up to date.
+    if os.path.isfile(filename) and getFileContents(filename) == contents:
+        return
+
+    with open(filename, "w") as output_file:
+        output_file.write(contents)
+
+
+def _writeConstantsDataSource(source_dir):
+    """ Provide the constants blob as C code, if it cannot be linked. """
+
+    constants_bin_filename = os.path.join(source_dir, "__constants.bin")
+    constants_data_filename = os.path.join(source_dir, "__constants_data.c")
+
+    with open(constants_bin_filename, "rb") as f:
+        content = bytearray(f.read())
+
+    lines = ["const unsigned char constant_bin[] =", "{"]
+
+    for count in range(0, len(content), 16):
+        lines.append(
+            "   "
+            + "".join(
+                " 0x%02x," % stream_byte for stream_byte in content[count : count + 16]
+            )
+        )
+
+    lines.append("};")
+
+    _writeFileIfChanged(constants_data_filename, "\n".join(lines) + "\n")
+
+
+def _makeCLiteral(value):
+    value = value.replace("\\", r"\\")
+    value = value.replace('"', r"\"")
+
+    return '"' + value + '"'
+
+
+def _writeBuildDefinitionsFile(source_dir, build_definitions):
+    _writeFileIfChanged(
+        os.path.join(source_dir, "build_definitions.h"),
+        "".join(
+            "#define %s %s\n" % (key, _makeCLiteral(value))
+            for key, value in sorted(build_definitions.items())
+        ),
+    )
+
+
+def _provideStaticSourceFile(source_dir, nuitka_src, filename):
+    """ Link a static C file of Nuitka into the build directory. """
+
+    source_file = os.path.join(nuitka_src, "static_src", filename)
+    target_file = os.path.join(source_dir, "static_src", filename)
+
+    makePath(os.path.dirname(target_file))
+
+    try:
+        link_target = os.readlink(target_file)
+
+        # If it's already a proper link, do nothing then.
+        if link_target == source_file:
+            return target_file
+
+        os.unlink(target_file)
+    except OSError:
+        # Broken links or files, remove them, so we can replace them.
+        try:
+            os.unlink(target_file)
+        except OSError:
+            pass
+
+    os.symlink(source_file, target_file)
+
+    return target_file
+
+
+def _discoverSourceFiles(source_dir, nuitka_src, module_mode):
+    result = []
+
+    # Nuitka created source files.
+    for dirname in (source_dir, os.path.join(source_dir, "plugins")):
+        if not os.path.isdir(dirname):
+            continue
+
+        for filename in sorted(os.listdir(dirname)):
+            if filename.endswith(".c") and filename.startswith(
+                ("module.", "__", "plugin.")
+            ):
+                result.append(os.path.join(dirname, filename))
+
+    static_filenames = []
+
+    # Main program, unless of course it's a Python module/package we build.
+    if not module_mode:
+        static_filenames.append("MainProgram.c")
+
+    # Compiled types.
+    static_filenames += [
+        "CompiledCellType.c",
+        "CompiledFunctionType.c",
+        "CompiledMethodType.c",
+        "CompiledGeneratorType.c",
+    ]
+
+    if python_version >= 350:
+        static_filenames.append("CompiledCoroutineType.c")
+    if python_version >= 360:
+        static_filenames.append("CompiledAsyncgenType.c")
+
+    static_filenames.append("CompiledFrameType.c")
+
+    # Helper codes.
+    static_filenames += [
+        "CompiledCodeHelpers.c",
+        "InspectPatcher.c",
+        "MetaPathBasedLoader.c",
+    ]
+
+    for static_filename in static_filenames:
+        result.append(
+            _provideStaticSourceFile(
+                source_dir=source_dir, nuitka_src=nuitka_src, filename=static_filename,
+            )
+        )
+
+    return result
+
+
+def _getBuildSettings(options, source_dir):
+    """ Compiler, flags, and libraries to use for the build.
+
+    This is what "SingleExe.scons" does for gcc and clang on non-Windows.
+    """
+
+    # Many options to consider, pylint: disable=too-many-branches,too-many-locals,too-many-statements
+
+    nuitka_src = options["nuitka_src"]
+    module_mode = _getBoolOption(options, "module_mode")
+    debug_mode = _getBoolOption(options, "debug_mode")
+    lto_mode = _getBoolOption(options, "lto_mode")
+    standalone_mode = _getBoolOption(options, "standalone_mode")
+    static_libpython = _getBoolOption(options, "static_libpython")
+    python_debug = _getBoolOption(options, "python_debug")
+    macosx_target = sys.platform == "darwin"
+    target_arch = options["target_arch"]
+
+    python_abi_version = options["python_version"] + options.get("abiflags", "")
+
+    # Clang compiler mode, forced on macOS and FreeBSD (excluding PowerPC).
+    clang_mode = _getBoolOption(options, "clang_mode")
+    if macosx_target or ("freebsd" in sys.platform and target_arch != "powerpc"):
+        clang_mode = True
+
+    compiler, cc_name, clang_mode, gcc_version = _getCompiler(clang_mode)
+
+    if Options.isShowScons():
+        ninja_logger.info(
+            "Using compiler '%s' (version %s)."
+            % (compiler, ".".join(str(part) for part in gcc_version or ()))
+        )
+
+    cc_flags = []
+    cpp_defines = []
+    cpp_path = []
+    link_flags = []
+    lib_path = []
+    libs = []
+
+    # Restrict visibility as much as possible, use C11, make it clear how to
+    # handle integer overflows, namely by wrapping around.
+    cc_flags += ["-fvisibility=hidden", "-std=c11", "-fwrapv"]
+
+    if clang_mode:
+        cc_flags += ["-w", "-fvisibility-inlines-hidden"]
+        cpp_defines.append("_XOPEN_SOURCE")
+
+        if debug_mode:
+            cc_flags.append("-Wunused-but-set-variable")
+    else:
+        # Save some memory for gcc by not tracing macro code locations at all.
+        if not debug_mode:
+            cc_flags.append("-ftrack-macro-expansion=0")
+
+        cc_flags.append("-fpartial-inlining")
+
+        if debug_mode:
+            cc_flags.append("-Wunused-but-set-variable")
+
+        if lto_mode:
+            cc_flags.append("-flto")
+            link_flags.append("-flto=%d" % Options.getJobLimit())
+
+            if debug_mode:
+                link_flags.append("-O2")
+
+            link_flags += ["-O3", "-fpartial-inlining", "-freorder-functions"]
+        elif static_libpython:
+            cc_flags.append("-fno-lto")
+            link_flags.append("-fno-lto")
+
+        # The var-tracking does not scale, disable it.
+        cc_flags.append("-fno-var-tracking")
+
+        # Avoid the static files appearing to be different files.
+        if gcc_version >= (8,):
+            cc_flags.append(
+                "--file-prefix-map=%s=%s"
+                % ("static_src", os.path.join(nuitka_src, "static_src"))
+            )
+
+    if not macosx_target:
+        link_flags += ["-z", "noexecstack"]
+
+    if debug_mode:
+        # Allow gcc/clang to point out all kinds of inconsistency to us by
+        # raising an error.
+        cc_flags += [
+            "-Wall",
+            "-Werror",
+            "-Wno-error=strict-aliasing",
+            "-Wno-strict-aliasing",
+            "-Wno-error=format",
+            "-Wno-format",
+        ]
+
+        if not clang_mode and gcc_version >= (6,):
+            cc_flags.append("-Wno-misleading-indentation")
+
+    if _getBoolOption(options, "full_compat"):
+        cpp_defines.append("_NUITKA_FULL_COMPAT")
+
+    for experiment in options["experimental"].split(","):
+        if experiment:
+            cpp_defines.append("_NUITKA_EXPERIMENTAL_" + experiment.upper())
+
+    for option_name, define_name in (
+        ("profile_mode", "_NUITKA_PROFILE"),
+        ("profile_native_mode", "_NUITKA_PROFILE_NATIVE"),
+        ("freelist_stats_mode", "_NUITKA_FREELIST_STATS"),
+        ("trace_mode", "_NUITKA_TRACE"),
+        ("standalone_mode", "_NUITKA_STANDALONE"),
+        ("no_python_warnings", "_NUITKA_NO_PYTHON_WARNINGS"),
+    ):
+        if _getBoolOption(options, option_name):
+            cpp_defines.append(define_name)
+
+    if standalone_mode and "linux" in sys.platform:
+        libs.append("dl")
+
+    libs.append("m")
+
+    sysflags = [
+        ("python_sysflag_bytes_warning", "_NUITKA_SYSFLAG_BYTES_WARNING"),
+        ("python_sysflag_no_site", "_NUITKA_SYSFLAG_NO_SITE"),
+        ("python_sysflag_verbose", "_NUITKA_SYSFLAG_VERBOSE"),
+        ("python_sysflag_utf8", "_NUITKA_SYSFLAG_UTF8"),
+        ("python_sysflag_optimize", "_NUITKA_SYSFLAG_OPTIMIZE"),
+        ("python_sysflag_no_randomization", "_NUITKA_SYSFLAG_NO_RANDOMIZATION"),
+    ]
+
+    if python_version < 300:
+        sysflags = [
+            ("python_sysflag_py3k_warning", "_NUITKA_SYSFLAG_PY3K_WARNING"),
+            ("python_sysflag_division_warning", "_NUITKA_SYSFLAG_DIVISION_WARNING"),
+            ("python_sysflag_unicode", "_NUITKA_SYSFLAG_UNICODE"),
+        ] + sysflags
+
+    for option_name, define_name in sysflags:
+        cpp_defines.append(
+            "%s=%d" % (define_name, 1 if _getBoolOption(options, option_name) else 0)
+        )
+
+    if python_debug:
+        cpp_defines.append("Py_DEBUG")
+
+    if "linux" in sys.platform and 330 <= python_version < 340:
+        host_multiarch = _detectHostMultiarch()
+
+        if host_multiarch is not None:
+            cpp_path.append(
+                os.path.join(
+                    "/usr/include/", host_multiarch, "python" + python_abi_version
+                )
+            )
+
+    python_prefix = _getPythonPrefix(
+        python_prefix=options["python_prefix"],
+        python_version_str=options["python_version"],
+    )
+
+    python_header_path = os.path.join(
+        python_prefix, "include", "python" + python_abi_version
+    )
+
+    if not os.path.exists(os.path.join(python_header_path, "Python.h")):
+        sys.exit(
+            """\
+Error, no 'Python.h' %s headers can be found at '%s', dependency \
+not satisfied!"""
+            % ("debug" if python_debug else "development", python_header_path)
+        )
+
+    cpp_path.append(python_header_path)
+
+    if not module_mode:
+        # Add the python library path to the library path
+        python_lib_path = os.path.join(python_prefix, "lib")
+        lib_path.append(python_lib_path)
+
+        static_lib_filename = os.path.join(
+            python_lib_path, "libpython" + python_abi_version + ".a"
+        )
+
+        if static_libpython and os.path.exists(static_lib_filename):
+            libs.append(static_lib_filename)
+        elif (
+            python_debug
+            and python_prefix == "/usr"
+            and python_version < 300
+            and platform.dist()[  # pylint: disable=I0021,deprecated-method,no-member
+                0
+            ].lower()
+            in ("debian", "ubuntu")
+        ):
+            # Debian and Ubuntu distinguish the system libraries like this.
+            libs.append("python" + python_abi_version + "_d")
+        else:
+            libs.append("python" + python_abi_version)
+
+        if python_prefix != "/usr" and "linux" in sys.platform:
+            libs += ["dl", "pthread", "util", "rt", "m"]
+
+            if not clang_mode:
+                link_flags.append("-export-dynamic")
+
+        # For NetBSD the rpath is required, on FreeBSD it's warned as unused.
+        if "netbsd" in sys.platform:
+            link_flags.append("-rpath=" + python_lib_path)
+
+        # Set load libpython from binary directory default
+        if not macosx_target:
+            if standalone_mode:
+                rpath = "$ORIGIN"
+            else:
+                rpath = python_lib_path
+
+            link_flags.append("-Wl,-R,%s" % rpath)
+
+            # Without this, the rpath in the binary will be ignored by the
+            # loader of modern Linux.
+            if "linux" in sys.platform:
+                link_flags.append("-Wl,--disable-new-dtags")
+        else:
+            # For macOS we need to make sure install_name_tool can do its work
+            link_flags.append("-headerpad_max_install_names")
+    elif macosx_target:
+        link_flags += ["-undefined", "dynamic_lookup"]
+
+    nuitka_include = os.path.join(nuitka_src, "include")
+
+    if not os.path.exists(os.path.join(nuitka_include, "nuitka", "prelude.h")):
+        sys.exit(
+            "Error, cannot locate Nuitka includes at '%s', broken installation."
+            % nuitka_include
+        )
+
+    # We have include files in the build directory and the static include
+    # directory that is located inside Nuitka installation.
+    cpp_path += [".", nuitka_include, os.path.join(nuitka_src, "static_src")]
+
+    if debug_mode or _getBoolOption(options, "unstripped_mode"):
+        # Use debug format, so we get good tracebacks from it.
+        cc_flags.append("-g")
+
+        if not clang_mode:
+            cc_flags.append("-feliminate-unused-debug-types")
+    elif macosx_target:
+        link_flags.append("-Wno-deprecated-declarations")
+    elif not clang_mode:
+        link_flags.append("-s")
+
+    # When debugging, optimize less than when optimizing, when not remove
+    # assertions.
+    if debug_mode:
+        cc_flags.append("-O2")
+    else:
+        cc_flags.append("-O3")
+        cpp_defines.append("__NUITKA_NO_ASSERT__")
+
+    linker_arch = _getLinkerArch()
+    link_inputs = []
+
+    if linker_arch is not None:
+        # The C code of the constants blob may be left over from a previous
+        # build, and would be compiled then.
+        deleteFile(os.path.join(source_dir, "__constants_data.c"), must_exist=False)
+
+        link_inputs.append("__constants.bin")
+
+        link_flags += [
+            "-Wl,-b",
+            "-Wl,binary",
+            "-Wl,__constants.bin",
+            "-Wl,-b",
+            "-Wl,%s" % linker_arch,
+            "-Wl,-defsym",
+            "-Wl,constant_bin=_binary___constants_bin_start",
+        ]
+    else:
+        _writeConstantsDataSource(source_dir)
+
+    cpp_defines.append("_NUITKA_FROZEN=%d" % int(options.get("frozen_modules", 0)))
+
+    if module_mode:
+        cpp_defines.append("_NUITKA_MODULE")
+
+        cc_flags.append("-fPIC")
+        link_flags.append("-dynamiclib" if macosx_target else "-shared")
+    else:
+        cpp_defines.append("_NUITKA_EXE")
+
+    # Avoid IO for compilation as much as possible.
+    cc_flags.append("-pipe")
+
+    # Outside compiler and linker settings are respected.
+    cc_flags += os.environ.get("CPPFLAGS", "").split()
+    cc_flags += os.environ.get("CCFLAGS", "").split()
+    link_flags += os.environ.get("LDFLAGS", "").split()
+
+    # Plugin contributed C defines and link libraries should be used too.
+    cpp_defines += [
+        cpp_define
+        for cpp_define in options.get("cpp_defines", "").split(",")
+        if cpp_define
+    ]
+    libs += [
+        link_library
+        for link_library in options.get("link_libraries", "").split(",")
+        if link_library
+    ]
+
+    build_definitions = {}
+
+    if _getBoolOption(options, "uninstalled_python"):
+        build_definitions["PYTHON_HOME_PATH"] = python_prefix
+
+    _writeBuildDefinitionsFile(source_dir, build_definitions)
+
+    cc_command = [compiler]
+
+    ccache_binary = _getCcacheBinary()
+
+    if ccache_binary is not None:
+        if Options.isShowScons():
+            ninja_logger.info(
+                "Found ccache '%s' to cache object files." % ccache_binary
+            )
+
+        cc_command.insert(0, ccache_binary)
+
+    return {
+        "cc": cc_command,
+        "link": [compiler],
+        "cflags": cc_flags
+        + ["-D" + cpp_define for cpp_define in cpp_defines]
+        + ["-I" + path for path in cpp_path],
+        "ldflags": link_flags,
+        "link_inputs": link_inputs,
+        "libs": ["-L" + path for path in lib_path]
+        + [lib if os.path.isabs(lib) else "-l" + lib for lib in libs],
+    }
+
+
+def _escapePath(path):
+    return path.replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
+
+
+def _makeCommandValue(args):
+    return " ".join(_quoteShell(arg) for arg in args).replace("$", "$$")
+
+
+def _getNinjaFileContents(settings, source_files, result_filename):
+    lines = ["ninja_required_version = 1.3", ""]
+
+    for key in ("cc", "link", "cflags", "ldflags", "libs"):
+        lines.append("%s = %s" % (key, _makeCommandValue(settings[key])))
+
+    lines += [
+        "",
+        "rule cc",
+        "  command = $cc -MMD -MF $out.d -o $out -c $cflags $in",
+        "  depfile = $out.d",
+        "  deps = gcc",
+        "  description = CC $in",
+        "",
+        "rule link",
+        "  command = $link -o $out $ldflags @$out.rsp $libs",
+        "  rspfile = $out.rsp",
+        "  rspfile_content = $in",
+        "  description = LINK $out",
+        "",
+    ]
+
+    object_files = []
+
+    for source_file in source_files:
+        object_file = source_file[:-2] + ".o"
+        object_files.append(object_file)
+
+        lines.append(
+            "build %s: cc %s" % (_escapePath(object_file), _escapePath(source_file))
+        )
+
+    lines += [
+        "",
+        "build %s: link %s%s"
+        % (
+            _escapePath(result_filename),
+            " ".join(_escapePath(object_file) for object_file in object_files),
+            # The constants blob, if the linker adds it to the binary.
+            "".join(" | " + filename for filename in settings["link_inputs"]),
+        ),
+        "",
+        "default %s" % _escapePath(result_filename),
+        "",
+    ]
+
+    return "\n".join(lines)
+
+
+def _runNinja(ninja_command, quiet):
+    if not quiet:
+        return subprocess.call(ninja_command, shell=False) == 0
+
+    env = dict(os.environ)
+    env["NINJA_STATUS"] = _ninja_status_prefix
+
+    process = subprocess.Popen(
+        ninja_command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        shell=False,
+        env=env,
+    )
+
+    status_prefix = _ninja_status_prefix.split("%")[0].encode("ascii")
+
+    output = getattr(sys.stdout, "buffer", sys.stdout)
+
+    # Compiler messages and errors are still shown, just not the progress.
+    for line in iter(process.stdout.readline, b""):
+        if line.startswith(status_prefix):
+            continue
+
+        if line.startswith((b"ninja: Entering directory", b"ninja: no work to do")):
+            continue
+
+        output.write(line)
+
+    output.flush()
+
+    return process.wait() == 0
+
+
+def runNinja(options, quiet):
+    """ Build the result with ninja from the options prepared for Scons.
+
+    Returns:
+        bool - if the build was successful.
+    """
+
+    # The build is done inside the build directory, make the paths pointing
+    # elsewhere absolute.
+    options = dict(options)
+    options["nuitka_src"] = os.path.abspath(options["nuitka_src"])
+
+    source_dir = os.path.abspath(options["source_dir"])
+
+    if _getBoolOption(options, "module_mode"):
+        result_filename = options["result_name"] + Utils.getSharedLibrarySuffix()
+    else:
+        result_filename = options["result_exe"]
+
+    result_filename = os.path.abspath(result_filename)
+
+    ninja_binary = _getNinjaBinary()
+
+    old_cwd = os.getcwd()
+    os.chdir(source_dir)
+
+    try:
+        settings = _getBuildSettings(options=options, source_dir=".")
+
+        source_files = _discoverSourceFiles(
+            source_dir=".",
+            nuitka_src=options["nuitka_src"],
+            module_mode=_getBoolOption(options, "module_mode"),
+        )
+
+        _writeFileIfChanged(
+            "build.ninja",
+            _getNinjaFileContents(
+                settings=settings,
+                source_files=[os.path.normpath(filename) for filename in source_files],
+                result_filename=result_filename,
+            ),
+        )
+    finally:
+        os.chdir(old_cwd)
+
+    ninja_command = [
+        ninja_binary,
+        "-C",
+        source_dir,
+        "-j",
+        str(Options.getJobLimit()),
+    ]
+
+    if Options.isShowScons():
+        ninja_command.append("-v")
+
+        Tracing.printLine("Ninja command:", " ".join(ninja_command))
+
+    Tracing.flushStdout()
+    return _runNinja(ninja_command, quiet)
@@ -41,6 +41,64 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN(PyObject *name) {
     return result;
 }
 
+// Cache for module variable lookups, one per access in the generated code.
+struct Nuitka_ModuleVariableCache {
+#if PYTHON_VERSION >= 360
+    // Version tags of the dictionaries, when the value was looked up. For
+    // values from the module dictionary, the built-ins one is not relevant and
+    // zero, which is also never a valid tag.
+    uint64_t module_dict_version;
+    uint64_t builtins_dict_version;
+
+    // Borrowed, the dictionary holds it, as long as its version is the same.
+    PyObject *value;
+#else
+    // Dictionaries have no version tags, nothing can be cached.
+    char unused;
+#endif
+};
+
+// Lookup a module variable value, falling back to built-ins, returns a
+// borrowed reference or NULL without setting an exception.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED(PyDictObject *module_dict,
+                                                                       Nuitka_StringObject *var_name,
+                                                                       struct Nuitka_ModuleVariableCache *cache) {
+#if PYTHON_VERSION >= 360
+    if (likely(cache->module_dict_version == module_dict->ma_version_tag)) {
+        if (likely(cache->builtins_dict_version == 0 || cache->builtins_dict_version == dict_builtin->ma_version_tag)) {
+            CHECK_OBJECT(cache->value);
+            return cache->value;
+        }
+    }
+#endif
+
+    PyObject *result = GET_STRING_DICT_VALUE(module_dict, var_name);
+
+#if PYTHON_VERSION >= 360
+    uint64_t builtins_dict_version = 0;
+#endif
+
+    if (unlikely(result == NULL)) {
+        result = GET_STRING_DICT_VALUE(dict_builtin, var_name);
+
+        if (unlikely(result == NULL)) {
+            return NULL;
+        }
+
+#if PYTHON_VERSION >= 360
+        builtins_dict_version = dict_builtin->ma_version_tag;
+#endif
+    }
+
+#if PYTHON_VERSION >= 360
+    cache->module_dict_version = module_dict->ma_version_tag;
+    cache->builtins_dict_version = builtins_dict_version;
+    cache->value = result;
+#endif
+
+    return result;
+}
+
 extern void _initBuiltinModule();
 
 #define NUITKA_DECLARE_BUILTIN(name) extern PyObject *_python_original_builtin_value_##name;
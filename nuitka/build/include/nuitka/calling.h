@@ -20,6 +20,9 @@
 
 extern PyObject *const_tuple_empty;
 
+// Most arguments that are passed on the stack for calls.
+#define MAX_STACK_CALL_ARGS 64
+
 NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, PyObject *positional_args,
                                                     PyObject *named_args) {
     // Not allowed to enter with an error set. This often catches leaked errors from
@@ -61,6 +64,41 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, P
     }
 }
 
+#if PYTHON_VERSION >= 380
+// Call with PEP 590 vectorcall, avoids creating an argument tuple for built-in
+// functions and method descriptors. The "func" is the vectorcall slot value
+// of "function_object", the caller checked it's available.
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_VECTORCALL(PyObject *function_object, vectorcallfunc func,
+                                                               PyObject *const *args, size_t nargsf) {
+    assert(!ERROR_OCCURRED());
+
+    CHECK_OBJECT(function_object);
+    assert(func != NULL);
+
+    if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+        return NULL;
+    }
+
+    PyObject *result = func(function_object, args, nargsf, NULL);
+
+    Py_LeaveRecursiveCall();
+
+    if (result == NULL) {
+        if (unlikely(!ERROR_OCCURRED())) {
+            PyErr_Format(PyExc_SystemError, "NULL result without error in CALL_FUNCTION");
+        }
+
+        return NULL;
+    } else {
+        // Some buggy C functions do this, and Nuitka inner workings can get
+        // upset from it.
+        DROP_ERROR_OCCURRED();
+
+        return result;
+    }
+}
+#endif
+
 // Function call variant with no arguments provided at all.
 extern PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called);
 
@@ -83,4 +121,13 @@ extern PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attribute);
 // of args.
 extern PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg);
 
+// Complex call with star list and/or star dict argument, "f(a, *args, b=1, **kw)",
+// the positional args tuple, keywords dict and either star argument may be NULL.
+extern PyObject *CALL_FUNCTION_COMPLEX(PyObject *called, PyObject *pos_args, PyObject *star_arg_list, PyObject *kw,
+                                       PyObject *star_arg_dict);
+
+// Name and description of callables for use in error messages, e.g. "f" and "()".
+extern char const *GET_CALLABLE_NAME(PyObject *object);
+extern char const *GET_CALLABLE_DESC(PyObject *object);
+
 #endif
@@ -60,6 +60,33 @@ struct Nuitka_FrameObject {
     }                                                                                                                  \
     assert(((struct Nuitka_FrameObject *)cache_identifier)->m_type_description == NULL);
 
+// Frames of a function that are kept for reuse in recursive or re-entrant calls,
+// where the cached frame is still in use. The depth is bounded, deeper calls get
+// fresh frames.
+#define NUITKA_FRAME_POOL_SIZE 16
+
+struct Nuitka_FramePool {
+    // Frames below this are believed to be in use by outer calls.
+    int level;
+    struct Nuitka_FrameObject *frames[NUITKA_FRAME_POOL_SIZE];
+};
+
+extern struct Nuitka_FrameObject *MAKE_OR_REUSE_POOLED_FRAME_FUNC(struct Nuitka_FramePool *pool,
+                                                                  struct Nuitka_FrameObject *cache_frame,
+                                                                  PyCodeObject *code, PyObject *module,
+                                                                  Py_ssize_t locals_size);
+
+#define MAKE_OR_REUSE_POOLED_FRAME(cache_identifier, pool_identifier, code_identifier, module_identifier, locals_size) \
+    if (isFrameUnusable(cache_identifier)) {                                                                           \
+        cache_identifier = MAKE_OR_REUSE_POOLED_FRAME_FUNC(&pool_identifier, cache_identifier, code_identifier,        \
+                                                           module_identifier, locals_size);                            \
+    }                                                                                                                  \
+    assert(((struct Nuitka_FrameObject *)cache_identifier)->m_type_description == NULL);
+
+// Release a frame that was used for an exception, it cannot be reused anymore.
+extern void RELEASE_POOLED_FRAME(struct Nuitka_FrameObject **cache_frame, struct Nuitka_FramePool *pool,
+                                 struct Nuitka_FrameObject *frame);
+
 inline static void assertCodeObject(PyCodeObject *code_object) { CHECK_OBJECT((PyObject *)code_object); }
 
 NUITKA_MAY_BE_UNUSED static bool isFrameUnusable(struct Nuitka_FrameObject *frame_object) {
@@ -139,6 +166,17 @@ static inline void Nuitka_Frame_MarkAsNotExecuting(struct Nuitka_FrameObject *fr
 #endif
 
 // Put frame at the top of the frame stack and mark as executing.
+#if _NUITKA_PROFILE_NATIVE
+// Built-in profiling, counting calls and time of compiled frames.
+extern void Nuitka_Profile_EnterFrame(PyCodeObject *code);
+extern void Nuitka_Profile_LeaveFrame(PyCodeObject *code);
+
+// For suspending and resuming generators, coroutines and asyncgens.
+extern int Nuitka_Profile_GetDepth(void);
+extern void Nuitka_Profile_ResumeFrames(PyFrameObject *frame, PyFrameObject *resume_frame);
+extern void Nuitka_Profile_SuspendFrames(int depth);
+#endif
+
 NUITKA_MAY_BE_UNUSED inline static void pushFrameStack(struct Nuitka_FrameObject *frame_object) {
     // Make sure it's healthy.
     assertFrameObject(frame_object);
@@ -175,6 +213,10 @@ NUITKA_MAY_BE_UNUSED inline static void pushFrameStack(struct Nuitka_FrameObject
     Nuitka_Frame_MarkAsExecuting(frame_object);
     Py_INCREF(frame_object);
 
+#if _NUITKA_PROFILE_NATIVE
+    Nuitka_Profile_EnterFrame(frame_object->m_frame.f_code);
+#endif
+
 #if _DEBUG_FRAME
     printf("Now at top frame %s %s\n", Nuitka_String_AsString(PyObject_Str((PyObject *)tstate->frame)),
            Nuitka_String_AsString(PyObject_Repr((PyObject *)tstate->frame->f_code)));
@@ -191,6 +233,10 @@ NUITKA_MAY_BE_UNUSED inline static void popFrameStack(void) {
            Nuitka_String_AsString(PyObject_Repr((PyObject *)old->f_code)));
 #endif
 
+#if _NUITKA_PROFILE_NATIVE
+    Nuitka_Profile_LeaveFrame(old->f_code);
+#endif
+
     // Put previous frame on top.
     tstate->frame = old->f_back;
     old->f_back = NULL;
@@ -218,5 +264,8 @@ extern void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame);
 #define NUITKA_TYPE_DESCRIPTION_OBJECT 'o'
 #define NUITKA_TYPE_DESCRIPTION_OBJECT_PTR 'O'
 #define NUITKA_TYPE_DESCRIPTION_BOOL 'b'
+// Unboxed values are passed and stored as their object.
+#define NUITKA_TYPE_DESCRIPTION_ILONG 'L'
+#define NUITKA_TYPE_DESCRIPTION_IFLOAT 'F'
 
 #endif
@@ -130,4 +130,10 @@ extern PyObject *Nuitka_CallMethodFunctionPosArgs(struct Nuitka_FunctionObject c
 extern PyObject *Nuitka_CallMethodFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject *object,
                                                         PyObject **args, Py_ssize_t args_size, PyObject *kw);
 
+#if PYTHON_VERSION >= 380
+// This is also used by bound compiled methods, keyword values follow the arguments.
+extern PyObject *Nuitka_CallFunctionVectorcall(struct Nuitka_FunctionObject const *function, PyObject *const *args,
+                                               Py_ssize_t args_size, PyObject *const *kw_names, Py_ssize_t kw_size);
+#endif
+
 #endif
@@ -19,21 +19,66 @@
 #ifndef __NUITKA_FREELISTS_H__
 #define __NUITKA_FREELISTS_H__
 
+#if _NUITKA_FREELIST_STATS
+// Usage statistics of a free list, reported at program exit.
+struct Nuitka_FreeListStats {
+    char const *name;
+    char const *kind;
+    int limit;
+
+    int registered;
+
+    unsigned long hits;
+    unsigned long misses;
+    unsigned long resizes;
+    unsigned long releases;
+    unsigned long deletes;
+
+    int high_water;
+
+    struct Nuitka_FreeListStats *next;
+};
+
+extern void registerFreeListStats(struct Nuitka_FreeListStats *stats);
+
+// Declare the statistics of a free list, the kind is used to set its limit.
+#define NUITKA_FREE_LIST_STATS(free_list, kind, max_free_list_count)                                                   \
+    static struct Nuitka_FreeListStats free_list##_stats = {#free_list, #kind, max_free_list_count};
+
+#define countFreeListEvent(free_list, event)                                                                           \
+    if (unlikely(free_list##_stats.registered == 0)) {                                                                 \
+        registerFreeListStats(&free_list##_stats);                                                                     \
+    }                                                                                                                  \
+    free_list##_stats.event += 1;
+
+#define countFreeListHighWater(free_list, count)                                                                       \
+    if (count > free_list##_stats.high_water) {                                                                        \
+        free_list##_stats.high_water = count;                                                                          \
+    }
+#else
+#define NUITKA_FREE_LIST_STATS(free_list, kind, max_free_list_count)
+#define countFreeListEvent(free_list, event)
+#define countFreeListHighWater(free_list, count)
+#endif
+
 #define allocateFromFreeList(free_list, object_type, type_type, size)                                                  \
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        countFreeListEvent(free_list, hits);                                                                           \
                                                                                                                        \
         if (Py_SIZE(result) < size) {                                                                                  \
             result = PyObject_GC_Resize(object_type, result, size);                                                    \
             assert(result != NULL);                                                                                    \
+            countFreeListEvent(free_list, resizes);                                                                    \
         }                                                                                                              \
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
         result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
+        countFreeListEvent(free_list, misses);                                                                         \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
@@ -43,30 +88,85 @@
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        countFreeListEvent(free_list, hits);                                                                           \
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
         result = (object_type *)PyObject_GC_New(object_type, &type_type);                                              \
+        countFreeListEvent(free_list, misses);                                                                         \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
 #define releaseToFreeList(free_list, object, max_free_list_count)                                                      \
-    if (free_list != NULL) {                                                                                           \
-        if (free_list##_count > max_free_list_count) {                                                                 \
-            PyObject_GC_Del(object);                                                                                   \
-        } else {                                                                                                       \
-            *((void **)object) = (void *)free_list;                                                                    \
-            free_list = object;                                                                                        \
-                                                                                                                       \
-            free_list##_count += 1;                                                                                    \
-        }                                                                                                              \
+    if (free_list##_count >= max_free_list_count) {                                                                    \
+        PyObject_GC_Del(object);                                                                                       \
+        countFreeListEvent(free_list, deletes);                                                                        \
     } else {                                                                                                           \
-        free_list = object;                                                                                            \
-        *((void **)object) = NULL;                                                                                     \
+        assert(free_list != NULL || free_list##_count == 0);                                                           \
                                                                                                                        \
-        assert(free_list##_count == 0);                                                                                \
+        *((void **)object) = (void *)free_list;                                                                        \
+        free_list = object;                                                                                            \
                                                                                                                        \
         free_list##_count += 1;                                                                                        \
+        countFreeListEvent(free_list, releases);                                                                       \
+        countFreeListHighWater(free_list, free_list##_count);                                                          \
+    }
+
+// Free lists of variable size objects can be split into size classes, so that
+// reused objects rarely need a resize, and small objects do not hold on to the
+// memory of large ones. The smallest class is for 4 items, each next class for
+// twice as many, the last class takes all larger objects.
+#define NUITKA_FREE_LIST_SIZE_CLASSES 6
+
+// Get the size class for a size, and round the size up to the class size.
+NUITKA_MAY_BE_UNUSED static int getFreeListSizeClass(Py_ssize_t *size) {
+    int size_class = 0;
+    Py_ssize_t class_size = 4;
+
+    while (class_size < *size && size_class < NUITKA_FREE_LIST_SIZE_CLASSES - 1) {
+        class_size *= 2;
+        size_class += 1;
+    }
+
+    if (class_size > *size) {
+        *size = class_size;
+    }
+
+    return size_class;
+}
+
+#define allocateFromFreeListSized(free_list, size_class, object_type, type_type, size)                                 \
+    if (free_list[size_class] != NULL) {                                                                               \
+        result = free_list[size_class];                                                                                \
+        free_list[size_class] = *((object_type **)result);                                                             \
+        free_list##_count[size_class] -= 1;                                                                            \
+        assert(free_list##_count[size_class] >= 0);                                                                    \
+        countFreeListEvent(free_list, hits);                                                                           \
+                                                                                                                       \
+        if (Py_SIZE(result) < size) {                                                                                  \
+            result = PyObject_GC_Resize(object_type, result, size);                                                    \
+            assert(result != NULL);                                                                                    \
+            countFreeListEvent(free_list, resizes);                                                                    \
+        }                                                                                                              \
+                                                                                                                       \
+        _Py_NewReference((PyObject *)result);                                                                          \
+    } else {                                                                                                           \
+        result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
+        countFreeListEvent(free_list, misses);                                                                         \
+    }                                                                                                                  \
+    CHECK_OBJECT(result);
+
+#define releaseToFreeListSized(free_list, size_class, object, max_free_list_count)                                     \
+    if (free_list##_count[size_class] >= max_free_list_count) {                                                        \
+        PyObject_GC_Del(object);                                                                                       \
+        countFreeListEvent(free_list, deletes);                                                                        \
+    } else {                                                                                                           \
+        *((void **)object) = (void *)free_list[size_class];                                                            \
+        free_list[size_class] = object;                                                                                \
+                                                                                                                       \
+        free_list##_count[size_class] += 1;                                                                            \
+        countFreeListEvent(free_list, releases);                                                                       \
+        countFreeListHighWater(free_list, free_list##_count[size_class]);                                              \
     }
 
 #endif
@@ -21,6 +21,31 @@
 // Attribute lookup except special slots below.
 extern PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name);
 
+// Cache for attribute lookups, one per access in the generated code. It is
+// valid only for the type and its version tag.
+struct Nuitka_AttributeLookupCache {
+    // Borrowed, only used for comparison.
+    PyTypeObject *type;
+    unsigned int type_version;
+
+    // Borrowed, the type holds it, as long as its version tag is the same.
+    PyObject *descr;
+    descrgetfunc func;
+    bool is_data_descr;
+
+    // Offset of a "__slots__" value in the object, zero if not one.
+    Py_ssize_t slot_offset;
+
+#if PYTHON_VERSION >= 360
+    // Index of the attribute in the instance dictionary keys, a guess only.
+    Py_ssize_t dict_index;
+#endif
+};
+
+// Attribute lookup with a cache, for use except special slots below.
+extern PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name,
+                                         struct Nuitka_AttributeLookupCache *cache);
+
 // Attribute lookup of attribute slot "__dict__".
 extern PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT(PyObject *source);
 
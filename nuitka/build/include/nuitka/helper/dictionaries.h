@@ -189,6 +189,17 @@ NUITKA_MAY_BE_UNUSED static void SET_DICT_ENTRY_VALUE(Nuitka_DictEntryHandle han
     *handle = value;
 }
 
+#if PYTHON_VERSION >= 360
+// Changes through entry handles bypass CPython, so the dictionary needs a new
+// version tag from us. These are taken from a range that CPython counting up
+// from zero will never reach, so they are unique too.
+extern uint64_t Nuitka_dict_version_tag_counter;
+
+static inline void UPDATE_DICT_VERSION_TAG(PyDictObject *dict) {
+    dict->ma_version_tag = ++Nuitka_dict_version_tag_counter;
+}
+#endif
+
 NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE(PyDictObject *dict, Nuitka_StringObject *key) {
     Nuitka_DictEntryHandle handle = GET_STRING_DICT_ENTRY(dict, key);
 
@@ -306,6 +317,9 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT0(PyDictObject *dict, Nuitka_
     if (likely(old != NULL)) {
         Py_INCREF(value);
         SET_DICT_ENTRY_VALUE(entry, value);
+#if PYTHON_VERSION >= 360
+        UPDATE_DICT_VERSION_TAG(dict);
+#endif
 
         CHECK_OBJECT(old);
 
@@ -338,6 +352,9 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT_INPLACE(PyDictObject *dict,
     // speculatively try the quickest access method.
     if (likely(old != NULL)) {
         SET_DICT_ENTRY_VALUE(entry, value);
+#if PYTHON_VERSION >= 360
+        UPDATE_DICT_VERSION_TAG(dict);
+#endif
     } else {
         DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
         Py_DECREF(value);
@@ -368,6 +385,9 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT1(PyDictObject *dict, Nuitka_
     // speculatively try the quickest access method.
     if (likely(old != NULL)) {
         SET_DICT_ENTRY_VALUE(entry, value);
+#if PYTHON_VERSION >= 360
+        UPDATE_DICT_VERSION_TAG(dict);
+#endif
 
         Py_DECREF(old);
     } else {
@@ -0,0 +1,114 @@
+//     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_FLOATS_H__
+#define __NUITKA_HELPER_FLOATS_H__
+
+// Unboxed float values, as used for local variables with a proven "float"
+// shape. The C value is used where possible, the object is only created when
+// needed. Float objects always convert, only values of float sub-classes are
+// held as object only.
+typedef enum {
+    NUITKA_IFLOAT_UNASSIGNED = 0,
+    NUITKA_IFLOAT_OBJECT_VALID = 1,
+    NUITKA_IFLOAT_VALUE_VALID = 2,
+    NUITKA_IFLOAT_BOTH_VALID = 3
+} nuitka_ifloat_validity;
+
+typedef struct {
+    nuitka_ifloat_validity validity;
+
+    PyObject *ifloat_object;
+    double ifloat_value;
+} nuitka_ifloat;
+
+NUITKA_MAY_BE_UNUSED static nuitka_ifloat const nuitka_ifloat_unassigned = {NUITKA_IFLOAT_UNASSIGNED, NULL, 0.0};
+
+NUITKA_MAY_BE_UNUSED static void ENFORCE_IFLOAT_OBJECT_VALUE(nuitka_ifloat *value) {
+    assert(value->validity != NUITKA_IFLOAT_UNASSIGNED);
+
+    if ((value->validity & NUITKA_IFLOAT_OBJECT_VALID) == 0) {
+        value->ifloat_object = PyFloat_FromDouble(value->ifloat_value);
+
+        value->validity = NUITKA_IFLOAT_BOTH_VALID;
+    }
+}
+
+// Get the object value, creating it if necessary, or NULL if unassigned, the
+// reference is borrowed from the value.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_IFLOAT_OBJECT(nuitka_ifloat *value) {
+    if (value->validity == NUITKA_IFLOAT_UNASSIGNED) {
+        return NULL;
+    }
+
+    ENFORCE_IFLOAT_OBJECT_VALUE(value);
+
+    return value->ifloat_object;
+}
+
+// Assign from an object, taking over the reference.
+NUITKA_MAY_BE_UNUSED static void SET_IFLOAT_FROM_OBJECT(nuitka_ifloat *value, PyObject *object) {
+    CHECK_OBJECT(object);
+
+    value->ifloat_object = object;
+
+    if (PyFloat_CheckExact(object)) {
+        value->ifloat_value = PyFloat_AS_DOUBLE(object);
+        value->validity = NUITKA_IFLOAT_BOTH_VALID;
+    } else {
+        value->validity = NUITKA_IFLOAT_OBJECT_VALID;
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void SET_IFLOAT_FROM_CDOUBLE(nuitka_ifloat *value, double c_value) {
+    value->ifloat_object = NULL;
+    value->ifloat_value = c_value;
+    value->validity = NUITKA_IFLOAT_VALUE_VALID;
+}
+
+// Copy a value, the target gets its own reference to the object if any.
+NUITKA_MAY_BE_UNUSED static void COPY_IFLOAT(nuitka_ifloat *target, nuitka_ifloat const *source) {
+    assert(source->validity != NUITKA_IFLOAT_UNASSIGNED);
+
+    *target = *source;
+
+    if ((target->validity & NUITKA_IFLOAT_OBJECT_VALID) != 0) {
+        Py_INCREF(target->ifloat_object);
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_IFLOAT(nuitka_ifloat *value) {
+    if ((value->validity & NUITKA_IFLOAT_OBJECT_VALID) != 0) {
+        CHECK_OBJECT(value->ifloat_object);
+        Py_DECREF(value->ifloat_object);
+    }
+
+    value->validity = NUITKA_IFLOAT_UNASSIGNED;
+}
+
+NUITKA_MAY_BE_UNUSED static bool CHECK_IF_TRUE_IFLOAT(nuitka_ifloat const *value) {
+    assert(value->validity != NUITKA_IFLOAT_UNASSIGNED);
+
+    if ((value->validity & NUITKA_IFLOAT_VALUE_VALID) != 0) {
+        return value->ifloat_value != 0.0;
+    } else {
+        // Float objects have no way to fail this.
+        return CHECK_IF_TRUE(value->ifloat_object) == 1;
+    }
+}
+
+#endif
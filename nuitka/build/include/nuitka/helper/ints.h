@@ -46,7 +46,9 @@ typedef struct {
     long long_value;
 } nuitka_long;
 
-#if PYTHON_VERSION < 300
+// Unboxed integer values, as used for local variables with a proven "int"
+// shape. The C value is used where possible, the object is only created when
+// needed, and values that do not fit into a C long are only held as object.
 typedef enum {
     NUITKA_ILONG_UNASSIGNED = 0,
     NUITKA_ILONG_OBJECT_VALID = 1,
@@ -61,16 +63,96 @@ typedef struct {
     long ilong_value;
 } nuitka_ilong;
 
+NUITKA_MAY_BE_UNUSED static nuitka_ilong const nuitka_ilong_unassigned = {NUITKA_ILONG_UNASSIGNED, NULL, 0};
+
+#if PYTHON_VERSION < 300
+#define NUITKA_ILONG_EXACT_CHECK(value) PyInt_CheckExact(value)
+#define NUITKA_ILONG_FROM_LONG(value) PyInt_FromLong(value)
+#else
+#define NUITKA_ILONG_EXACT_CHECK(value) PyLong_CheckExact(value)
+#define NUITKA_ILONG_FROM_LONG(value) PyLong_FromLong(value)
+#endif
+
 NUITKA_MAY_BE_UNUSED static void ENFORCE_ILONG_OBJECT_VALUE(nuitka_ilong *value) {
     assert(value->validity != NUITKA_ILONG_UNASSIGNED);
 
     if ((value->validity & NUITKA_ILONG_OBJECT_VALID) == 0) {
-        value->ilong_object = PyLong_FromLong(value->ilong_value);
+        value->ilong_object = NUITKA_ILONG_FROM_LONG(value->ilong_value);
 
         value->validity = NUITKA_ILONG_BOTH_VALID;
     }
 }
 
+// Get the object value, creating it if necessary, or NULL if unassigned, the
+// reference is borrowed from the value.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_ILONG_OBJECT(nuitka_ilong *value) {
+    if (value->validity == NUITKA_ILONG_UNASSIGNED) {
+        return NULL;
+    }
+
+    ENFORCE_ILONG_OBJECT_VALUE(value);
+
+    return value->ilong_object;
+}
+
+// Assign from an object, taking over the reference.
+NUITKA_MAY_BE_UNUSED static void SET_ILONG_FROM_OBJECT(nuitka_ilong *value, PyObject *object) {
+    CHECK_OBJECT(object);
+
+    value->ilong_object = object;
+    value->validity = NUITKA_ILONG_OBJECT_VALID;
+
+    if (NUITKA_ILONG_EXACT_CHECK(object)) {
+#if PYTHON_VERSION < 300
+        value->ilong_value = PyInt_AS_LONG(object);
+        value->validity = NUITKA_ILONG_BOTH_VALID;
+#else
+        int overflow;
+        long c_value = PyLong_AsLongAndOverflow(object, &overflow);
+
+        if (overflow == 0) {
+            value->ilong_value = c_value;
+            value->validity = NUITKA_ILONG_BOTH_VALID;
+        }
 #endif
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void SET_ILONG_FROM_CLONG(nuitka_ilong *value, long c_value) {
+    value->ilong_object = NULL;
+    value->ilong_value = c_value;
+    value->validity = NUITKA_ILONG_VALUE_VALID;
+}
+
+// Copy a value, the target gets its own reference to the object if any.
+NUITKA_MAY_BE_UNUSED static void COPY_ILONG(nuitka_ilong *target, nuitka_ilong const *source) {
+    assert(source->validity != NUITKA_ILONG_UNASSIGNED);
+
+    *target = *source;
+
+    if ((target->validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+        Py_INCREF(target->ilong_object);
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_ILONG(nuitka_ilong *value) {
+    if ((value->validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+        CHECK_OBJECT(value->ilong_object);
+        Py_DECREF(value->ilong_object);
+    }
+
+    value->validity = NUITKA_ILONG_UNASSIGNED;
+}
+
+NUITKA_MAY_BE_UNUSED static bool CHECK_IF_TRUE_ILONG(nuitka_ilong const *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if ((value->validity & NUITKA_ILONG_VALUE_VALID) != 0) {
+        return value->ilong_value != 0;
+    } else {
+        // Integer objects have no way to fail this.
+        return CHECK_IF_TRUE(value->ilong_object) == 1;
+    }
+}
 
 #endif
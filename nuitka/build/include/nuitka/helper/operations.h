@@ -92,6 +92,9 @@ NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION(binary_api api, PyObject
 #include "nuitka/helper/operations_binary_matmult.h"
 #endif
 
+// Operations on unboxed values, these use the above as fallback.
+#include "nuitka/helper/operations_binary_unboxed.h"
+
 NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_INPLACE(binary_api api, PyObject **operand1, PyObject *operand2) {
     assert(operand1);
     CHECK_OBJECT(*operand1);
@@ -0,0 +1,187 @@
+//     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_OPERATIONS_UNBOXED_H__
+#define __NUITKA_HELPER_OPERATIONS_UNBOXED_H__
+
+/* Binary operations on unboxed "nuitka_ilong" and "nuitka_ifloat" values.
+ *
+ * These work on C values where both operands have them, and fall back to the
+ * object operation where that is not the case, or where the C operation would
+ * overflow. The result is assigned to a fresh value, which then owns the
+ * object if one was created. They return false on error, which can only
+ * happen for the object operation.
+ */
+
+NUITKA_MAY_BE_UNUSED static bool _BINARY_OPERATION_ILONG_OBJECT_FALLBACK(binary_api api, nuitka_ilong *result,
+                                                                          nuitka_ilong *operand1,
+                                                                          nuitka_ilong *operand2) {
+    ENFORCE_ILONG_OBJECT_VALUE(operand1);
+    ENFORCE_ILONG_OBJECT_VALUE(operand2);
+
+    PyObject *object = api(operand1->ilong_object, operand2->ilong_object);
+
+    if (unlikely(object == NULL)) {
+        result->validity = NUITKA_ILONG_UNASSIGNED;
+        return false;
+    }
+
+    SET_ILONG_FROM_OBJECT(result, object);
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_ILONG_ILONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                   nuitka_ilong *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0)) {
+        const long a = operand1->ilong_value;
+        const long b = operand2->ilong_value;
+
+        /* Same overflow check as CPython2 "int" does it. */
+        const long x = (long)((unsigned long)a + b);
+
+        if (likely((x ^ a) >= 0 || (x ^ b) >= 0)) {
+            SET_ILONG_FROM_CLONG(result, x);
+            return true;
+        }
+    }
+
+    return _BINARY_OPERATION_ILONG_OBJECT_FALLBACK(BINARY_OPERATION_ADD_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_ILONG_ILONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                   nuitka_ilong *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0)) {
+        const long a = operand1->ilong_value;
+        const long b = operand2->ilong_value;
+
+        /* Same overflow check as CPython2 "int" does it. */
+        const long x = (long)((unsigned long)a - b);
+
+        if (likely((x ^ a) >= 0 || (x ^ ~b) >= 0)) {
+            SET_ILONG_FROM_CLONG(result, x);
+            return true;
+        }
+    }
+
+    return _BINARY_OPERATION_ILONG_OBJECT_FALLBACK(BINARY_OPERATION_SUB_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_ILONG_ILONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                   nuitka_ilong *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0)) {
+        const long a = operand1->ilong_value;
+        const long b = operand2->ilong_value;
+
+        /* Same overflow check as CPython2 "int" does it. */
+        const long longprod = (long)((unsigned long)a * b);
+        const double doubleprod = (double)a * (double)b;
+        const double doubled_longprod = (double)longprod;
+
+        if (likely(doubled_longprod == doubleprod)) {
+            SET_ILONG_FROM_CLONG(result, longprod);
+            return true;
+        }
+
+        const double diff = doubled_longprod - doubleprod;
+        const double absdiff = diff >= 0.0 ? diff : -diff;
+        const double absprod = doubleprod >= 0.0 ? doubleprod : -doubleprod;
+
+        if (likely(32.0 * absdiff <= absprod)) {
+            SET_ILONG_FROM_CLONG(result, longprod);
+            return true;
+        }
+    }
+
+    return _BINARY_OPERATION_ILONG_OBJECT_FALLBACK(BINARY_OPERATION_MUL_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(binary_api api, nuitka_ifloat *result,
+                                                                           nuitka_ifloat *operand1,
+                                                                           nuitka_ifloat *operand2) {
+    ENFORCE_IFLOAT_OBJECT_VALUE(operand1);
+    ENFORCE_IFLOAT_OBJECT_VALUE(operand2);
+
+    PyObject *object = api(operand1->ifloat_object, operand2->ifloat_object);
+
+    if (unlikely(object == NULL)) {
+        result->validity = NUITKA_IFLOAT_UNASSIGNED;
+        return false;
+    }
+
+    SET_IFLOAT_FROM_OBJECT(result, object);
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_IFLOAT_IFLOAT(nuitka_ifloat *result, nuitka_ifloat *operand1,
+                                                                     nuitka_ifloat *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_IFLOAT_VALUE_VALID) != 0)) {
+        SET_IFLOAT_FROM_CDOUBLE(result, operand1->ifloat_value + operand2->ifloat_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(BINARY_OPERATION_ADD_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_IFLOAT_IFLOAT(nuitka_ifloat *result, nuitka_ifloat *operand1,
+                                                                     nuitka_ifloat *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_IFLOAT_VALUE_VALID) != 0)) {
+        SET_IFLOAT_FROM_CDOUBLE(result, operand1->ifloat_value - operand2->ifloat_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(BINARY_OPERATION_SUB_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_IFLOAT_IFLOAT(nuitka_ifloat *result, nuitka_ifloat *operand1,
+                                                                     nuitka_ifloat *operand2) {
+    if (likely((operand1->validity & operand2->validity & NUITKA_IFLOAT_VALUE_VALID) != 0)) {
+        SET_IFLOAT_FROM_CDOUBLE(result, operand1->ifloat_value * operand2->ifloat_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(BINARY_OPERATION_MUL_OBJECT_OBJECT, result, operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_TRUEDIV_IFLOAT_IFLOAT(nuitka_ifloat *result, nuitka_ifloat *operand1,
+                                                                         nuitka_ifloat *operand2) {
+    // Division by zero raises, leave that to the object operation.
+    if (likely((operand1->validity & operand2->validity & NUITKA_IFLOAT_VALUE_VALID) != 0 &&
+               operand2->ifloat_value != 0.0)) {
+        SET_IFLOAT_FROM_CDOUBLE(result, operand1->ifloat_value / operand2->ifloat_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(BINARY_OPERATION_TRUEDIV_OBJECT_OBJECT, result, operand1,
+                                                    operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_OLDDIV_IFLOAT_IFLOAT(nuitka_ifloat *result, nuitka_ifloat *operand1,
+                                                                        nuitka_ifloat *operand2) {
+    // Division by zero raises, leave that to the object operation.
+    if (likely((operand1->validity & operand2->validity & NUITKA_IFLOAT_VALUE_VALID) != 0 &&
+               operand2->ifloat_value != 0.0)) {
+        SET_IFLOAT_FROM_CDOUBLE(result, operand1->ifloat_value / operand2->ifloat_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_IFLOAT_OBJECT_FALLBACK(BINARY_OPERATION_OLDDIV_OBJECT_OBJECT, result, operand1,
+                                                    operand2);
+}
+#endif
+
+#endif
@@ -77,6 +77,10 @@ extern void startProfiling(void);
 extern void stopProfiling(void);
 #endif
 
+#if _NUITKA_PROFILE_NATIVE
+extern void startNativeProfiling(void);
+#endif
+
 #include "nuitka/helper/boolean.h"
 #include "nuitka/helper/dictionaries.h"
 #include "nuitka/helper/mappings.h"
@@ -120,6 +124,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *TO_FLOAT(PyObject *value) {
 
 #include "nuitka/helper/complex.h"
 
+#include "nuitka/helper/floats.h"
 #include "nuitka/helper/ints.h"
 
 NUITKA_MAY_BE_UNUSED static PyObject *TO_UNICODE3(PyObject *value, PyObject *encoding, PyObject *errors) {
@@ -350,6 +355,8 @@ extern PyObject *UNSTREAM_STRING_ASCII(unsigned char const *buffer, Py_ssize_t s
 #endif
 extern PyObject *UNSTREAM_FLOAT(unsigned char const *buffer);
 extern PyObject *UNSTREAM_BYTEARRAY(unsigned char const *buffer, Py_ssize_t size);
+extern void UNSTREAM_CONSTANTS_TABLE(unsigned char const *buffer, Py_ssize_t size, PyObject **table[],
+                                     Py_ssize_t count);
 
 // Performance enhancements to Python types.
 extern void enhancePythonTypes(void);
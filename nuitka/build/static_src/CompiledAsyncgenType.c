@@ -170,6 +170,11 @@ static PyObject *_Nuitka_Asyncgen_send(struct Nuitka_AsyncgenObject *asyncgen, P
         }
 #endif
 
+#if _NUITKA_PROFILE_NATIVE
+        int profile_depth = Nuitka_Profile_GetDepth();
+        PyFrameObject *profile_resume_frame = (PyFrameObject *)asyncgen->m_resume_frame;
+#endif
+
         if (asyncgen->m_resume_frame) {
             // It would be nice if our frame were still alive. Nobody had the
             // right to release it.
@@ -185,6 +190,14 @@ static PyObject *_Nuitka_Asyncgen_send(struct Nuitka_AsyncgenObject *asyncgen, P
         // Continue the yielder function while preventing recursion.
         asyncgen->m_running = true;
 
+#if _NUITKA_PROFILE_NATIVE
+        Nuitka_Profile_EnterFrame(asyncgen->m_code_object);
+
+        if (profile_resume_frame != NULL) {
+            Nuitka_Profile_ResumeFrames(&asyncgen->m_frame->m_frame, profile_resume_frame);
+        }
+#endif
+
         // Check for thrown exception, and publish it.
         if (unlikely(exception_type != NULL)) {
             assert(value == NULL);
@@ -219,6 +232,11 @@ static PyObject *_Nuitka_Asyncgen_send(struct Nuitka_AsyncgenObject *asyncgen, P
 
         asyncgen->m_running = false;
 
+#if _NUITKA_PROFILE_NATIVE
+        // Also leaves frames the asyncgen got suspended in.
+        Nuitka_Profile_SuspendFrames(profile_depth);
+#endif
+
         thread_state = PyThreadState_GET();
 
         // Remove the back frame from asyncgen if it's there.
@@ -579,9 +597,12 @@ static PyObject *Nuitka_Asyncgen_athrow(struct Nuitka_AsyncgenObject *asyncgen,
     return Nuitka_AsyncgenAthrow_New(asyncgen, args);
 }
 
+#ifndef MAX_ASYNCGEN_FREE_LIST_COUNT
 #define MAX_ASYNCGEN_FREE_LIST_COUNT 100
-static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
-static int free_list_asyncgens_count = 0;
+#endif
+static struct Nuitka_AsyncgenObject *free_list_asyncgens[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+static int free_list_asyncgens_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_FREE_LIST_STATS(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT)
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -645,7 +666,9 @@ static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
     Py_DECREF(asyncgen->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    Py_ssize_t size = Py_SIZE(asyncgen);
+    int size_class = getFreeListSizeClass(&size);
+    releaseToFreeListSized(free_list_asyncgens, size_class, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -747,8 +770,12 @@ PyObject *Nuitka_Asyncgen_New(asyncgen_code code, PyObject *module, PyObject *na
     // TODO: Change the var part of the type to 1 maybe
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
+    // Free list to use, this also rounds up the size to the size class.
+    int size_class = getFreeListSizeClass(&full_size);
+
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_asyncgens, struct Nuitka_AsyncgenObject, Nuitka_Asyncgen_Type, full_size);
+    allocateFromFreeListSized(free_list_asyncgens, size_class, struct Nuitka_AsyncgenObject, Nuitka_Asyncgen_Type,
+                              full_size);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
@@ -814,15 +841,21 @@ struct Nuitka_AsyncgenWrappedValueObject {
     PyObject *m_value;
 };
 
+#ifndef MAX_ASYNCGEN_VALUE_WRAPPER_FREE_LIST_COUNT
+#define MAX_ASYNCGEN_VALUE_WRAPPER_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
 static int free_list_asyncgen_value_wrappers_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper,
+                       MAX_ASYNCGEN_VALUE_WRAPPER_FREE_LIST_COUNT)
 
 static void asyncgen_value_wrapper_tp_dealloc(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper) {
     Nuitka_GC_UnTrack((PyObject *)asyncgen_value_wrapper);
 
     Py_DECREF(asyncgen_value_wrapper->m_value);
 
-    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper,
+                      MAX_ASYNCGEN_VALUE_WRAPPER_FREE_LIST_COUNT);
 }
 
 static int asyncgen_value_wrapper_tp_traverse(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper,
@@ -976,8 +1009,12 @@ static PyObject *Nuitka_Asyncgen_unwrap_value(struct Nuitka_AsyncgenObject *asyn
     return result;
 }
 
+#ifndef MAX_ASYNCGEN_ASEND_FREE_LIST_COUNT
+#define MAX_ASYNCGEN_ASEND_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
 static int free_list_asyncgen_asends_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_ASEND_FREE_LIST_COUNT)
 
 static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *asyncgen_asend) {
     Nuitka_GC_UnTrack(asyncgen_asend);
@@ -985,7 +1022,7 @@ static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *a
     Py_DECREF(asyncgen_asend->m_gen);
     Py_DECREF(asyncgen_asend->m_sendval);
 
-    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_ASEND_FREE_LIST_COUNT);
 }
 
 static int Nuitka_AsyncgenAsend_tp_traverse(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, visitproc visit,
@@ -1198,8 +1235,12 @@ struct Nuitka_AsyncgenAthrowObject {
     AwaitableState m_state;
 };
 
+#ifndef MAX_ASYNCGEN_ATHROW_FREE_LIST_COUNT
+#define MAX_ASYNCGEN_ATHROW_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
 static int free_list_asyncgen_athrows_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_ATHROW_FREE_LIST_COUNT)
 
 static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow) {
     Nuitka_GC_UnTrack(asyncgen_athrow);
@@ -1207,7 +1248,7 @@ static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *as
     Py_DECREF(asyncgen_athrow->m_gen);
     Py_XDECREF(asyncgen_athrow->m_args);
 
-    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_ATHROW_FREE_LIST_COUNT);
 }
 
 static int Nuitka_AsyncgenAthrow_traverse(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow, visitproc visit,
@@ -20,9 +20,12 @@
 
 #include "nuitka/freelists.h"
 
+#ifndef MAX_CELL_FREE_LIST_COUNT
 #define MAX_CELL_FREE_LIST_COUNT 1000
+#endif
 static struct Nuitka_CellObject *free_list_cells = NULL;
 static int free_list_cells_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_cells, cell, MAX_CELL_FREE_LIST_COUNT)
 
 static void Nuitka_Cell_tp_dealloc(struct Nuitka_CellObject *cell) {
     Nuitka_GC_UnTrack(cell);
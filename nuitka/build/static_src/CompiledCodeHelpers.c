@@ -1091,6 +1091,26 @@ PyObject *UNSTREAM_BYTEARRAY(unsigned char const *buffer, Py_ssize_t size) {
     return result;
 }
 
+void UNSTREAM_CONSTANTS_TABLE(unsigned char const *buffer, Py_ssize_t size, PyObject **table[], Py_ssize_t count) {
+    // All values are in one marshal tuple, distribute them to the constants.
+    PyObject *values = PyMarshal_ReadObjectFromString((char *)buffer, size);
+    assert(!ERROR_OCCURRED());
+    CHECK_OBJECT(values);
+
+    assert(PyTuple_CheckExact(values));
+    assert(PyTuple_GET_SIZE(values) == count);
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *value = PyTuple_GET_ITEM(values, i);
+        CHECK_OBJECT(value);
+
+        Py_INCREF(value);
+        *table[i] = value;
+    }
+
+    Py_DECREF(values);
+}
+
 #if PYTHON_VERSION < 300
 
 static void set_slot(PyObject **slot, PyObject *value) {
@@ -1654,6 +1674,10 @@ PyObject *BUILTIN_SUM2(PyObject *sequence, PyObject *start) {
 }
 
 PyDictObject *dict_builtin = NULL;
+
+#if PYTHON_VERSION >= 360
+uint64_t Nuitka_dict_version_tag_counter = ((uint64_t)1) << 63;
+#endif
 PyModuleObject *builtin_module = NULL;
 
 static PyTypeObject Nuitka_BuiltinModule_Type = {
@@ -1984,6 +2008,7 @@ void _initBuiltinModule() {
 }
 
 #include "HelpersCalling.c"
+#include "HelpersCallingComplex.c"
 
 PyObject *MAKE_RELATIVE_PATH(PyObject *relative) {
     CHECK_OBJECT(relative);
@@ -2122,3 +2147,11 @@ void _initSlotIternext() {
 #if _NUITKA_PROFILE
 #include "HelpersProfiling.c"
 #endif
+
+#if _NUITKA_PROFILE_NATIVE
+#include "HelpersProfilingNative.c"
+#endif
+
+#if _NUITKA_FREELIST_STATS
+#include "HelpersFreeLists.c"
+#endif
@@ -271,6 +271,11 @@ static PyObject *_Nuitka_Coroutine_send(struct Nuitka_CoroutineObject *coroutine
         }
 #endif
 
+#if _NUITKA_PROFILE_NATIVE
+        int profile_depth = Nuitka_Profile_GetDepth();
+        PyFrameObject *profile_resume_frame = (PyFrameObject *)coroutine->m_resume_frame;
+#endif
+
         if (coroutine->m_resume_frame) {
             // It would be nice if our frame were still alive. Nobody had the
             // right to release it.
@@ -286,6 +291,14 @@ static PyObject *_Nuitka_Coroutine_send(struct Nuitka_CoroutineObject *coroutine
         // Continue the yielder function while preventing recursion.
         coroutine->m_running = true;
 
+#if _NUITKA_PROFILE_NATIVE
+        Nuitka_Profile_EnterFrame(coroutine->m_code_object);
+
+        if (profile_resume_frame != NULL) {
+            Nuitka_Profile_ResumeFrames(&coroutine->m_frame->m_frame, profile_resume_frame);
+        }
+#endif
+
         // Check for thrown exception.
         if (unlikely(exception_type)) {
             assert(value == NULL);
@@ -317,6 +330,11 @@ static PyObject *_Nuitka_Coroutine_send(struct Nuitka_CoroutineObject *coroutine
 
         coroutine->m_running = false;
 
+#if _NUITKA_PROFILE_NATIVE
+        // Also leaves frames the coroutine got suspended in.
+        Nuitka_Profile_SuspendFrames(profile_depth);
+#endif
+
         thread_state = PyThreadState_GET();
 
         // Remove the back frame from coroutine if it's there.
@@ -789,8 +807,12 @@ static long Nuitka_Coroutine_tp_traverse(PyObject *coroutine, visitproc visit, v
     return 0;
 }
 
+#ifndef MAX_COROUTINE_WRAPPER_FREE_LIST_COUNT
+#define MAX_COROUTINE_WRAPPER_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
 static int free_list_coro_wrappers_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_coro_wrappers, coroutine_wrapper, MAX_COROUTINE_WRAPPER_FREE_LIST_COUNT)
 
 static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine) {
 #if _DEBUG_COROUTINE
@@ -815,9 +837,12 @@ static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine
     return (PyObject *)result;
 }
 
+#ifndef MAX_COROUTINE_FREE_LIST_COUNT
 #define MAX_COROUTINE_FREE_LIST_COUNT 100
-static struct Nuitka_CoroutineObject *free_list_coros = NULL;
-static int free_list_coros_count = 0;
+#endif
+static struct Nuitka_CoroutineObject *free_list_coros[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+static int free_list_coros_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_FREE_LIST_STATS(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT)
 
 static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine) {
     // Revive temporarily.
@@ -856,7 +881,9 @@ static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine
     Py_DECREF(coroutine->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
+    Py_ssize_t size = Py_SIZE(coroutine);
+    int size_class = getFreeListSizeClass(&size);
+    releaseToFreeListSized(free_list_coros, size_class, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -951,7 +978,7 @@ static void Nuitka_CoroutineWrapper_tp_dealloc(struct Nuitka_CoroutineWrapperObj
     Py_DECREF(cw->m_coroutine);
     cw->m_coroutine = NULL;
 
-    releaseToFreeList(free_list_coro_wrappers, cw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coro_wrappers, cw, MAX_COROUTINE_WRAPPER_FREE_LIST_COUNT);
 }
 
 static PyObject *Nuitka_CoroutineWrapper_tp_iternext(struct Nuitka_CoroutineWrapperObject *cw) {
@@ -1064,8 +1091,12 @@ PyObject *Nuitka_Coroutine_New(coroutine_code code, PyObject *module, PyObject *
     // TODO: Change the var part of the type to 1 maybe
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
+    // Free list to use, this also rounds up the size to the size class.
+    int size_class = getFreeListSizeClass(&full_size);
+
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_coros, struct Nuitka_CoroutineObject, Nuitka_Coroutine_Type, full_size);
+    allocateFromFreeListSized(free_list_coros, size_class, struct Nuitka_CoroutineObject, Nuitka_Coroutine_Type,
+                              full_size);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
@@ -1277,8 +1308,13 @@ static int Nuitka_AIterWrapper_traverse(struct Nuitka_AIterWrapper *aw, visitpro
     return 0;
 }
 
+#ifndef MAX_COROUTINE_AITER_WRAPPER_FREE_LIST_COUNT
+#define MAX_COROUTINE_AITER_WRAPPER_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
 static int free_list_coroutine_aiter_wrappers_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_coroutine_aiter_wrappers, coroutine_aiter_wrapper,
+                       MAX_COROUTINE_AITER_WRAPPER_FREE_LIST_COUNT)
 
 static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Nuitka_GC_UnTrack((PyObject *)aw);
@@ -1286,7 +1322,7 @@ static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Py_DECREF(aw->aw_aiter);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw, MAX_COROUTINE_AITER_WRAPPER_FREE_LIST_COUNT);
 }
 
 static PyAsyncMethods Nuitka_AIterWrapper_as_async = {
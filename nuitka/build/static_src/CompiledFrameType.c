@@ -137,7 +137,9 @@ static PyObject *Nuitka_Frame_getlocals(struct Nuitka_FrameObject *frame, void *
         while (*w != 0) {
             switch (*w) {
             case NUITKA_TYPE_DESCRIPTION_OBJECT:
-            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR: {
+            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+            case NUITKA_TYPE_DESCRIPTION_ILONG:
+            case NUITKA_TYPE_DESCRIPTION_IFLOAT: {
                 PyObject *value = *(PyObject **)t;
 
                 if (value != NULL) {
@@ -270,7 +272,9 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
         while (*w != 0) {
             switch (*w) {
             case NUITKA_TYPE_DESCRIPTION_OBJECT:
-            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR: {
+            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+            case NUITKA_TYPE_DESCRIPTION_ILONG:
+            case NUITKA_TYPE_DESCRIPTION_IFLOAT: {
                 PyObject *value = *(PyObject **)t;
                 Py_XDECREF(value);
 
@@ -309,9 +313,12 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
 
 void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame) { Nuitka_Frame_tp_clear(frame); }
 
+#ifndef MAX_FRAME_FREE_LIST_COUNT
 #define MAX_FRAME_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_FrameObject *free_list_frames = NULL;
 static int free_list_frames_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_frames, frame, MAX_FRAME_FREE_LIST_COUNT)
 
 static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -575,6 +582,64 @@ struct Nuitka_FrameObject *MAKE_FUNCTION_FRAME(PyCodeObject *code, PyObject *mod
     return MAKE_FRAME(code, module, false, locals_size);
 }
 
+struct Nuitka_FrameObject *MAKE_OR_REUSE_POOLED_FRAME_FUNC(struct Nuitka_FramePool *pool,
+                                                           struct Nuitka_FrameObject *cache_frame, PyCodeObject *code,
+                                                           PyObject *module, Py_ssize_t locals_size) {
+    // Only frames of outer calls are pooled, others are referenced from elsewhere,
+    // e.g. a traceback, and not likely to become usable soon.
+    if (cache_frame == NULL || cache_frame->m_frame.f_back == NULL) {
+        Py_XDECREF(cache_frame);
+        return MAKE_FUNCTION_FRAME(code, module, locals_size);
+    }
+
+    // Outer calls that returned since, made their frames usable again.
+    while (pool->level > 0 &&
+           (pool->frames[pool->level - 1] == NULL || !isFrameUnusable(pool->frames[pool->level - 1]))) {
+        pool->level -= 1;
+    }
+
+    // Deeper than the pool goes, do not keep the frame.
+    if (pool->level == NUITKA_FRAME_POOL_SIZE) {
+        Py_DECREF(cache_frame);
+        return MAKE_FUNCTION_FRAME(code, module, locals_size);
+    }
+
+    // Swap the frame in use with the one used the last time at this depth.
+    struct Nuitka_FrameObject *result = pool->frames[pool->level];
+    pool->frames[pool->level] = cache_frame;
+    pool->level += 1;
+
+    if (result != NULL && isFrameUnusable(result)) {
+        Py_DECREF(result);
+        result = NULL;
+    }
+
+    if (result == NULL) {
+        result = MAKE_FUNCTION_FRAME(code, module, locals_size);
+    }
+
+    return result;
+}
+
+void RELEASE_POOLED_FRAME(struct Nuitka_FrameObject **cache_frame, struct Nuitka_FramePool *pool,
+                          struct Nuitka_FrameObject *frame) {
+    if (frame == *cache_frame) {
+        Py_DECREF(frame);
+        *cache_frame = NULL;
+
+        return;
+    }
+
+    for (int i = 0; i < pool->level; i++) {
+        if (pool->frames[i] == frame) {
+            Py_DECREF(frame);
+            pool->frames[i] = NULL;
+
+            return;
+        }
+    }
+}
+
 extern PyObject *const_str_empty;
 extern PyObject *const_bytes_empty;
 
@@ -663,7 +728,9 @@ void Nuitka_Frame_AttachLocals(struct Nuitka_FrameObject *frame, char const *typ
 
     while (*w != 0) {
         switch (*w) {
-        case NUITKA_TYPE_DESCRIPTION_OBJECT: {
+        case NUITKA_TYPE_DESCRIPTION_OBJECT:
+        case NUITKA_TYPE_DESCRIPTION_ILONG:
+        case NUITKA_TYPE_DESCRIPTION_IFLOAT: {
             PyObject *value = va_arg(ap, PyObject *);
             memcpy(t, &value, sizeof(value));
             Py_XINCREF(value);
@@ -459,9 +459,12 @@ static PyObject *Nuitka_Function_reduce(struct Nuitka_FunctionObject *function)
     return result;
 }
 
+#ifndef MAX_FUNCTION_FREE_LIST_COUNT
 #define MAX_FUNCTION_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_FunctionObject *free_list_functions = NULL;
 static int free_list_functions_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT)
 
 static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -1965,16 +1968,29 @@ error_exit:
 
 PyObject *Nuitka_CallMethodFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject *object,
                                                  PyObject **args, Py_ssize_t args_size, PyObject *kw) {
-#ifdef _MSC_VER
-    PyObject **new_args = (PyObject **)_alloca(sizeof(PyObject *) * (args_size + 1));
-#else
-    PyObject *new_args[args_size + 1];
-#endif
+    // Large numbers of arguments are not put on the stack, but on the heap.
+    PyObject *stack_args[MAX_STACK_CALL_ARGS + 1];
+    PyObject **new_args = stack_args;
+
+    if (args_size > MAX_STACK_CALL_ARGS) {
+        new_args = (PyObject **)PyMem_Malloc(sizeof(PyObject *) * (args_size + 1));
+
+        if (unlikely(new_args == NULL)) {
+            return PyErr_NoMemory();
+        }
+    }
+
     new_args[0] = object;
     memcpy(new_args + 1, args, args_size * sizeof(PyObject *));
 
     // TODO: Specialize implementation for massive gains.
-    return Nuitka_CallFunctionPosArgsKwArgs(function, new_args, args_size + 1, kw);
+    PyObject *result = Nuitka_CallFunctionPosArgsKwArgs(function, new_args, args_size + 1, kw);
+
+    if (new_args != stack_args) {
+        PyMem_Free(new_args);
+    }
+
+    return result;
 }
 
 #if PYTHON_VERSION >= 380
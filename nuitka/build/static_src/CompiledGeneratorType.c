@@ -414,6 +414,11 @@ static PyObject *Nuitka_Generator_send2(struct Nuitka_GeneratorObject *generator
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
+#if _NUITKA_PROFILE_NATIVE
+        int profile_depth = Nuitka_Profile_GetDepth();
+        Nuitka_Profile_EnterFrame(generator->m_code_object);
+#endif
+
         // Check for thrown exception. TODO: Pass these the the entry point
         // maybe.
         if (unlikely(exception_type)) {
@@ -451,6 +456,11 @@ static PyObject *Nuitka_Generator_send2(struct Nuitka_GeneratorObject *generator
 
         generator->m_running = false;
 
+#if _NUITKA_PROFILE_NATIVE
+        // Also leaves frames the generator got suspended in.
+        Nuitka_Profile_SuspendFrames(profile_depth);
+#endif
+
         thread_state = PyThreadState_GET();
 
         // Remove the generator from the frame stack.
@@ -798,9 +808,12 @@ static void Nuitka_Generator_tp_finalizer(struct Nuitka_GeneratorObject *generat
 
 #endif
 
+#ifndef MAX_GENERATOR_FREE_LIST_COUNT
 #define MAX_GENERATOR_FREE_LIST_COUNT 100
-static struct Nuitka_GeneratorObject *free_list_generators = NULL;
-static int free_list_generators_count = 0;
+#endif
+static struct Nuitka_GeneratorObject *free_list_generators[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+static int free_list_generators_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_FREE_LIST_STATS(free_list_generators, generator, MAX_GENERATOR_FREE_LIST_COUNT)
 
 static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator) {
     // Revive temporarily.
@@ -850,7 +863,9 @@ static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator
 #endif
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_generators, generator, MAX_GENERATOR_FREE_LIST_COUNT);
+    Py_ssize_t size = Py_SIZE(generator);
+    int size_class = getFreeListSizeClass(&size);
+    releaseToFreeListSized(free_list_generators, size_class, generator, MAX_GENERATOR_FREE_LIST_COUNT);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -1040,8 +1055,12 @@ PyObject *Nuitka_Generator_New(generator_code code, PyObject *module, PyObject *
     // TODO: Change the var part of the type to 1 maybe
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
+    // Free list to use, this also rounds up the size to the size class.
+    int size_class = getFreeListSizeClass(&full_size);
+
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_generators, struct Nuitka_GeneratorObject, Nuitka_Generator_Type, full_size);
+    allocateFromFreeListSized(free_list_generators, size_class, struct Nuitka_GeneratorObject, Nuitka_Generator_Type,
+                              full_size);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
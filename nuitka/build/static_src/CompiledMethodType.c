@@ -137,9 +137,9 @@ static char const *GET_INSTANCE_CLASS_NAME(PyObject *instance) {
     return result;
 }
 
-static char const *GET_CALLABLE_DESC(PyObject *object) {
-    if (Nuitka_Function_Check(object) || Nuitka_Generator_Check(object) || PyMethod_Check(object) ||
-        PyFunction_Check(object) || PyCFunction_Check(object)) {
+char const *GET_CALLABLE_DESC(PyObject *object) {
+    if (Nuitka_Function_Check(object) || Nuitka_Generator_Check(object) || Nuitka_Method_Check(object) ||
+        PyMethod_Check(object) || PyFunction_Check(object) || PyCFunction_Check(object)) {
         return "()";
     }
 #if PYTHON_VERSION < 300
@@ -154,11 +154,15 @@ static char const *GET_CALLABLE_DESC(PyObject *object) {
     }
 }
 
-static char const *GET_CALLABLE_NAME(PyObject *object) {
+char const *GET_CALLABLE_NAME(PyObject *object) {
     if (Nuitka_Function_Check(object)) {
         return Nuitka_String_AsString(Nuitka_Function_GetName(object));
     } else if (Nuitka_Generator_Check(object)) {
         return Nuitka_String_AsString(Nuitka_Generator_GetName(object));
+    } else if (Nuitka_Method_Check(object)) {
+        struct Nuitka_FunctionObject *function = ((struct Nuitka_MethodObject *)object)->m_function;
+
+        return Nuitka_String_AsString(function->m_name);
     } else if (PyMethod_Check(object)) {
         return PyEval_GetFuncName(PyMethod_GET_FUNCTION(object));
     } else if (PyFunction_Check(object)) {
@@ -216,6 +220,68 @@ static PyObject *Nuitka_Method_tp_call(struct Nuitka_MethodObject *method, PyObj
     }
 }
 
+#if PYTHON_VERSION >= 380
+static PyObject *Nuitka_Method_tp_vectorcall(struct Nuitka_MethodObject *method, PyObject *const *stack, size_t nargsf,
+                                             PyObject *kwnames) {
+    // Unbound methods need the checks of the normal call.
+    if (unlikely(method->m_object == NULL)) {
+        return _PyObject_MakeTpCall((PyObject *)method, stack, PyVectorcall_NARGS(nargsf), kwnames);
+    }
+
+    assert(kwnames == NULL || PyTuple_CheckExact(kwnames));
+    Py_ssize_t nkwargs = (kwnames == NULL) ? 0 : PyTuple_GET_SIZE(kwnames);
+
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    assert(nargs >= 0);
+    assert((nargs == 0 && nkwargs == 0) || stack != NULL);
+
+    if (nkwargs == 0) {
+        return Nuitka_CallMethodFunctionPosArgs(method->m_function, method->m_object, (PyObject **)stack, nargs);
+    }
+
+    PyObject *const *kw_names = &PyTuple_GET_ITEM(kwnames, 0);
+
+    // The caller allows us to use the slot before the arguments for "self".
+    if (nargsf & PY_VECTORCALL_ARGUMENTS_OFFSET) {
+        PyObject **new_args = (PyObject **)stack - 1;
+
+        PyObject *old_arg = new_args[0];
+        new_args[0] = method->m_object;
+
+        PyObject *result = Nuitka_CallFunctionVectorcall(method->m_function, new_args, nargs + 1, kw_names, nkwargs);
+
+        new_args[0] = old_arg;
+
+        return result;
+    }
+
+    Py_ssize_t total_args = nargs + nkwargs;
+
+    // Large numbers of arguments are not put on the stack, but on the heap.
+    PyObject *stack_args[MAX_STACK_CALL_ARGS + 1];
+    PyObject **new_args = stack_args;
+
+    if (total_args > MAX_STACK_CALL_ARGS) {
+        new_args = (PyObject **)PyMem_Malloc(sizeof(PyObject *) * (total_args + 1));
+
+        if (unlikely(new_args == NULL)) {
+            return PyErr_NoMemory();
+        }
+    }
+
+    new_args[0] = method->m_object;
+    memcpy(new_args + 1, stack, total_args * sizeof(PyObject *));
+
+    PyObject *result = Nuitka_CallFunctionVectorcall(method->m_function, new_args, nargs + 1, kw_names, nkwargs);
+
+    if (new_args != stack_args) {
+        PyMem_Free(new_args);
+    }
+
+    return result;
+}
+#endif
+
 static PyObject *Nuitka_Method_tp_descr_get(struct Nuitka_MethodObject *method, PyObject *object, PyObject *klass) {
     // Don't rebind already bound methods.
     if (method->m_object != NULL) {
@@ -384,9 +450,12 @@ static long Nuitka_Method_tp_hash(struct Nuitka_MethodObject *method) {
     return method->m_function->m_counter;
 }
 
+#ifndef MAX_METHOD_FREE_LIST_COUNT
 #define MAX_METHOD_FREE_LIST_COUNT 100
+#endif
 static struct Nuitka_MethodObject *free_list_methods = NULL;
 static int free_list_methods_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_methods, method, MAX_METHOD_FREE_LIST_COUNT)
 
 static void Nuitka_Method_tp_dealloc(struct Nuitka_MethodObject *method) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -453,7 +522,11 @@ PyTypeObject Nuitka_Method_Type = {
     sizeof(struct Nuitka_MethodObject),
     0,
     (destructor)Nuitka_Method_tp_dealloc, /* tp_dealloc */
-    0,                                    /* tp_print   */
+#if PYTHON_VERSION < 380
+    0, /* tp_print */
+#else
+    offsetof(struct Nuitka_MethodObject, m_vectorcall), /* tp_vectorcall_offset */
+#endif
     0,                                    /* tp_getattr */
     0,                                    /* tp_setattr */
 #if PYTHON_VERSION < 300
@@ -474,6 +547,9 @@ PyTypeObject Nuitka_Method_Type = {
     Py_TPFLAGS_DEFAULT |                     /* tp_flags */
 #if PYTHON_VERSION < 300
         Py_TPFLAGS_HAVE_WEAKREFS |
+#endif
+#if PYTHON_VERSION >= 380
+        _Py_TPFLAGS_HAVE_VECTORCALL |
 #endif
         Py_TPFLAGS_HAVE_GC,
     0,                                                /* tp_doc */
@@ -539,6 +615,10 @@ PyObject *Nuitka_Method_New(struct Nuitka_FunctionObject *function, PyObject *ob
 
     result->m_weakrefs = NULL;
 
+#if PYTHON_VERSION >= 380
+    result->m_vectorcall = (vectorcallfunc)Nuitka_Method_tp_vectorcall;
+#endif
+
     Nuitka_GC_Track(result);
     return (PyObject *)result;
 }
@@ -235,6 +235,233 @@ PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
     }
 }
 
+#include "structmember.h"
+
+// Borrowed instance dictionary of an object, if it has one.
+static PyObject *_GET_INSTANCE_DICT(PyTypeObject *type, PyObject *source) {
+    Py_ssize_t dictoffset = type->tp_dictoffset;
+
+    if (dictoffset == 0) {
+        return NULL;
+    }
+
+    // Negative dictionary offsets have special meaning.
+    if (dictoffset < 0) {
+        Py_ssize_t tsize;
+        size_t size;
+
+        tsize = ((PyVarObject *)source)->ob_size;
+        if (tsize < 0)
+            tsize = -tsize;
+        size = _PyObject_VAR_SIZE(type, tsize);
+
+        dictoffset += (long)size;
+    }
+
+    PyObject **dictptr = (PyObject **)((char *)source + dictoffset);
+    return *dictptr;
+}
+
+#if PYTHON_VERSION >= 360
+// Lookup a string in a dictionary, first trying the index of the last lookup,
+// which is the same for all instances sharing the keys, or for dictionaries
+// built in the same order. Returns a borrowed reference.
+static PyObject *_GET_STRING_DICT_VALUE_INDEXED(PyDictObject *dict, PyObject *key, Py_ssize_t *index) {
+    PyDictKeysObject *keys = dict->ma_keys;
+    Py_ssize_t ix = *index;
+
+    if (ix >= 0 && ix < keys->dk_nentries) {
+        PyDictKeyEntry *entry = &DK_ENTRIES(keys)[ix];
+
+        // Constant attribute names are interned, so are the keys normally.
+        if (entry->me_key == key) {
+            if (_PyDict_HasSplitTable(dict)) {
+                return dict->ma_values[ix];
+            } else {
+                return entry->me_value;
+            }
+        }
+    }
+
+    Py_hash_t hash = ((PyASCIIObject *)key)->hash;
+
+    if (unlikely(hash == -1)) {
+        hash = PyUnicode_Type.tp_hash(key);
+    }
+
+#if PYTHON_VERSION < 370
+    PyObject **value_addr;
+
+    ix = keys->dk_lookup(dict, key, hash, &value_addr, NULL);
+    PyObject *result = ix >= 0 ? *value_addr : NULL;
+#else
+    PyObject *result;
+
+    ix = keys->dk_lookup(dict, key, hash, &result);
+#endif
+
+    if (ix < 0) {
+        // Errors from comparing with other keys are ignored, as with
+        // "PyDict_GetItem".
+        if (unlikely(ERROR_OCCURRED())) {
+            CLEAR_ERROR_OCCURRED();
+        }
+
+        return NULL;
+    }
+
+    *index = ix;
+
+    return result;
+}
+#endif
+
+PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name, struct Nuitka_AttributeLookupCache *cache) {
+    CHECK_OBJECT(source);
+    CHECK_OBJECT(attr_name);
+
+    PyTypeObject *type = Py_TYPE(source);
+
+    // Other lookups do not use the type dictionaries in a way we know.
+    if (type->tp_getattro != PyObject_GenericGetAttr) {
+        return LOOKUP_ATTRIBUTE(source, attr_name);
+    }
+
+    if (cache->type != type || cache->type_version != type->tp_version_tag ||
+        !PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+        // Unfortunately this is required, although of cause rarely necessary.
+        if (unlikely(type->tp_dict == NULL)) {
+            if (unlikely(PyType_Ready(type) < 0)) {
+                return NULL;
+            }
+        }
+
+        PyObject *descr = _PyType_Lookup(type, attr_name);
+
+        // The lookup assigns a version tag, if the type can have one at all.
+        if (unlikely(!PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG))) {
+            cache->type = NULL;
+
+            return LOOKUP_ATTRIBUTE(source, attr_name);
+        }
+
+        descrgetfunc func = NULL;
+
+        if (descr != NULL) {
+#if PYTHON_VERSION < 300
+            if (PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)) {
+#endif
+                func = Py_TYPE(descr)->tp_descr_get;
+#if PYTHON_VERSION < 300
+            }
+#endif
+        }
+
+        Py_ssize_t slot_offset = 0;
+
+        // Object values in "__slots__" are read directly, if the descriptor is
+        // not restricted and made for this type.
+        if (descr != NULL && Py_TYPE(descr) == &PyMemberDescr_Type) {
+            PyMemberDef *member = ((PyMemberDescrObject *)descr)->d_member;
+
+            if (member->type == T_OBJECT_EX && (member->flags & READ_RESTRICTED) == 0 &&
+                PyType_IsSubtype(type, ((PyDescrObject *)descr)->d_type)) {
+                slot_offset = member->offset;
+            }
+        }
+
+        cache->type = type;
+        cache->type_version = type->tp_version_tag;
+        cache->descr = descr;
+        cache->func = func;
+        cache->is_data_descr = func != NULL && PyDescr_IsData(descr);
+        cache->slot_offset = slot_offset;
+#if PYTHON_VERSION >= 360
+        cache->dict_index = -1;
+#endif
+    }
+
+    // Calls below may run code that changes the cache, so copy what we need.
+    PyObject *descr = cache->descr;
+    descrgetfunc func = cache->func;
+
+    if (cache->slot_offset != 0) {
+        PyObject *result = *(PyObject **)((char *)source + cache->slot_offset);
+
+        if (likely(result != NULL)) {
+            Py_INCREF(result);
+            return result;
+        }
+
+        // Let the descriptor raise the error for unassigned values.
+    }
+
+    if (cache->is_data_descr) {
+        Py_INCREF(descr);
+        PyObject *result = func(descr, source, (PyObject *)type);
+        Py_DECREF(descr);
+
+        return result;
+    }
+
+    // The dictionary lookup may run code that changes the cache and releases
+    // the descriptor, so hold a reference to it from here on.
+    Py_XINCREF(descr);
+
+    PyObject *dict = _GET_INSTANCE_DICT(type, source);
+
+    if (dict != NULL) {
+        CHECK_OBJECT(dict);
+
+        Py_INCREF(dict);
+
+        PyObject *result;
+
+#if PYTHON_VERSION >= 360
+        if (likely(PyDict_Check(dict) && PyUnicode_CheckExact(attr_name))) {
+            result = _GET_STRING_DICT_VALUE_INDEXED((PyDictObject *)dict, attr_name, &cache->dict_index);
+        } else {
+            result = PyDict_GetItem(dict, attr_name);
+        }
+#else
+        result = PyDict_GetItem(dict, attr_name);
+#endif
+
+        if (result != NULL) {
+            CHECK_OBJECT(result);
+
+            Py_INCREF(result);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+
+            return result;
+        }
+
+        Py_DECREF(dict);
+    }
+
+    if (func != NULL) {
+        PyObject *result = func(descr, source, (PyObject *)type);
+        Py_DECREF(descr);
+
+        return result;
+    }
+
+    if (descr != NULL) {
+        CHECK_OBJECT(descr);
+
+        return descr;
+    }
+
+#if PYTHON_VERSION < 300
+    PyErr_Format(PyExc_AttributeError, "'%.50s' object has no attribute '%.400s'", type->tp_name,
+                 PyString_AS_STRING(attr_name));
+#else
+    PyErr_Format(PyExc_AttributeError, "'%.50s' object has no attribute '%U'", type->tp_name, attr_name);
+#endif
+    return NULL;
+}
+
 PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT(PyObject *source) {
     CHECK_OBJECT(source);
 
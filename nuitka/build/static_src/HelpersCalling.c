@@ -237,6 +237,14 @@ PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
         return _fast_function_noargs(called);
     }
 
+#if PYTHON_VERSION >= 380
+    vectorcallfunc vector_call = _PyVectorcall_Function(called);
+
+    if (vector_call != NULL) {
+        return CALL_FUNCTION_VECTORCALL(called, vector_call, NULL, 0);
+    }
+#endif
+
     return CALL_FUNCTION(called, const_tuple_empty, NULL);
 }
 
@@ -509,6 +517,15 @@ PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg) {
     }
 
     PyObject *args[1] = {arg};
+
+#if PYTHON_VERSION >= 380
+    vectorcallfunc vector_call = _PyVectorcall_Function(called);
+
+    if (vector_call != NULL) {
+        return CALL_FUNCTION_VECTORCALL(called, vector_call, args, 1);
+    }
+#endif
+
     PyObject *pos_args = MAKE_TUPLE(args, 1);
 
     PyObject *result = CALL_FUNCTION(called, pos_args, NULL);
@@ -701,7 +718,19 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
                 Py_DECREF(descr);
 
                 return result;
-            } else {
+            }
+#if PYTHON_VERSION >= 380
+            else if (Py_TYPE(descr) == &PyMethodDescr_Type) {
+                // Method descriptors take the object as first argument, no
+                // need to create a bound method object.
+                PyObject *result = CALL_FUNCTION_VECTORCALL(descr, _PyVectorcall_Function(descr), &source, 1);
+
+                Py_DECREF(descr);
+
+                return result;
+            }
+#endif
+            else {
                 PyObject *called_object = func(descr, source, (PyObject *)type);
                 CHECK_OBJECT(called_object);
 
@@ -0,0 +1,396 @@
+//     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * Calls with star list and star dict arguments, "f(*args, **kw)" and friends.
+ *
+ * The star list argument is converted to a tuple, the star dict argument is
+ * converted to a dictionary or merged into the keyword arguments given, with
+ * the same checks and error messages as CPython. Calls of compiled functions
+ * and methods are then made without creating a joined arguments tuple.
+ */
+
+// This file is included from another C file, help IDEs to still parse it on
+// its own.
+#ifdef __IDE_ONLY__
+#include "nuitka/prelude.h"
+#endif
+
+// CPython 2.7.13 and 3.5.3 changed the error message, and stopped to mask
+// type errors raised while iterating the star list argument.
+#if PY_VERSION_HEX >= 0x03050300 || (PY_VERSION_HEX >= 0x02070D00 && PY_VERSION_HEX < 0x03000000)
+#define STAR_LIST_ERROR_MESSAGE "%s%s argument after * must be an iterable, not %s"
+#define STAR_LIST_ERROR_CHECK_FIRST 1
+#else
+#define STAR_LIST_ERROR_MESSAGE "%s%s argument after * must be a sequence, not %s"
+#define STAR_LIST_ERROR_CHECK_FIRST 0
+#endif
+
+static void formatStarListArgumentError(PyObject *called, PyObject *star_arg_list) {
+    PyErr_Format(PyExc_TypeError, STAR_LIST_ERROR_MESSAGE, GET_CALLABLE_NAME(called), GET_CALLABLE_DESC(called),
+                 Py_TYPE(star_arg_list)->tp_name);
+}
+
+static void formatStarDictArgumentError(PyObject *called, PyObject *star_arg_dict) {
+    PyErr_Format(PyExc_TypeError, "%s%s argument after ** must be a mapping, not %s", GET_CALLABLE_NAME(called),
+                 GET_CALLABLE_DESC(called), Py_TYPE(star_arg_dict)->tp_name);
+}
+
+static void formatDuplicateKeywordArgumentError(PyObject *called, PyObject *key) {
+    PyObject *key_str = PyObject_Str(key);
+
+    if (unlikely(key_str == NULL)) {
+        return;
+    }
+
+    PyErr_Format(PyExc_TypeError, "%s%s got multiple values for keyword argument '%s'", GET_CALLABLE_NAME(called),
+                 GET_CALLABLE_DESC(called), Nuitka_String_AsString(key_str));
+
+    Py_DECREF(key_str);
+}
+
+// Convert the star list argument to a tuple, returns a new reference.
+static PyObject *MAKE_STAR_LIST_TUPLE(PyObject *called, PyObject *star_arg_list) {
+    CHECK_OBJECT(star_arg_list);
+
+    if (PyTuple_CheckExact(star_arg_list)) {
+        Py_INCREF(star_arg_list);
+        return star_arg_list;
+    }
+
+#if STAR_LIST_ERROR_CHECK_FIRST
+    if (unlikely(Py_TYPE(star_arg_list)->tp_iter == NULL && !PySequence_Check(star_arg_list))) {
+        formatStarListArgumentError(called, star_arg_list);
+        return NULL;
+    }
+
+    return PySequence_Tuple(star_arg_list);
+#else
+    PyObject *result = PySequence_Tuple(star_arg_list);
+
+    if (unlikely(result == NULL)) {
+        if (EXCEPTION_MATCH_BOOL_SINGLE(GET_ERROR_OCCURRED(), PyExc_TypeError)) {
+            CLEAR_ERROR_OCCURRED();
+
+            formatStarListArgumentError(called, star_arg_list);
+        }
+    }
+
+    return result;
+#endif
+}
+
+// Add the items of a star dict argument that is not a dictionary, using its
+// "keys" method and subscript, optionally rejecting keys already present.
+static bool MERGE_STAR_DICT_MAPPING(PyObject *called, PyObject *target, PyObject *star_arg_dict,
+                                    bool check_duplicates) {
+    PyObject *keys = PyObject_CallMethod(star_arg_dict, (char *)"keys", NULL);
+
+    if (unlikely(keys == NULL)) {
+        if (EXCEPTION_MATCH_BOOL_SINGLE(GET_ERROR_OCCURRED(), PyExc_AttributeError)) {
+            CLEAR_ERROR_OCCURRED();
+
+            formatStarDictArgumentError(called, star_arg_dict);
+        }
+
+        return false;
+    }
+
+    PyObject *iter = MAKE_ITERATOR(keys);
+    Py_DECREF(keys);
+
+    if (unlikely(iter == NULL)) {
+        return false;
+    }
+
+    for (;;) {
+        PyObject *key = ITERATOR_NEXT(iter);
+
+        if (key == NULL) {
+            Py_DECREF(iter);
+
+            return CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED();
+        }
+
+        if (check_duplicates) {
+            int res = PyDict_Contains(target, key);
+
+            if (unlikely(res != 0)) {
+                if (res == 1) {
+                    formatDuplicateKeywordArgumentError(called, key);
+                }
+
+                Py_DECREF(key);
+                Py_DECREF(iter);
+
+                return false;
+            }
+        }
+
+        PyObject *value = PyObject_GetItem(star_arg_dict, key);
+
+        if (unlikely(value == NULL || !DICT_SET_ITEM(target, key, value))) {
+            Py_XDECREF(value);
+            Py_DECREF(key);
+            Py_DECREF(iter);
+
+            return false;
+        }
+
+        Py_DECREF(value);
+        Py_DECREF(key);
+    }
+}
+
+// Convert the star dict argument to a dictionary, returns a new reference.
+static PyObject *MAKE_STAR_DICT_DICTIONARY(PyObject *called, PyObject *star_arg_dict) {
+    CHECK_OBJECT(star_arg_dict);
+
+    if (PyDict_CheckExact(star_arg_dict)) {
+        Py_INCREF(star_arg_dict);
+        return star_arg_dict;
+    }
+
+    PyObject *result = PyDict_New();
+
+    if (unlikely(!MERGE_STAR_DICT_MAPPING(called, result, star_arg_dict, false))) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    return result;
+}
+
+// Merge the star dict argument into a copy of the keyword arguments dictionary,
+// returns a new reference.
+static PyObject *MERGE_STAR_DICT_KEYWORDS(PyObject *called, PyObject *kw, PyObject *star_arg_dict) {
+    CHECK_OBJECT(kw);
+    assert(PyDict_CheckExact(kw));
+    CHECK_OBJECT(star_arg_dict);
+
+    if (PyDict_CheckExact(star_arg_dict)) {
+        if (DICT_SIZE(star_arg_dict) == 0) {
+            Py_INCREF(kw);
+            return kw;
+        }
+
+        PyObject *result = PyDict_Copy(kw);
+
+        Py_ssize_t pos = 0;
+        PyObject *key, *value;
+
+        while (PyDict_Next(star_arg_dict, &pos, &key, &value)) {
+            int res = PyDict_Contains(result, key);
+
+            if (unlikely(res != 0)) {
+                if (res == 1) {
+                    formatDuplicateKeywordArgumentError(called, key);
+                }
+
+                Py_DECREF(result);
+                return NULL;
+            }
+
+            if (unlikely(!DICT_SET_ITEM(result, key, value))) {
+                Py_DECREF(result);
+                return NULL;
+            }
+        }
+
+        return result;
+    } else {
+        PyObject *result = PyDict_Copy(kw);
+
+        if (unlikely(!MERGE_STAR_DICT_MAPPING(called, result, star_arg_dict, true))) {
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        return result;
+    }
+}
+
+// Call with positional arguments from two tuples, without joining them into
+// one tuple for compiled functions and methods, and vectorcall.
+static PyObject *CALL_FUNCTION_WITH_TWO_TUPLES(PyObject *called, PyObject *pos_args, PyObject *star_arg_list,
+                                               PyObject *kw) {
+    Py_ssize_t pos_size = PyTuple_GET_SIZE(pos_args);
+    Py_ssize_t star_size = PyTuple_GET_SIZE(star_arg_list);
+    Py_ssize_t args_size = pos_size + star_size;
+
+    // Large star list arguments are not put on the stack, but passed as a tuple.
+    bool use_stack = args_size <= MAX_STACK_CALL_ARGS;
+
+    bool is_compiled =
+        use_stack && (Nuitka_Function_Check(called) ||
+                      (Nuitka_Method_Check(called) && ((struct Nuitka_MethodObject *)called)->m_object != NULL));
+
+#if PYTHON_VERSION >= 380
+    vectorcallfunc vector_call = (!use_stack || is_compiled || kw != NULL) ? NULL : _PyVectorcall_Function(called);
+
+    if (is_compiled || vector_call != NULL) {
+#else
+    if (is_compiled) {
+#endif
+        PyObject *args[MAX_STACK_CALL_ARGS];
+
+        memcpy(args, &PyTuple_GET_ITEM(pos_args, 0), pos_size * sizeof(PyObject *));
+        memcpy(args + pos_size, &PyTuple_GET_ITEM(star_arg_list, 0), star_size * sizeof(PyObject *));
+
+#if PYTHON_VERSION >= 380
+        if (vector_call != NULL) {
+            return CALL_FUNCTION_VECTORCALL(called, vector_call, args, args_size);
+        }
+#endif
+
+        if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+            return NULL;
+        }
+
+        PyObject *result;
+
+        if (Nuitka_Function_Check(called)) {
+            result = Nuitka_CallFunctionPosArgsKwArgs((struct Nuitka_FunctionObject *)called, args, args_size, kw);
+        } else {
+            struct Nuitka_MethodObject *method = (struct Nuitka_MethodObject *)called;
+
+            result = Nuitka_CallMethodFunctionPosArgsKwArgs(method->m_function, method->m_object, args, args_size, kw);
+        }
+
+        Py_LeaveRecursiveCall();
+
+        return result;
+    }
+
+    PyObject *args = PyTuple_New(args_size);
+
+    for (Py_ssize_t i = 0; i < pos_size; i++) {
+        PyObject *item = PyTuple_GET_ITEM(pos_args, i);
+        Py_INCREF(item);
+        PyTuple_SET_ITEM(args, i, item);
+    }
+
+    for (Py_ssize_t i = 0; i < star_size; i++) {
+        PyObject *item = PyTuple_GET_ITEM(star_arg_list, i);
+        Py_INCREF(item);
+        PyTuple_SET_ITEM(args, pos_size + i, item);
+    }
+
+    PyObject *result = CALL_FUNCTION(called, args, kw);
+
+    Py_DECREF(args);
+
+    return result;
+}
+
+PyObject *CALL_FUNCTION_COMPLEX(PyObject *called, PyObject *pos_args, PyObject *star_arg_list, PyObject *kw,
+                                PyObject *star_arg_dict) {
+    CHECK_OBJECT(called);
+    assert(pos_args == NULL || PyTuple_CheckExact(pos_args));
+    assert(kw == NULL || PyDict_CheckExact(kw));
+    assert(star_arg_list != NULL || star_arg_dict != NULL);
+
+    // The order of conversions follows CPython, so the same error is given
+    // if there are several problems.
+    PyObject *call_args = NULL;
+    PyObject *call_kw;
+
+#if PYTHON_VERSION >= 350
+    // With positional arguments, the star list argument is converted first.
+    if (star_arg_list != NULL && pos_args != NULL) {
+        call_args = MAKE_STAR_LIST_TUPLE(called, star_arg_list);
+
+        if (unlikely(call_args == NULL)) {
+            return NULL;
+        }
+    }
+#endif
+
+    if (star_arg_dict != NULL) {
+#if PYTHON_VERSION >= 350
+        if (kw != NULL) {
+            call_kw = MERGE_STAR_DICT_KEYWORDS(called, kw, star_arg_dict);
+        } else {
+            call_kw = MAKE_STAR_DICT_DICTIONARY(called, star_arg_dict);
+        }
+#else
+        call_kw = MAKE_STAR_DICT_DICTIONARY(called, star_arg_dict);
+#endif
+
+        if (unlikely(call_kw == NULL)) {
+            Py_XDECREF(call_args);
+            return NULL;
+        }
+    } else {
+        call_kw = kw;
+        Py_XINCREF(call_kw);
+    }
+
+    if (star_arg_list != NULL && call_args == NULL) {
+        call_args = MAKE_STAR_LIST_TUPLE(called, star_arg_list);
+
+        if (unlikely(call_args == NULL)) {
+            Py_XDECREF(call_kw);
+            return NULL;
+        }
+    }
+
+#if PYTHON_VERSION < 350
+    // Keyword arguments are merged last, after converting the star arguments.
+    if (star_arg_dict != NULL && kw != NULL) {
+        PyObject *merged_kw = MERGE_STAR_DICT_KEYWORDS(called, kw, call_kw);
+        Py_DECREF(call_kw);
+
+        if (unlikely(merged_kw == NULL)) {
+            Py_XDECREF(call_args);
+            return NULL;
+        }
+
+        call_kw = merged_kw;
+    }
+#endif
+
+    // Empty keyword arguments allow for faster calls.
+    if (call_kw != NULL && DICT_SIZE(call_kw) == 0) {
+        Py_DECREF(call_kw);
+        call_kw = NULL;
+    }
+
+    PyObject *result;
+
+    if (pos_args != NULL && call_args != NULL && PyTuple_GET_SIZE(pos_args) > 0 &&
+        PyTuple_GET_SIZE(call_args) > 0) {
+        result = CALL_FUNCTION_WITH_TWO_TUPLES(called, pos_args, call_args, call_kw);
+    } else {
+        PyObject *args;
+
+        if (call_args != NULL && PyTuple_GET_SIZE(call_args) > 0) {
+            args = call_args;
+        } else if (pos_args != NULL) {
+            args = pos_args;
+        } else {
+            args = const_tuple_empty;
+        }
+
+        result = CALL_FUNCTION(called, args, call_kw);
+    }
+
+    Py_XDECREF(call_args);
+    Py_XDECREF(call_kw);
+
+    return result;
+}
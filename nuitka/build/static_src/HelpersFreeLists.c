@@ -0,0 +1,58 @@
+//     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for the usage statistics of free lists.
+ *
+ * Free lists register themselves when first used, and at exit, the number of
+ * allocations served from them (hits) or not (misses), resizes of reused
+ * objects, releases to them, deletes due to the limit, and the largest size
+ * reached are reported, so limits can be set at build time from that.
+ */
+
+#if _NUITKA_FREELIST_STATS
+
+#include "nuitka/freelists.h"
+
+static struct Nuitka_FreeListStats *free_list_stats = NULL;
+static struct Nuitka_FreeListStats **free_list_stats_tail = &free_list_stats;
+
+static void reportFreeListStats(void) {
+    fprintf(stderr, "Nuitka free list statistics:\n");
+    fprintf(stderr, "%-24s %6s %10s %10s %10s %10s %10s %10s\n", "kind", "limit", "hits", "misses", "resizes",
+            "releases", "deletes", "high water");
+
+    for (struct Nuitka_FreeListStats *stats = free_list_stats; stats != NULL; stats = stats->next) {
+        fprintf(stderr, "%-24s %6d %10lu %10lu %10lu %10lu %10lu %10d\n", stats->kind, stats->limit, stats->hits,
+                stats->misses, stats->resizes, stats->releases, stats->deletes, stats->high_water);
+    }
+
+    fprintf(stderr, "Limits are set at build time with '--freelist-limit=kind=count' options.\n");
+}
+
+void registerFreeListStats(struct Nuitka_FreeListStats *stats) {
+    if (free_list_stats == NULL) {
+        atexit(reportFreeListStats);
+    }
+
+    stats->registered = 1;
+
+    *free_list_stats_tail = stats;
+    free_list_stats_tail = &stats->next;
+}
+
+#endif
@@ -0,0 +1,397 @@
+//     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for the built-in profiling of compiled code.
+ *
+ * Entering and leaving a compiled frame counts calls and time per code object,
+ * and per calling code object. At exit, the result is written in the format
+ * of the "pstats" module, i.e. what "cProfile" does, to the file named in
+ * "NUITKA_PROFILE_FILENAME" or "nuitka-profile.pstats" by default.
+ *
+ * Only the thread that started the program is profiled.
+ */
+
+#if _NUITKA_PROFILE_NATIVE
+
+#if defined(_WIN32)
+#include <windows.h>
+#else
+#include <time.h>
+#endif
+
+static uint64_t getProfileTime(void) {
+#if defined(_WIN32)
+    LARGE_INTEGER counter;
+    QueryPerformanceCounter(&counter);
+
+    return (uint64_t)counter.QuadPart;
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+
+    return (uint64_t)now.tv_sec * 1000000000 + now.tv_nsec;
+#endif
+}
+
+static double getProfileTimeUnit(void) {
+#if defined(_WIN32)
+    LARGE_INTEGER frequency;
+    QueryPerformanceFrequency(&frequency);
+
+    return 1.0 / (double)frequency.QuadPart;
+#else
+    return 1e-9;
+#endif
+}
+
+// Statistics for a code object, or for a code object called by another one.
+struct Nuitka_ProfileEntry {
+    PyCodeObject *code;
+    PyCodeObject *caller;
+
+    uint64_t primitive_calls;
+    uint64_t calls;
+
+    uint64_t total_time;
+    uint64_t cumulative_time;
+
+    // Number of active calls, recursive calls do not add cumulative time.
+    int active;
+};
+
+// Hash table of entries with open addressing, keyed by code and caller.
+static struct Nuitka_ProfileEntry **profile_entries = NULL;
+static size_t profile_entries_size = 0;
+static size_t profile_entries_used = 0;
+
+static size_t getProfileEntryHash(PyCodeObject *code, PyCodeObject *caller) {
+    size_t result = (size_t)code ^ ((size_t)caller * 31);
+
+    return result ^ (result >> 7);
+}
+
+static void insertProfileEntry(struct Nuitka_ProfileEntry *entry) {
+    size_t mask = profile_entries_size - 1;
+    size_t index = getProfileEntryHash(entry->code, entry->caller) & mask;
+
+    while (profile_entries[index] != NULL) {
+        index = (index + 1) & mask;
+    }
+
+    profile_entries[index] = entry;
+}
+
+static void resizeProfileEntries(void) {
+    struct Nuitka_ProfileEntry **old_entries = profile_entries;
+    size_t old_size = profile_entries_size;
+
+    profile_entries_size = old_size == 0 ? 1024 : old_size * 2;
+    profile_entries = (struct Nuitka_ProfileEntry **)calloc(profile_entries_size, sizeof(struct Nuitka_ProfileEntry *));
+
+    for (size_t i = 0; i < old_size; i++) {
+        if (old_entries[i] != NULL) {
+            insertProfileEntry(old_entries[i]);
+        }
+    }
+
+    free(old_entries);
+}
+
+static struct Nuitka_ProfileEntry *getProfileEntry(PyCodeObject *code, PyCodeObject *caller) {
+    size_t mask = profile_entries_size - 1;
+    size_t index = getProfileEntryHash(code, caller) & mask;
+
+    for (;;) {
+        struct Nuitka_ProfileEntry *entry = profile_entries[index];
+
+        if (entry == NULL) {
+            break;
+        }
+
+        if (entry->code == code && entry->caller == caller) {
+            return entry;
+        }
+
+        index = (index + 1) & mask;
+    }
+
+    // Keep the table at most half full.
+    if (profile_entries_used * 2 >= profile_entries_size) {
+        resizeProfileEntries();
+    }
+
+    struct Nuitka_ProfileEntry *entry = (struct Nuitka_ProfileEntry *)calloc(1, sizeof(struct Nuitka_ProfileEntry));
+
+    // The code objects must not go away before reporting.
+    Py_INCREF(code);
+    Py_XINCREF(caller);
+
+    entry->code = code;
+    entry->caller = caller;
+
+    insertProfileEntry(entry);
+    profile_entries_used += 1;
+
+    return entry;
+}
+
+// Stack of the active compiled frames.
+struct Nuitka_ProfileFrame {
+    PyCodeObject *code;
+
+    struct Nuitka_ProfileEntry *entry;
+    struct Nuitka_ProfileEntry *caller_entry;
+
+    uint64_t start_time;
+    uint64_t children_time;
+};
+
+static struct Nuitka_ProfileFrame *profile_stack = NULL;
+static int profile_stack_size = 0;
+static int profile_stack_used = 0;
+
+static PyThreadState *profile_thread_state = NULL;
+
+void Nuitka_Profile_EnterFrame(PyCodeObject *code) {
+    if (PyThreadState_GET() != profile_thread_state) {
+        return;
+    }
+
+    if (profile_stack_used == profile_stack_size) {
+        profile_stack_size = profile_stack_size == 0 ? 256 : profile_stack_size * 2;
+        profile_stack = (struct Nuitka_ProfileFrame *)realloc(profile_stack,
+                                                              profile_stack_size * sizeof(struct Nuitka_ProfileFrame));
+    }
+
+    struct Nuitka_ProfileFrame *frame = &profile_stack[profile_stack_used];
+
+    frame->code = code;
+    frame->entry = getProfileEntry(code, NULL);
+    frame->caller_entry =
+        profile_stack_used > 0 ? getProfileEntry(code, profile_stack[profile_stack_used - 1].code) : NULL;
+    frame->children_time = 0;
+
+    frame->entry->active += 1;
+
+    if (frame->caller_entry != NULL) {
+        frame->caller_entry->active += 1;
+    }
+
+    profile_stack_used += 1;
+
+    // Last thing, so the profiling itself is not counted.
+    frame->start_time = getProfileTime();
+}
+
+static void updateProfileEntry(struct Nuitka_ProfileEntry *entry, uint64_t elapsed, uint64_t children_time) {
+    entry->calls += 1;
+    entry->total_time += elapsed - children_time;
+
+    entry->active -= 1;
+
+    if (entry->active == 0) {
+        entry->primitive_calls += 1;
+        entry->cumulative_time += elapsed;
+    }
+}
+
+static void leaveProfileFrame(uint64_t now) {
+    profile_stack_used -= 1;
+
+    struct Nuitka_ProfileFrame *frame = &profile_stack[profile_stack_used];
+
+    uint64_t elapsed = now - frame->start_time;
+
+    updateProfileEntry(frame->entry, elapsed, frame->children_time);
+
+    if (frame->caller_entry != NULL) {
+        updateProfileEntry(frame->caller_entry, elapsed, frame->children_time);
+    }
+
+    if (profile_stack_used > 0) {
+        profile_stack[profile_stack_used - 1].children_time += elapsed;
+    }
+}
+
+void Nuitka_Profile_LeaveFrame(PyCodeObject *code) {
+    uint64_t now = getProfileTime();
+
+    if (PyThreadState_GET() != profile_thread_state || profile_stack_used == 0) {
+        return;
+    }
+
+    assert(profile_stack[profile_stack_used - 1].code == code);
+
+    leaveProfileFrame(now);
+}
+
+int Nuitka_Profile_GetDepth(void) {
+    if (PyThreadState_GET() != profile_thread_state) {
+        return -1;
+    }
+
+    return profile_stack_used;
+}
+
+// Generators, coroutines and asyncgens can suspend with frames of their own
+// still active, e.g. an "await" inside a list contraction. These are left
+// on suspension and entered again on resumption, like "cProfile" does.
+void Nuitka_Profile_ResumeFrames(PyFrameObject *frame, PyFrameObject *resume_frame) {
+    if (resume_frame == NULL || resume_frame == frame) {
+        return;
+    }
+
+    Nuitka_Profile_ResumeFrames(frame, resume_frame->f_back);
+    Nuitka_Profile_EnterFrame(resume_frame->f_code);
+}
+
+void Nuitka_Profile_SuspendFrames(int depth) {
+    uint64_t now = getProfileTime();
+
+    if (depth < 0 || PyThreadState_GET() != profile_thread_state) {
+        return;
+    }
+
+    while (profile_stack_used > depth) {
+        leaveProfileFrame(now);
+    }
+}
+
+static PyObject *getProfileFunctionKey(PyCodeObject *code) {
+    return Py_BuildValue("(OiO)", code->co_filename, code->co_firstlineno, code->co_name);
+}
+
+static PyObject *getProfileCallerValue(struct Nuitka_ProfileEntry *entry, double time_unit) {
+    // For callers, "pstats" has the total calls first.
+    return Py_BuildValue("(KKdd)", (unsigned long long)entry->calls, (unsigned long long)entry->primitive_calls,
+                         entry->total_time * time_unit, entry->cumulative_time * time_unit);
+}
+
+static PyObject *getProfileStats(void) {
+    double time_unit = getProfileTimeUnit();
+
+    PyObject *stats = PyDict_New();
+
+    // First the functions themselves, then add the callers to them.
+    for (size_t i = 0; i < profile_entries_size; i++) {
+        struct Nuitka_ProfileEntry *entry = profile_entries[i];
+
+        if (entry == NULL || entry->caller != NULL) {
+            continue;
+        }
+
+        PyObject *key = getProfileFunctionKey(entry->code);
+        PyObject *callers = PyDict_New();
+
+        PyObject *value = Py_BuildValue("(KKddN)", (unsigned long long)entry->primitive_calls,
+                                        (unsigned long long)entry->calls, entry->total_time * time_unit,
+                                        entry->cumulative_time * time_unit, callers);
+
+        PyDict_SetItem(stats, key, value);
+
+        Py_DECREF(key);
+        Py_DECREF(value);
+    }
+
+    for (size_t i = 0; i < profile_entries_size; i++) {
+        struct Nuitka_ProfileEntry *entry = profile_entries[i];
+
+        if (entry == NULL || entry->caller == NULL) {
+            continue;
+        }
+
+        PyObject *key = getProfileFunctionKey(entry->code);
+        PyObject *caller_key = getProfileFunctionKey(entry->caller);
+        PyObject *value = getProfileCallerValue(entry, time_unit);
+
+        PyObject *function_stats = PyDict_GetItem(stats, key);
+        assert(function_stats != NULL);
+
+        PyDict_SetItem(PyTuple_GET_ITEM(function_stats, 4), caller_key, value);
+
+        Py_DECREF(key);
+        Py_DECREF(caller_key);
+        Py_DECREF(value);
+    }
+
+    return stats;
+}
+
+static PyObject *writeProfileStats(PyObject *self, PyObject *args) {
+    // Not profiling the writing of the result.
+    profile_thread_state = NULL;
+
+    PyObject *stats = getProfileStats();
+    PyObject *marshal_value = PyMarshal_WriteObjectToString(stats, Py_MARSHAL_VERSION);
+    Py_DECREF(stats);
+
+    if (unlikely(marshal_value == NULL)) {
+        return NULL;
+    }
+
+    char const *filename = getenv("NUITKA_PROFILE_FILENAME");
+
+    if (filename == NULL) {
+        filename = "nuitka-profile.pstats";
+    }
+
+    FILE *profile_file = fopen(filename, "wb");
+
+    if (profile_file != NULL) {
+        fwrite(PyBytes_AS_STRING(marshal_value), 1, PyBytes_GET_SIZE(marshal_value), profile_file);
+        fclose(profile_file);
+    } else {
+        PySys_WriteStderr("Nuitka: Could not write profile to '%s'.\n", filename);
+    }
+
+    Py_DECREF(marshal_value);
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyMethodDef _method_def_write_profile_stats = {"writeProfileStats", (PyCFunction)writeProfileStats,
+                                                      METH_NOARGS, NULL};
+
+void startNativeProfiling(void) {
+    profile_thread_state = PyThreadState_GET();
+
+    resizeProfileEntries();
+
+    // Write the result at exit, this also covers "sys.exit" calls.
+    PyObject *atexit_module = PyImport_ImportModule("atexit");
+
+    if (unlikely(atexit_module == NULL)) {
+        PyErr_Print();
+        abort();
+    }
+
+    PyObject *write_function = PyCFunction_New(&_method_def_write_profile_stats, NULL);
+    PyObject *result = PyObject_CallMethod(atexit_module, (char *)"register", (char *)"O", write_function);
+
+    if (unlikely(result == NULL)) {
+        PyErr_Print();
+        abort();
+    }
+
+    Py_DECREF(result);
+    Py_DECREF(write_function);
+    Py_DECREF(atexit_module);
+}
+
+#endif
@@ -324,9 +324,12 @@ void patchTypeComparison() {
 
 #include "nuitka/freelists.h"
 
+#ifndef MAX_TRACEBACK_FREE_LIST_COUNT
 #define MAX_TRACEBACK_FREE_LIST_COUNT 1000
+#endif
 static PyTracebackObject *free_list_tracebacks = NULL;
 static int free_list_tracebacks_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_tracebacks, traceback, MAX_TRACEBACK_FREE_LIST_COUNT)
 
 // Create a traceback for a given frame, using a freelist hacked into the
 // existing type.
@@ -510,6 +510,10 @@ int main(int argc, char **argv) {
     startProfiling();
 #endif
 
+#if _NUITKA_PROFILE_NATIVE
+    startNativeProfiling();
+#endif
+
     /* Execute the main module unless plugins want to do something else. In case of
        multiprocessing making a fork on Windows, we should execute __parents_main__
        instead. And for Windows Service we call the plugin C code to call us back
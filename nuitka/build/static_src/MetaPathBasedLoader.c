@@ -68,18 +68,50 @@ static inline bool isVerbose(void) { return false; }
 
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
 
-static bool hasFrozenModule(char const *name) {
-    for (struct _frozen const *p = PyImport_FrozenModules;; p++) {
-        if (p->name == NULL) {
-            return false;
-        }
+// Number of loader entries, these are sorted by name for binary search.
+static int loader_entries_count = 0;
 
-        if (strcmp(p->name, name) == 0) {
-            break;
-        }
+static int compareLoaderEntries(void const *a, void const *b) {
+    return strcmp(((struct Nuitka_MetaPathBasedLoaderEntry const *)a)->name,
+                  ((struct Nuitka_MetaPathBasedLoaderEntry const *)b)->name);
+}
+
+static int compareStrings(void const *a, void const *b) { return strcmp(*(char const **)a, *(char const **)b); }
+
+// Sorted names of the frozen modules, created on first use, and again if the
+// table of frozen modules was replaced since then.
+static struct _frozen const *frozen_modules_indexed = NULL;
+static char const **frozen_module_names = NULL;
+static int frozen_module_names_count = 0;
+
+static void indexFrozenModules(void) {
+    int count = 0;
+
+    while (PyImport_FrozenModules[count].name != NULL) {
+        count++;
     }
 
-    return true;
+    char const **names = (char const **)malloc(sizeof(char const *) * (count + 1));
+
+    for (int i = 0; i < count; i++) {
+        names[i] = PyImport_FrozenModules[i].name;
+    }
+
+    qsort(names, count, sizeof(char const *), compareStrings);
+
+    free((void *)frozen_module_names);
+
+    frozen_module_names = names;
+    frozen_module_names_count = count;
+    frozen_modules_indexed = PyImport_FrozenModules;
+}
+
+static bool hasFrozenModule(char const *name) {
+    if (frozen_modules_indexed != PyImport_FrozenModules) {
+        indexFrozenModules();
+    }
+
+    return bsearch(&name, frozen_module_names, frozen_module_names_count, sizeof(char const *), compareStrings) != NULL;
 }
 
 static char *copyModulenameAsPath(char *buffer, char const *module_name) {
@@ -250,18 +282,14 @@ static PyObject *loadModuleFromCodeObject(PyCodeObject *code_object, char const
 }
 
 static struct Nuitka_MetaPathBasedLoaderEntry *findEntry(char const *name) {
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    assert(loader_entries);
 
-    while (current->name != NULL) {
-        if (strcmp(name, current->name) == 0) {
-            return current;
-        }
-
-        current++;
-    }
+    struct Nuitka_MetaPathBasedLoaderEntry key;
+    key.name = name;
 
-    return NULL;
+    return (struct Nuitka_MetaPathBasedLoaderEntry *)bsearch(&key, loader_entries, loader_entries_count,
+                                                             sizeof(struct Nuitka_MetaPathBasedLoaderEntry),
+                                                             compareLoaderEntries);
 }
 
 static char *_kwlist[] = {(char *)"fullname", (char *)"unused", NULL};
@@ -999,9 +1027,12 @@ static PyObject *Nuitka_Loader_tp_repr(struct Nuitka_LoaderObject *loader) {
 // TODO: A freelist is not the right thing for those, they are probably living forever, but it's
 // no big harm too, but make it small.
 
+#ifndef MAX_LOADER_FREE_LIST_COUNT
 #define MAX_LOADER_FREE_LIST_COUNT 10
+#endif
 static struct Nuitka_LoaderObject *free_list_loaders = NULL;
 static int free_list_loaders_count = 0;
+NUITKA_FREE_LIST_STATS(free_list_loaders, loader, MAX_LOADER_FREE_LIST_COUNT)
 
 static void Nuitka_Loader_tp_dealloc(struct Nuitka_LoaderObject *loader) {
     Nuitka_GC_UnTrack(loader);
@@ -1098,6 +1129,27 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
 
     loader_entries = _loader_entries;
 
+    // The table is created sorted, but renaming for the package context can
+    // change the order, so check it, and sort it only if necessary.
+    bool sorted = true;
+
+    // Counting starts over, in case the loader is set up more than once.
+    loader_entries_count = 0;
+
+    while (loader_entries[loader_entries_count].name != NULL) {
+        if (loader_entries_count > 0 &&
+            strcmp(loader_entries[loader_entries_count - 1].name, loader_entries[loader_entries_count].name) > 0) {
+            sorted = false;
+        }
+
+        loader_entries_count++;
+    }
+
+    if (!sorted) {
+        qsort(loader_entries, loader_entries_count, sizeof(struct Nuitka_MetaPathBasedLoaderEntry),
+              compareLoaderEntries);
+    }
+
     PyType_Ready(&Nuitka_Loader_Type);
 
     // Register it as a meta path loader.
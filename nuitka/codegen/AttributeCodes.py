@@ -30,6 +30,7 @@ from .CodeHelpers import (
 )
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCode
 from .PythonAPICodes import generateCAPIObjectCode, generateCAPIObjectCode0
+from .templates.CodeTemplatesVariables import template_attribute_lookup_cached
 
 
 def generateAssignmentAttributeCode(statement, emit, context):
@@ -119,8 +120,12 @@ def generateAttributeLookupCode(to_name, expression, emit, context):
             emit("%s = LOOKUP_ATTRIBUTE_CLASS_SLOT(%s);" % (value_name, source_name))
         else:
             emit(
-                "%s = LOOKUP_ATTRIBUTE(%s, %s);"
-                % (value_name, source_name, context.getConstantCode(attribute_name))
+                template_attribute_lookup_cached
+                % {
+                    "to_name": value_name,
+                    "source_name": source_name,
+                    "attribute_name": context.getConstantCode(attribute_name),
+                }
             )
 
         getErrorExitCode(
@@ -24,8 +24,21 @@ and for freezing of bytecode.
 
 
 class StreamData(object):
+    """ Builder of the binary blob, for the constants and frozen bytecode.
+
+    Values already stored are looked up in an index of offsets, instead of
+    searching the blob for them, and the blob is only joined at the end.
+    """
+
+    # Short values, e.g. attribute names, are commonly found at the end of
+    # longer ones, so these suffixes are indexed too.
+    max_suffix_length = 16
+
     def __init__(self):
-        self.stream_data = bytes()
+        self.chunks = []
+        self.size = 0
+
+        self.offsets = {}
 
     def getStreamDataCode(self, value, fixed_size=False):
         offset = self.getStreamDataOffset(value)
@@ -36,16 +49,28 @@ class StreamData(object):
             return "&constant_bin[ %d ], %d" % (offset, len(value))
 
     def getStreamDataOffset(self, value):
-        offset = self.stream_data.find(value)
-        if offset == -1:
-            offset = len(self.stream_data)
-            self.stream_data += value
+        offset = self.offsets.get(value)
+
+        if offset is None:
+            offset = self.size
+
+            self.chunks.append(value)
+            self.size += len(value)
+
+            self.offsets[value] = offset
+
+            for suffix_length in range(1, min(len(value), self.max_suffix_length + 1)):
+                suffix = value[-suffix_length:]
+
+                if suffix not in self.offsets:
+                    self.offsets[suffix] = self.size - suffix_length
 
         return offset
 
     def getBytes(self):
-        r = self.stream_data
+        r = b"".join(self.chunks)
 
         # Release memory as soon as we are finished.
-        del self.stream_data
+        del self.chunks
+        del self.offsets
         return r
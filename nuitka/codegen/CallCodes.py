@@ -23,8 +23,11 @@ able to execute them without creating the argument dictionary at all.
 
 """
 
+from contextlib import contextmanager
+
 from .CodeHelpers import (
     generateChildExpressionCode,
+    generateChildExpressionsCode,
     generateExpressionCode,
     withObjectCodeTemporaryAssignment,
 )
@@ -316,6 +319,43 @@ def generateCallCode(to_name, expression, emit, context):
                 )
 
 
+def generateCallComplexCode(to_name, expression, emit, context):
+    child_names = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
+
+    # The order of children depends on the Python version, use their names.
+    value_names = dict(zip(expression.named_children, child_names))
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "call_result", expression, emit, context
+    ) as result_name:
+        context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
+
+        emitLineNumberUpdateCode(emit, context)
+
+        emit(
+            "%s = CALL_FUNCTION_COMPLEX(%s, %s, %s, %s, %s);"
+            % (
+                result_name,
+                value_names["called"],
+                value_names["args"] or "NULL",
+                value_names["list_star_arg"] or "NULL",
+                value_names["kw"] or "NULL",
+                value_names["dict_star_arg"] or "NULL",
+            )
+        )
+
+        getErrorExitCode(
+            check_name=result_name,
+            release_names=child_names,
+            emit=emit,
+            context=context,
+        )
+
+        context.addCleanupTempName(result_name)
+
+
 def getCallCodeNoArgs(to_name, called_name, needs_check, emit, context):
     emitLineNumberUpdateCode(emit, context)
 
@@ -358,6 +398,43 @@ quick_calls_used = set([1, 2, 3, 4, 5])
 quick_instance_calls_used = set()
 
 
+@contextmanager
+def withCallsUsedRecording():
+    """ Record the quick calls used by code generation inside the block.
+
+    Yields:
+        dict - filled with "calls" and "instance_calls" when the block is left
+    """
+    # Replaced temporarily, pylint: disable=global-statement
+    global quick_calls_used, quick_instance_calls_used
+
+    outer_calls_used = quick_calls_used
+    outer_instance_calls_used = quick_instance_calls_used
+
+    quick_calls_used = set()
+    quick_instance_calls_used = set()
+
+    result = {}
+
+    try:
+        yield result
+    finally:
+        result["calls"] = sorted(quick_calls_used)
+        result["instance_calls"] = sorted(quick_instance_calls_used)
+
+        outer_calls_used.update(quick_calls_used)
+        outer_instance_calls_used.update(quick_instance_calls_used)
+
+        quick_calls_used = outer_calls_used
+        quick_instance_calls_used = outer_instance_calls_used
+
+
+def addCallsUsed(calls, instance_calls):
+    """ Add quick calls used by code that was not generated this time. """
+    quick_calls_used.update(calls)
+    quick_instance_calls_used.update(instance_calls)
+
+
 def _getInstanceCallCodePosArgsQuick(
     to_name, called_name, called_attribute_name, arg_names, needs_check, emit, context
 ):
@@ -70,7 +70,12 @@ from .BuiltinCodes import (
     generateBuiltinXrange2Code,
     generateBuiltinXrange3Code,
 )
-from .CallCodes import generateCallCode, getCallsCode, getCallsDecls
+from .CallCodes import (
+    generateCallCode,
+    generateCallComplexCode,
+    getCallsCode,
+    getCallsDecls,
+)
 from .ClassCodes import generateBuiltinSuperCode, generateSelectMetaclassCode
 from .CodeHelpers import setExpressionDispatchDict, setStatementDispatchDict
 from .ComparisonCodes import (
@@ -565,6 +570,7 @@ setExpressionDispatchDict(
         "EXPRESSION_CALL_KEYWORDS_ONLY": generateCallCode,
         "EXPRESSION_CALL_NO_KEYWORDS": generateCallCode,
         "EXPRESSION_CALL": generateCallCode,
+        "EXPRESSION_CALL_COMPLEX": generateCallComplexCode,
         "EXPRESSION_CONSTANT_NONE_REF": generateConstantNoneReferenceCode,
         "EXPRESSION_CONSTANT_TRUE_REF": generateConstantTrueReferenceCode,
         "EXPRESSION_CONSTANT_FALSE_REF": generateConstantFalseReferenceCode,
@@ -35,6 +35,7 @@ import sys
 
 from nuitka import Options
 from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
+    intern,
     iterItems,
     long,
     unicode,
@@ -50,7 +51,11 @@ from .BlobCodes import StreamData
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getReleaseCode
 from .Indentation import indented
-from .templates.CodeTemplatesConstants import template_constants_reading
+from .templates.CodeTemplatesConstants import (
+    template_constants_group,
+    template_constants_group_check,
+    template_constants_reading,
+)
 
 
 def generateConstantReferenceCode(to_name, expression, emit, context):
@@ -131,54 +136,43 @@ min_signed_long = -(2 ** (sizeof_long * 8 - 1) - 1)
 
 done = set()
 
+# Shared constants not needed at program start are created in groups, one for
+# each set of modules using them, when the first of these modules is imported.
+constant_groups = {}
 
-def _getConstantInitValueCode(constant_value, constant_type):
-    """ Return code, if possible, to create a constant.
+# The group of shared constants currently being created, "None" for the ones
+# created at program start.
+_current_group = None
 
-        It's only used for module local constants, like error messages, and
-        provides no caching of the values. When it returns "None", it is in
-        error.
-    """
 
-    # This function is a case driven by returns, pylint: disable=too-many-return-statements
+def _getConstantGroupKey(global_context, constant_identifier):
+    """ Get the group of a shared constant, "None" for creation at start.
 
-    if constant_type is unicode:
-        # Python3: Strings that can be encoded as UTF-8 are done more or less
-        # directly. When they cannot be expressed as UTF-8, that is rare not we
-        # can indeed use pickling.
-        try:
-            encoded = constant_value.encode("utf-8")
+        Constants used outside of modules, or by the module that is loaded at
+        program start, are created eagerly, the others by the set of modules
+        using them. A nested constant is used by every module that uses the
+        containing one, so its group is created before, or at the same time.
+    """
 
-            if str is bytes:
-                return "UNSTREAM_UNICODE(%s)" % (stream_data.getStreamDataCode(encoded))
-            else:
-                return "UNSTREAM_STRING(%s, %d, %d)" % (
-                    stream_data.getStreamDataCode(encoded, fixed_size=True),
-                    len(constant_value),
-                    1 if _isAttributeName(constant_value) else 0,
-                )
-        except UnicodeEncodeError:
-            # TODO: try and use "surrogateescape" for this
+    users = global_context.getConstantUsers(constant_identifier)
+
+    for user in users:
+        if user is None or user.isMainModule() or user.isTopModule():
             return None
-    elif constant_type is str:
-        assert str is bytes
 
-        if len(constant_value) == 1:
-            return "UNSTREAM_CHAR(%d, %d)" % (
-                ord(constant_value[0]),
-                1 if _isAttributeName(constant_value) else 0,
-            )
-        else:
-            return "UNSTREAM_STRING(%s, %d)" % (
-                stream_data.getStreamDataCode(constant_value),
-                1 if _isAttributeName(constant_value) else 0,
-            )
-    elif constant_type is bytes:
-        assert str is not bytes
+    return tuple(sorted(user.getFullName().asString() for user in users))
+
+
+def _getConstantGroupIndex(group_key):
+    if group_key not in constant_groups:
+        constant_groups[group_key] = len(constant_groups)
+
+    return constant_groups[group_key]
 
-        return "UNSTREAM_BYTES(%s)" % (stream_data.getStreamDataCode(constant_value))
-    else:
-        return None
+
+def _getSortedConstantGroupKeys(group_keys):
+    # Larger sets first, these contain the constants nested in smaller ones.
+    return sorted(group_keys, key=lambda group_key: (-len(group_key), group_key))
 
 
 def decideMarshal(constant_value):
@@ -329,6 +323,12 @@ def _addConstantInitCode(
     elif constant_identifier in done:
         # Do not repeat ourselves.
         return
+    elif (
+        not module_level
+        and _getConstantGroupKey(context, constant_identifier) != _current_group
+    ):
+        # Created with another group of shared constants.
+        return
 
     if Options.shallTraceExecution():
         emit("""NUITKA_PRINT_TRACE("Creating constant: %s");""" % constant_identifier)
@@ -344,6 +344,10 @@ def _addConstantInitCode(
         module_level,
     )
 
+    _addConstantCheckCode(emit, check, constant_identifier)
+
+
+def _addConstantCheckCode(emit, check, constant_identifier):
     # In debug mode, lets check if the constants somehow change behind our
     # back, add those values too.
     if Options.isDebug():
@@ -361,6 +365,102 @@ assert(hash_%(constant_identifier)s == DEEP_HASH(%(constant_identifier)s));"""
         )
 
 
+def _getInternedConstant(constant_value):
+    """ Get the constant value with attribute names interned.
+
+        The "marshal" module preserves interned strings, which is how
+        attribute names are created otherwise too.
+    """
+
+    constant_type = type(constant_value)
+
+    if constant_type is str:
+        if _isAttributeName(constant_value):
+            return intern(constant_value)
+    elif constant_type in (tuple, list, set, frozenset):
+        return constant_type(
+            _getInternedConstant(element_value) for element_value in constant_value
+        )
+    elif constant_type is dict:
+        return dict(
+            (_getInternedConstant(key), _getInternedConstant(value))
+            for key, value in iterItems(constant_value)
+        )
+
+    return constant_value
+
+
+def _isConstantsTableConstant(constant_identifier, constant_value):
+    if not constant_identifier.startswith("const_"):
+        return False
+
+    if constant_identifier in done:
+        return False
+
+    if constant_value in builtin_named_values_list:
+        return False
+
+    if not decideMarshal(constant_value):
+        return False
+
+    try:
+        marshal_value = marshal.dumps(constant_value)
+    except ValueError:
+        return False
+
+    return compareConstants(constant_value, marshal.loads(marshal_value))
+
+
+def _addConstantsTableCode(emit, check, constants):
+    """ Emit code to create constants from one marshal value in the blob.
+
+        Instead of code for every constant, their values are put into one
+        tuple, that a single helper call distributes. Constants that cannot
+        be created like this are left to the normal code.
+    """
+
+    table_constants = [
+        (constant_identifier, constant_value)
+        for constant_identifier, constant_value in constants
+        if _isConstantsTableConstant(constant_identifier, constant_value)
+    ]
+
+    if not table_constants:
+        return
+
+    marshal_value = marshal.dumps(
+        tuple(
+            _getInternedConstant(constant_value)
+            for _constant_identifier, constant_value in table_constants
+        )
+    )
+
+    if Options.shallTraceExecution():
+        emit(
+            """NUITKA_PRINT_TRACE("Creating %d constants from table.");"""
+            % len(table_constants)
+        )
+
+    emit("{")
+    emit("    static PyObject **constants_table[] = {")
+
+    for constant_identifier, _constant_value in table_constants:
+        emit("        &%s," % constant_identifier)
+
+        done.add(constant_identifier)
+
+    emit("    };")
+    emit("")
+    emit(
+        "    UNSTREAM_CONSTANTS_TABLE(%s, constants_table, %d);"
+        % (stream_data.getStreamDataCode(marshal_value), len(table_constants))
+    )
+    emit("}")
+
+    for constant_identifier, _constant_value in table_constants:
+        _addConstantCheckCode(emit, check, constant_identifier)
+
+
 def __addConstantInitCode(
     context,
     emit,
@@ -841,27 +941,72 @@ CHECK_OBJECT(const_int_pos_1);
 
 
 def getConstantsInitCode(context):
-    emit = SourceCodeCollector()
+    """ Get code to create the shared constants, and to check them.
+
+        Returns the code for the constants created at program start, and the
+        functions for the groups of the other shared constants.
+    """
 
-    check = SourceCodeCollector()
+    # Singleton, pylint: disable=global-statement
+    global _current_group
 
     # Sort items by length and name, so we are deterministic and pretty.
     sorted_constants = sorted(
         iterItems(context.getConstants()), key=lambda k: (len(k[0]), k[0])
     )
 
-    for constant_identifier, constant_value in sorted_constants:
-        _addConstantInitCode(
-            emit=emit,
-            check=check,
-            constant_type=type(constant_value),
-            constant_value=constant_value,
-            constant_identifier=constant_identifier,
-            module_level=False,
-            context=context,
-        )
+    group_keys = set()
+
+    for constant_identifier, _constant_value in sorted_constants:
+        if not constant_identifier.startswith("const_"):
+            continue
+
+        if context.getConstantUseCount(constant_identifier) != 1:
+            group_key = _getConstantGroupKey(context, constant_identifier)
+
+            if group_key is not None:
+                group_keys.add(group_key)
+
+    result = []
 
-    return emit.codes, check.codes
+    for group_key in [None] + _getSortedConstantGroupKeys(group_keys):
+        emit = SourceCodeCollector()
+        check = SourceCodeCollector()
+
+        _current_group = group_key
+
+        if Options.isExperimental("constants_table"):
+            _addConstantsTableCode(
+                emit=emit,
+                check=check,
+                constants=[
+                    (constant_identifier, constant_value)
+                    for constant_identifier, constant_value in sorted_constants
+                    if constant_identifier.startswith("const_")
+                    if context.getConstantUseCount(constant_identifier) != 1
+                    if _getConstantGroupKey(context, constant_identifier) == group_key
+                ],
+            )
+
+        for constant_identifier, constant_value in sorted_constants:
+            _addConstantInitCode(
+                emit=emit,
+                check=check,
+                constant_type=type(constant_value),
+                constant_value=constant_value,
+                constant_identifier=constant_identifier,
+                module_level=False,
+                context=context,
+            )
+
+        if group_key is None:
+            result.append((None, emit.codes, check.codes))
+        else:
+            result.append((_getConstantGroupIndex(group_key), emit.codes, check.codes))
+
+    _current_group = None
+
+    return result
 
 
 def getConstantsDeclCode(context):
@@ -903,6 +1048,14 @@ def getConstantAccess(to_name, constant, emit, context):
     if to_name.c_type == "nuitka_bool" and Options.is_debug:
         codegen_missing.info("Missing optimization for constant to C bool.")
 
+    # Unboxed numbers do not need an object for most values.
+    if to_name.c_type in ("nuitka_ilong", "nuitka_ifloat"):
+        to_name.getCType().emitAssignmentCodeFromConstant(
+            to_name=to_name, constant=constant, emit=emit, context=context
+        )
+
+        return
+
     if type(constant) is dict:
         if constant:
             for key, value in iterItems(constant):
@@ -994,18 +1147,6 @@ def getConstantAccess(to_name, constant, emit, context):
             context.addCleanupTempName(value_name)
 
 
-def getModuleConstantCode(constant):
-    assert type(constant) is str
-
-    result = _getConstantInitValueCode(
-        constant_value=constant, constant_type=type(constant)
-    )
-
-    assert result is not None
-
-    return result
-
-
 constant_counts = {}
 
 
@@ -1014,12 +1155,44 @@ def getConstantInitCodes(module_context):
     inits = SourceCodeCollector()
     checks = SourceCodeCollector()
 
-    sorted_constants = sorted(
-        module_context.getConstants(), key=lambda k: (len(k[0]), k[0])
-    )
+    # Sort by length and name, so we are deterministic and do not depend on
+    # the order constants were used in.
+    sorted_constants = sorted(module_context.getConstants(), key=lambda k: (len(k), k))
 
     global_context = module_context.global_context
 
+    group_keys = set()
+
+    for constant_identifier in sorted_constants:
+        if not constant_identifier.startswith("const_"):
+            continue
+
+        if global_context.getConstantUseCount(constant_identifier) != 1:
+            group_key = _getConstantGroupKey(global_context, constant_identifier)
+
+            if group_key is not None:
+                group_keys.add(group_key)
+
+    # The groups of shared constants must exist before the module constants,
+    # which may contain them.
+    for group_key in _getSortedConstantGroupKeys(group_keys):
+        group_index = _getConstantGroupIndex(group_key)
+
+        decls.append("extern void createConstantsGroup_%d(void);" % group_index)
+        inits.emit("createConstantsGroup_%d();" % group_index)
+
+    if Options.isExperimental("constants_table"):
+        _addConstantsTableCode(
+            emit=inits,
+            check=checks,
+            constants=[
+                (constant_identifier, global_context.constants[constant_identifier])
+                for constant_identifier in sorted_constants
+                if constant_identifier.startswith("const_")
+                if global_context.getConstantUseCount(constant_identifier) == 1
+            ],
+        )
+
     for constant_identifier in sorted_constants:
         if not constant_identifier.startswith("const_"):
             continue
@@ -1100,7 +1273,28 @@ def getConstantsDefinitionCode(context):
         than one module) and create them.
 
     """
-    constant_inits, constant_checks = getConstantsInitCode(context=context)
+    constant_groups_code = []
+    constant_groups_checks = []
+
+    for group_index, group_inits, group_checks in getConstantsInitCode(context=context):
+        if group_index is None:
+            constant_inits, constant_checks = group_inits, group_checks
+        else:
+            constant_groups_code.append(
+                template_constants_group
+                % {"group_index": group_index, "group_inits": indented(group_inits),}
+            )
+
+            if group_checks:
+                constant_groups_checks.extend(
+                    (
+                        template_constants_group_check
+                        % {
+                            "group_index": group_index,
+                            "group_checks": indented(group_checks),
+                        }
+                    ).split("\n")
+                )
 
     constant_declarations = getConstantsDeclCode(context=context)
 
@@ -1130,7 +1324,8 @@ def getConstantsDefinitionCode(context):
     return template_constants_reading % {
         "constant_declarations": "\n".join(constant_declarations),
         "constant_inits": indented(constant_inits),
-        "constant_checks": indented(constant_checks),
+        "constant_checks": indented(constant_checks + constant_groups_checks),
+        "constant_groups": "\n".join(constant_groups_code),
         "sys_executable": sys_executable,
         "sys_prefix": sys_prefix,
         "sys_base_prefix": sys_base_prefix,
@@ -725,6 +725,9 @@ class PythonGlobalContext(object):
         self.constants = {}
         self.constant_use_count = {}
 
+        # The modules using a constant, "None" for use outside of modules.
+        self.constant_users = {}
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
 
@@ -790,15 +793,20 @@ class PythonGlobalContext(object):
 
         return key
 
-    def countConstantUse(self, constant):
+    def countConstantUse(self, constant, user=None):
         if constant not in self.constant_use_count:
             self.constant_use_count[constant] = 0
+            self.constant_users[constant] = set()
 
         self.constant_use_count[constant] += 1
+        self.constant_users[constant].add(user)
 
     def getConstantUseCount(self, constant):
         return self.constant_use_count[constant]
 
+    def getConstantUsers(self, constant):
+        return self.constant_users[constant]
+
     def getConstants(self):
         return self.constants
 
@@ -875,9 +883,8 @@ class FrameDeclarationsMixin(object):
     def setVariableType(self, variable, variable_declaration):
         assert variable.isLocalVariable(), variable
 
-        # TODO: Change value of that dict to take advantage of declaration.
         self.frame_variable_types[variable] = (
-            str(variable_declaration),
+            variable_declaration,
             variable_declaration.getCType().getTypeIndicator(),
         )
 
@@ -904,14 +911,21 @@ class FrameDeclarationsMixin(object):
         result = []
 
         for variable in self.frame_variables_stack[-1]:
-            variable_code_name, variable_code_type = self.frame_variable_types.get(
+            variable_declaration, variable_code_type = self.frame_variable_types.get(
                 variable, ("NULL", "N")
             )
 
             if variable_code_type in ("b",):
-                result.append("(int)" + variable_code_name)
+                result.append("(int)%s" % variable_declaration)
+            elif variable_code_type in ("L", "F"):
+                # Unboxed values are attached as their object.
+                result.append(
+                    variable_declaration.getCType().getFrameAttachCode(
+                        variable_declaration
+                    )
+                )
             else:
-                result.append(variable_code_name)
+                result.append(str(variable_declaration))
 
         return result
 
@@ -1070,7 +1084,7 @@ class PythonModuleContext(
 
         if result not in self.constants:
             self.constants.add(result)
-            self.global_context.countConstantUse(result)
+            self.global_context.countConstantUse(result, self.module)
 
         return result
 
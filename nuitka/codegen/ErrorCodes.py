@@ -40,9 +40,16 @@ from .templates.CodeTemplatesExceptions import (
 )
 
 
+def _getTempReleaseCode(tmp_name):
+    if tmp_name.c_type == "PyObject *":
+        return "Py_DECREF(%s);" % tmp_name
+    else:
+        return tmp_name.getCType().getTempReleaseCode(tmp_name)
+
+
 def getErrorExitReleaseCode(context):
     temp_release = "\n".join(
-        "Py_DECREF(%s);" % tmp_name for tmp_name in context.getCleanupTempnames()
+        _getTempReleaseCode(tmp_name) for tmp_name in context.getCleanupTempnames()
     )
 
     keeper_variables = context.getExceptionKeeperVariables()
@@ -164,12 +171,13 @@ def getErrorFormatExitBoolCode(condition, exception, args, emit, context):
     )
 
     if len(args) == 1 and type(args[0]) is str:
-        from .ConstantCodes import getModuleConstantCode
-
+        # Using a constant, so the module code does not depend on the
+        # constants blob layout, which is only known at the end.
         set_exception = [
             "%s = %s;" % (exception_type, exception),
             "Py_INCREF(%s);" % exception_type,
-            "%s = %s;" % (exception_value, getModuleConstantCode(constant=args[0])),
+            "%s = %s;" % (exception_value, context.getConstantCode(constant=args[0])),
+            "Py_INCREF(%s);" % exception_value,
             "%s = NULL;" % exception_tb,
         ]
     else:
@@ -216,7 +224,7 @@ def getErrorFormatExitBoolCode(condition, exception, args, emit, context):
 
 def getReleaseCode(release_name, emit, context):
     if context.needsCleanup(release_name):
-        emit("Py_DECREF(%s);" % release_name)
+        emit(_getTempReleaseCode(release_name))
         context.removeCleanupTempName(release_name)
 
 
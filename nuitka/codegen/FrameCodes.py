@@ -206,12 +206,11 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 
 
 def getTypeSizeOf(type_indicator):
-    if type_indicator in ("O", "o", "N", "c"):
+    # Unboxed values "L" and "F" are stored as their object.
+    if type_indicator in ("O", "o", "N", "c", "L", "F"):
         return "sizeof(void *)"
     elif type_indicator == "b":
         return "sizeof(nuitka_bool)"
-    elif type_indicator == "L":
-        return "sizeof(nuitka_ilong)"
     else:
         assert False, type_indicator
 
@@ -250,6 +249,9 @@ def getFrameGuardHeavyCode(
     frame_cache_identifier = context.variable_storage.addFrameCacheDeclaration(
         frame_identifier.code_name
     )
+    frame_pool_identifier = context.variable_storage.addFramePoolDeclaration(
+        frame_identifier.code_name
+    )
 
     _exception_type, _exception_value, _exception_tb, exception_lineno = (
         context.variable_storage.getExceptionVariableDescriptions()
@@ -260,6 +262,7 @@ def getFrameGuardHeavyCode(
         % {
             "frame_identifier": frame_identifier,
             "frame_cache_identifier": frame_cache_identifier,
+            "frame_pool_identifier": frame_pool_identifier,
             "code_identifier": code_identifier,
             "locals_size": getFrameLocalsStorageSize(type_descriptions),
             "codes": indented(codes, 0),
@@ -290,6 +293,7 @@ def getFrameGuardHeavyCode(
             % {
                 "frame_identifier": frame_identifier,
                 "frame_cache_identifier": frame_cache_identifier,
+                "frame_pool_identifier": frame_pool_identifier,
                 "tb_making": getTracebackMakingIdentifier(
                     context=context, lineno_name=exception_lineno
                 ),
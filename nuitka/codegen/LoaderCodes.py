@@ -86,17 +86,23 @@ def getMetapathLoaderBodyCode(other_modules):
                 flags.append("NUITKA_PACKAGE_FLAG")
 
             metapath_loader_inittab.append(
-                template_metapath_loader_bytecode_module_entry
-                % {
-                    "module_name": other_module.getFullName(),
-                    "bytecode": stream_data.getStreamDataOffset(code_data),
-                    "size": len(code_data),
-                    "flags": " | ".join(flags),
-                }
+                (
+                    other_module.getFullName(),
+                    template_metapath_loader_bytecode_module_entry
+                    % {
+                        "module_name": other_module.getFullName(),
+                        "bytecode": stream_data.getStreamDataOffset(code_data),
+                        "size": len(code_data),
+                        "flags": " | ".join(flags),
+                    },
+                )
             )
         else:
             metapath_loader_inittab.append(
-                getModuleMetapathLoaderEntryCode(module=other_module)
+                (
+                    other_module.getFullName(),
+                    getModuleMetapathLoaderEntryCode(module=other_module),
+                )
             )
 
         if other_module.isCompiledPythonModule():
@@ -114,16 +120,25 @@ def getMetapathLoaderBodyCode(other_modules):
             flags.append("NUITKA_PACKAGE_FLAG")
 
         metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry
-            % {
-                "module_name": uncompiled_module.getFullName(),
-                "bytecode": stream_data.getStreamDataOffset(code_data),
-                "size": len(code_data),
-                "flags": " | ".join(flags),
-            }
+            (
+                uncompiled_module.getFullName(),
+                template_metapath_loader_bytecode_module_entry
+                % {
+                    "module_name": uncompiled_module.getFullName(),
+                    "bytecode": stream_data.getStreamDataOffset(code_data),
+                    "size": len(code_data),
+                    "flags": " | ".join(flags),
+                },
+            )
         )
 
+    # The loader does a binary search on the module names, so they must be
+    # sorted like "strcmp" does it. For UTF-8 that is the code point order.
+    metapath_loader_inittab.sort()
+
     return template_metapath_loader_body % {
         "metapath_module_decls": indented(metapath_module_decls, 0),
-        "metapath_loader_inittab": indented(metapath_loader_inittab),
+        "metapath_loader_inittab": indented(
+            [entry_code for _module_name, entry_code in metapath_loader_inittab]
+        ),
     }
@@ -0,0 +1,189 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache of generated C code for modules.
+
+The code generation of a module only depends on its optimized tree, so the
+prepared code of it is saved in the cache directory, keyed by a hash of the
+tree XML, and re-used when the same tree is to be generated again. Together
+with it, the constants and call helpers it requires are saved, these are
+shared between modules and need to be registered again.
+
+The final module code is still composed in every compilation, because it
+contains offsets into the constants blob, which depend on all modules, but
+that is cheap.
+
+The tree XML does not contain everything that influences code generation
+yet, therefore this is only enabled with the experimental flag "code_cache".
+"""
+
+import os
+import pickle
+import sys
+
+from nuitka import Options
+from nuitka.tree.ModuleCache import getOptionsKeyValues
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import (
+    deleteFile,
+    getFileContents,
+    makePath,
+    renameFile,
+)
+from nuitka.utils.Hashing import Hash
+from nuitka.Version import getNuitkaVersion
+
+from . import Contexts
+from .CallCodes import addCallsUsed, withCallsUsedRecording
+from .CodeGeneration import prepareModuleCode
+
+# Increase this, whenever the stored values change in incompatible ways, so
+# old cache entries are not considered anymore.
+_cache_format_version = 1
+
+
+def isCodeCacheEnabled():
+    return Options.isExperimental("code_cache")
+
+
+def _getCacheFilename(cache_key):
+    cache_dir = os.path.join(getCacheDir(), "code-cache")
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, cache_key + ".data")
+
+
+def _getModuleCodeCacheKey(module, module_name):
+    hash_value = Hash()
+
+    hash_value.updateFromValues(
+        _cache_format_version,
+        getNuitkaVersion(),
+        sys.version,
+        module_name,
+        module.getCodeName(),
+        module.getFilename(),
+        module.isMainModule(),
+        module.isCompiledPythonPackage(),
+        module.isTopModule(),
+        [function.getCodeName() for function in module.getUsedFunctions()],
+        [function.getCodeName() for function in module.getCrossUsedFunctions()],
+        module.asXmlText(),
+    )
+
+    hash_value.updateFromValues(*getOptionsKeyValues())
+
+    return hash_value.asHexDigest()
+
+
+def _restoreModuleCode(global_context, module, module_name, cache_filename):
+    values = pickle.loads(getFileContents(cache_filename, "rb"))
+
+    context = Contexts.PythonModuleContext(
+        module=module,
+        module_name=module_name,
+        code_name=module.getCodeName(),
+        filename=module.getFilename(),
+        global_context=global_context,
+    )
+
+    for constant in values["constants"]:
+        context.getConstantCode(constant)
+
+    if values["needs_module_filename_object"]:
+        context.markAsNeedsModuleFilenameObject()
+
+    addCallsUsed(calls=values["calls"], instance_calls=values["instance_calls"])
+
+    return values["template_values"], context
+
+
+def _storeModuleCode(cache_filename, template_values, context, calls_used):
+    values = {
+        "template_values": template_values,
+        "constants": [
+            context.global_context.constants[constant_identifier]
+            for constant_identifier in sorted(context.getConstants())
+        ],
+        "needs_module_filename_object": context.needsModuleFilenameObject(),
+        "calls": calls_used["calls"],
+        "instance_calls": calls_used["instance_calls"],
+    }
+
+    try:
+        data = pickle.dumps(values, protocol=2)
+    except (pickle.PicklingError, TypeError):
+        # Some constants, e.g. anonymous built-in types, cannot be stored, the
+        # module simply is not cached then.
+        return
+
+    # Write to a temporary file first, so other compilations running at the
+    # same time do not see incomplete entries.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with open(temp_filename, "wb") as output_file:
+        output_file.write(data)
+
+    renameFile(temp_filename, cache_filename)
+
+
+def prepareModuleCodeCached(global_context, module, module_name):
+    """ Prepare the code of a module, using the cache if possible.
+
+    Args:
+        global_context - global context for the constants
+        module - module to generate code for
+        module_name - name of the module
+    Returns:
+        tuple - template values and module context, like "prepareModuleCode"
+    """
+
+    # Internal module constants are all forced to be shared, not worth it.
+    if module.isInternalModule():
+        return prepareModuleCode(
+            global_context=global_context, module=module, module_name=module_name
+        )
+
+    cache_filename = _getCacheFilename(_getModuleCodeCacheKey(module, module_name))
+
+    if os.path.exists(cache_filename):
+        try:
+            return _restoreModuleCode(
+                global_context=global_context,
+                module=module,
+                module_name=module_name,
+                cache_filename=cache_filename,
+            )
+        except Exception:  # Catch all the things, pylint: disable=broad-except
+            # Unusable entry, e.g. from an incomplete write, generate instead.
+            deleteFile(cache_filename, must_exist=False)
+
+    with withCallsUsedRecording() as calls_used:
+        template_values, context = prepareModuleCode(
+            global_context=global_context, module=module, module_name=module_name
+        )
+
+    # The template values get modified when creating the final code.
+    _storeModuleCode(
+        cache_filename=cache_filename,
+        template_values=dict(template_values),
+        context=context,
+        calls_used=calls_used,
+    )
+
+    return template_values, context
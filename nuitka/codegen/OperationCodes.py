@@ -28,20 +28,52 @@ from nuitka.containers.oset import OrderedSet
 from . import OperatorCodes
 from .CodeHelpers import (
     generateChildExpressionsCode,
+    generateExpressionCode,
     pickCodeHelper,
     withObjectCodeTemporaryAssignment,
 )
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode
 
 
+_unboxed_binary_helpers = {
+    "nuitka_ilong": {
+        "Add": "BINARY_OPERATION_ADD_ILONG_ILONG",
+        "Sub": "BINARY_OPERATION_SUB_ILONG_ILONG",
+        "Mult": "BINARY_OPERATION_MUL_ILONG_ILONG",
+    },
+    "nuitka_ifloat": {
+        "Add": "BINARY_OPERATION_ADD_IFLOAT_IFLOAT",
+        "Sub": "BINARY_OPERATION_SUB_IFLOAT_IFLOAT",
+        "Mult": "BINARY_OPERATION_MUL_IFLOAT_IFLOAT",
+        "TrueDiv": "BINARY_OPERATION_TRUEDIV_IFLOAT_IFLOAT",
+        "Div": "BINARY_OPERATION_OLDDIV_IFLOAT_IFLOAT",
+    },
+}
+
+# The result is the same for these types, the in-place ones are all immutable.
+for _helpers in _unboxed_binary_helpers.values():
+    for _operator, _helper in tuple(_helpers.items()):
+        _helpers["I" + _operator] = _helper
+
+
 def generateOperationBinaryCode(to_name, expression, emit, context):
+    if to_name.c_type in _unboxed_binary_helpers:
+        if _generateUnboxedBinaryOperationCode(
+            to_name=to_name, expression=expression, emit=emit, context=context
+        ):
+            return
+
+        # The result is converted to the unboxed value, there is no variable
+        # holding the object to update in-place.
+        inplace = False
+    else:
+        # TODO: Decide and use one single spelling, inplace or in_place
+        inplace = expression.isInplaceSuspect()
+
     left_arg_name, right_arg_name = generateChildExpressionsCode(
         expression=expression, emit=emit, context=context
     )
 
-    # TODO: Decide and use one single spelling, inplace or in_place
-    inplace = expression.isInplaceSuspect()
-
     assert not inplace or not expression.getLeft().isCompileTimeConstant(), expression
 
     _getBinaryOperationCode(
@@ -55,6 +87,74 @@ def generateOperationBinaryCode(to_name, expression, emit, context):
     )
 
 
+def isUnboxedValueExpression(expression):
+    """ Can the expression produce an unboxed value directly.
+
+        Constants and variables have their own unboxed values, and binary
+        operations use them, other expressions need to create the object
+        first, and are better converted.
+    """
+
+    return (
+        expression.isExpressionConstantRef()
+        or expression.isExpressionVariableRef()
+        or expression.isExpressionTempVariableRef()
+        or expression.isExpressionOperationBinary()
+    )
+
+
+def _generateUnboxedBinaryOperationCode(to_name, expression, emit, context):
+    helper = _unboxed_binary_helpers[to_name.c_type].get(expression.getOperator())
+
+    if helper is None:
+        return False
+
+    c_type = to_name.getCType()
+
+    for operand in expression.getOperands():
+        if operand.getTypeShape().getCType() is not c_type:
+            return False
+
+        if not isUnboxedValueExpression(operand):
+            return False
+
+    arg_names = []
+
+    for child_name, child_value in expression.getVisitableNodesNamed():
+        arg_name = context.allocateTempName(child_name + "_name", to_name.c_type)
+
+        generateExpressionCode(
+            to_name=arg_name, expression=child_value, emit=emit, context=context
+        )
+
+        arg_names.append(arg_name)
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = %s(&%s, %s);"
+        % (
+            res_name,
+            helper,
+            to_name,
+            ", ".join("&%s" % arg_name for arg_name in arg_names),
+        )
+    )
+
+    # The operands are no longer needed, error or not.
+    getErrorExitBoolCode(
+        condition="%s == false" % res_name,
+        release_names=arg_names,
+        needs_check=expression.mayRaiseExceptionOperation(),
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+    return True
+
+
 def generateOperationNotCode(to_name, expression, emit, context):
     arg_name, = generateChildExpressionsCode(
         expression=expression, emit=emit, context=context
@@ -38,6 +38,7 @@ from .ErrorCodes import (
     getLocalVariableReferenceErrorCode,
     getNameReferenceErrorCode,
 )
+from .OperationCodes import isUnboxedValueExpression
 from .VariableDeclarations import VariableDeclaration
 
 
@@ -62,12 +63,13 @@ def generateAssignmentVariableCode(statement, emit, context):
             and variable_declaration.c_type == "nuitka_bool"
         ):
             tmp_name = context.allocateTempName("assign_source", "nuitka_bool")
-        elif (
-            source_shape is ShapeTypeIntOrLong
-            and variable_declaration.c_type == "nuitka_ilong"
-        ):
-
-            tmp_name = context.allocateTempName("assign_source", "nuitka_ilong")
+        elif variable_declaration.c_type in (
+            "nuitka_ilong",
+            "nuitka_ifloat",
+        ) and isUnboxedValueExpression(assign_source):
+            tmp_name = context.allocateTempName(
+                "assign_source", variable_declaration.c_type
+            )
         else:
             tmp_name = context.allocateTempName("assign_source")
 
@@ -23,6 +23,7 @@ from contextlib import contextmanager
 
 from .c_types.CTypeModuleDictVariables import CTypeModuleDictVariable
 from .c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from .c_types.CTypeNuitkaFloats import CTypeNuitkaFloatStruct
 from .c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
@@ -100,6 +101,8 @@ class VariableDeclaration(object):
             return CTypeNuitkaBoolEnum
         elif c_type == "nuitka_ilong":
             return CTypeNuitkaIntOrLongStruct
+        elif c_type == "nuitka_ifloat":
+            return CTypeNuitkaFloatStruct
         elif c_type == "module_var":
             return CTypeModuleDictVariable
         elif c_type == "void":
@@ -176,6 +179,11 @@ class VariableStorage(object):
             "static struct Nuitka_FrameObject *", "cache_%s" % frame_identifier, "NULL"
         )
 
+    def addFramePoolDeclaration(self, frame_identifier):
+        return self.addVariableDeclarationFunction(
+            "static struct Nuitka_FramePool", "pool_%s" % frame_identifier, "{0}"
+        )
+
     def makeCStructLevelDeclarations(self):
         return [
             variable_declaration.makeCStructDeclaration()
@@ -27,6 +27,7 @@ type_indicators = {
     "struct Nuitka_CellObject *": "c",
     "nuitka_bool": "b",
     "nuitka_ilong": "L",
+    "nuitka_ifloat": "F",
 }
 
 
@@ -122,6 +123,11 @@ class CTypeBase(object):
         # Need to overload this for each type it is used for, pylint: disable=unused-argument
         assert False, cls.c_type
 
+    @classmethod
+    def getTempReleaseCode(cls, tmp_name):
+        """ Get release code for an owned temporary value. """
+        return "Py_DECREF(%s);" % tmp_name
+
     @classmethod
     def getReleaseCode(cls, variable_code_name, needs_check, emit):
         """ Get release code for given object.
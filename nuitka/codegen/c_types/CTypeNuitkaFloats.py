@@ -0,0 +1,44 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_ifloat, a struct to represent float values.
+
+Works like "nuitka_ilong", with a C double value, that every float object has.
+"""
+
+import math
+
+from .CTypeNuitkaInts import CTypeNuitkaNumberStructBase
+
+
+class CTypeNuitkaFloatStruct(CTypeNuitkaNumberStructBase):
+    c_type = "nuitka_ifloat"
+
+    helper_code = "IFLOAT"
+
+    @classmethod
+    def emitAssignmentCodeFromConstant(cls, to_name, constant, emit, context):
+        # There are no C literals for these, use the object.
+        if math.isinf(constant) or math.isnan(constant):
+            constant_code = context.getConstantCode(constant)
+
+            emit("Py_INCREF(%s);" % constant_code)
+            emit("SET_IFLOAT_FROM_OBJECT(&%s, %s);" % (to_name, constant_code))
+        else:
+            emit("SET_IFLOAT_FROM_CDOUBLE(&%s, %r);" % (to_name, constant))
+
+        context.addCleanupTempName(to_name)
@@ -15,62 +15,87 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 #
-""" CType classes for nuitka_ilong, an struct to represent long values.
+""" CType classes for nuitka_ilong, a struct to represent long values.
 
+The struct holds a C long value and/or the object, which is only created when
+needed. Values that do not fit into a C long are held as object only, and
+operations fall back to the object operation for these, so there is no need to
+prove a range of values at compile time.
 """
 
 
-from nuitka.codegen.templates.CodeTemplatesVariables import (
-    template_release_clear,
-    template_release_unclear,
-)
-
 from .CTypeBases import CTypeBase
 
 
-class CTypeNuitkaIntOrLongStruct(CTypeBase):
-    c_type = "nuitka_ilong"
+class CTypeNuitkaNumberStructBase(CTypeBase):
+    """ Base for unboxed number structs, with a C value and a lazy object.
+
+        The struct is valid for value, object, or both, and owns the object,
+        if it has one. The C helpers are named after the "helper_code".
+    """
+
+    # For overload.
+    helper_code = None
+
+    @classmethod
+    def _getFieldName(cls, field):
+        return "%s_%s" % (cls.helper_code.lower(), field)
 
     @classmethod
     def emitVariableAssignCode(
         cls, value_name, needs_release, tmp_name, ref_count, in_place, emit, context
     ):
-        assert not in_place
+        # The value is computed outside of the variable for these types, so
+        # this is not different for in-place assignments.
+        # pylint: disable=unused-argument
 
-        if tmp_name.c_type == "nuitka_bool":
-            assert False
+        if needs_release is not False:
+            cls.getReleaseCode(
+                variable_code_name=value_name, needs_check=True, emit=emit
+            )
 
-            emit("%s = %s;" % (value_name, tmp_name))
-        else:
-            if tmp_name.c_type == "PyObject *":
-                emit("%s.validity = NUITKA_ILONG_OBJECT_VALID;" % value_name)
+        if tmp_name.c_type == cls.c_type:
+            # These temporary values always own their object.
+            assert ref_count, tmp_name
 
-                emit("%s.ilong_object = %s;" % (value_name, tmp_name))
+            emit("%s = %s;" % (value_name, tmp_name))
+        elif tmp_name.c_type == "PyObject *":
+            if not ref_count:
+                emit("Py_INCREF(%s);" % tmp_name)
 
-                if ref_count:
-                    emit("/* REFCOUNT ? */")
-            else:
-                assert False, tmp_name
+            emit(
+                "SET_%s_FROM_OBJECT(&%s, %s);" % (cls.helper_code, value_name, tmp_name)
+            )
+        else:
+            assert False, tmp_name
 
     @classmethod
     def getLocalVariableInitTestCode(cls, value_name, inverted):
-        assert False, "TODO"
-
-        return "%s %s NUITKA_BOOL_UNASSIGNED" % (value_name, "==" if inverted else "!=")
+        return "%s.validity %s NUITKA_%s_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!=",
+            cls.helper_code,
+        )
 
     @classmethod
     def getTruthCheckCode(cls, value_name):
-        assert False, "TODO"
-
-        return "%s == NUITKA_BOOL_TRUE" % value_name
+        return "CHECK_IF_TRUE_%s(&%s)" % (cls.helper_code, value_name)
 
     @classmethod
     def emitTruthCheckCode(cls, to_name, value_name, needs_check, emit, context):
-        # pylint: disable=unused-argument
-        assert False, "TODO"
-
+        # Cannot fail for these types, pylint: disable=unused-argument
         emit("%s = %s ? 1 : 0;" % (to_name, cls.getTruthCheckCode(value_name)))
 
+    @classmethod
+    def emitAssignmentCodeToNuitkaBool(
+        cls, to_name, value_name, needs_check, emit, context
+    ):
+        # Cannot fail for these types, pylint: disable=unused-argument
+        emit(
+            "%s = %s ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
+            % (to_name, cls.getTruthCheckCode(value_name))
+        )
+
     @classmethod
     def emitValueAccessCode(cls, value_name, emit, context):
         # Nothing to do for this type, pylint: disable=unused-argument
@@ -79,67 +104,90 @@ class CTypeNuitkaIntOrLongStruct(CTypeBase):
     @classmethod
     def emitValueAssertionCode(cls, value_name, emit, context):
         # Not using the context, pylint: disable=unused-argument
-        emit("assert(%s.validity != NUITKA_ILONG_UNASSIGNED);" % value_name)
+        emit(
+            "assert(%s);" % cls.getLocalVariableInitTestCode(value_name, inverted=False)
+        )
 
     @classmethod
     def emitAssignConversionCode(cls, to_name, value_name, needs_check, emit, context):
-        assert False, "TODO"
+        # Conversions to these types cannot fail, pylint: disable=unused-argument
 
         if value_name.c_type == cls.c_type:
-            emit("%s = %s;" % (to_name, value_name))
-        else:
-            value_name.getCType().emitAssignmentCodeToNuitkaBool(
-                to_name=to_name,
-                value_name=value_name,
-                needs_check=needs_check,
-                emit=emit,
-                context=context,
+            emit("COPY_%s(&%s, &%s);" % (cls.helper_code, to_name, value_name))
+        elif value_name.c_type == "PyObject *":
+            emit("Py_INCREF(%s);" % value_name)
+            emit(
+                "SET_%s_FROM_OBJECT(&%s, %s);" % (cls.helper_code, to_name, value_name)
             )
+        else:
+            assert False, value_name
+
+        # The value owns its object now.
+        context.addCleanupTempName(to_name)
+
+    @classmethod
+    def emitAssignConversionCodeToObject(cls, to_name, value_name, emit):
+        """ Assign the object of the value to a "PyObject *" borrowing it. """
+
+        emit("ENFORCE_%s_OBJECT_VALUE(&%s);" % (cls.helper_code, value_name))
+        emit("%s = %s.%s;" % (to_name, value_name, cls._getFieldName("object")))
+
+    @classmethod
+    def getFrameAttachCode(cls, value_name):
+        """ Expression for the object to attach to a frame, or NULL. """
+
+        return "GET_%s_OBJECT(&%s)" % (cls.helper_code, value_name)
 
     @classmethod
     def getInitValue(cls, init_from):
         if init_from is None:
-            # TODO: In debug mode, use more crash prone maybe.
-            return "{NUITKA_ILONG_UNASSIGNED, NULL, 0}"
+            return "nuitka_%s_unassigned" % cls.helper_code.lower()
         else:
             assert False, init_from
             return init_from
 
     @classmethod
     def getReleaseCode(cls, variable_code_name, needs_check, emit):
-        emit(
-            "if ((%s.validity & NUITKA_ILONG_OBJECT_VALID) == NUITKA_ILONG_OBJECT_VALID) {"
-            % variable_code_name
-        )
-
-        if needs_check:
-            template = template_release_unclear
-        else:
-            template = template_release_clear
-
-        emit(template % {"identifier": "%s.ilong_object" % variable_code_name})
+        # Releasing an unassigned value does nothing, so no check needed.
+        # pylint: disable=unused-argument
+        emit("RELEASE_%s(&%s);" % (cls.helper_code, variable_code_name))
 
-        emit("}")
+    @classmethod
+    def getTempReleaseCode(cls, tmp_name):
+        return "RELEASE_%s(&%s);" % (cls.helper_code, tmp_name)
 
     @classmethod
     def getDeleteObjectCode(
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
-        assert False, "TODO"
+        if needs_check and not tolerant:
+            emit(
+                "%s = %s;"
+                % (
+                    to_name,
+                    cls.getLocalVariableInitTestCode(value_name, inverted=False),
+                )
+            )
 
-        if not needs_check:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        elif tolerant:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        else:
-            emit("%s = %s == NUITKA_BOOL_UNASSIGNED;" % (to_name, value_name))
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
+        cls.getReleaseCode(variable_code_name=value_name, needs_check=True, emit=emit)
+
+
+class CTypeNuitkaIntOrLongStruct(CTypeNuitkaNumberStructBase):
+    c_type = "nuitka_ilong"
+
+    helper_code = "ILONG"
 
     @classmethod
-    def emitAssignmentCodeFromBoolCondition(cls, to_name, condition, emit):
-        assert False, "TODO"
+    def emitAssignmentCodeFromConstant(cls, to_name, constant, emit, context):
+        # Only values that surely fit a C long, which is 32 bits on some
+        # platforms, the rest is taken as an object. On Python2, "long"
+        # values must stay objects, they are a different type.
+        if type(constant) is int and -(2 ** 31) < constant < 2 ** 31:
+            emit("SET_ILONG_FROM_CLONG(&%s, %dL);" % (to_name, constant))
+        else:
+            constant_code = context.getConstantCode(constant)
 
-        emit(
-            "%(to_name)s = (%(condition)s) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
-            % {"to_name": to_name, "condition": condition}
-        )
+            emit("Py_INCREF(%s);" % constant_code)
+            emit("SET_ILONG_FROM_OBJECT(&%s, %s);" % (to_name, constant_code))
+
+        context.addCleanupTempName(to_name)
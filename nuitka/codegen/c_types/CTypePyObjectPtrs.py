@@ -196,10 +196,10 @@ class CTypePyObjectPtr(CPythonPyObjectPtrBase):
                 to_name=to_name,
                 emit=emit,
             )
-        elif value_name.c_type == "nuitka_ilong":
-            emit("ENFORCE_ILONG_OBJECT_VALUE(&%s);" % value_name)
-
-            emit("%s = %s.ilong_object;" % (to_name, value_name))
+        elif value_name.c_type in ("nuitka_ilong", "nuitka_ifloat"):
+            value_name.getCType().emitAssignConversionCodeToObject(
+                to_name=to_name, value_name=value_name, emit=emit
+            )
         else:
             assert False, to_name.c_type
 
@@ -309,6 +309,16 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d(PyObject *called, PyObject **arg
         );
     }
 
+#if PYTHON_VERSION >= 380
+    // Built-in functions and method descriptors with "METH_FASTCALL" and
+    // others supporting vectorcall, need no arguments tuple.
+    vectorcallfunc vector_call = _PyVectorcall_Function(called);
+
+    if (vector_call != NULL) {
+        return CALL_FUNCTION_VECTORCALL(called, vector_call, args, %(args_count)d);
+    }
+#endif
+
     PyObject *pos_args = MAKE_TUPLE(args, %(args_count)d);
 
     PyObject *result = CALL_FUNCTION(called, pos_args, NULL);
@@ -435,7 +445,28 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d(PyObject *source, PyObject *attr_n
                 Py_DECREF(descr);
 
                 return result;
-            } else {
+            }
+#if PYTHON_VERSION >= 380
+            else if (Py_TYPE(descr) == &PyMethodDescr_Type) {
+                // Method descriptors take the object as first argument, no
+                // need to create a bound method object.
+                PyObject *method_args[%(args_count)d + 1];
+                method_args[0] = source;
+                memcpy(method_args + 1, args, %(args_count)d * sizeof(PyObject *));
+
+                PyObject *result = CALL_FUNCTION_VECTORCALL(
+                    descr,
+                    _PyVectorcall_Function(descr),
+                    method_args,
+                    %(args_count)d + 1
+                );
+
+                Py_DECREF(descr);
+
+                return result;
+            }
+#endif
+            else {
                 PyObject *called_object = func(descr, source, (PyObject *)type);
                 CHECK_OBJECT(called_object);
 
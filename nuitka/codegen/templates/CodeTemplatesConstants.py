@@ -32,6 +32,8 @@ PyObject *Nuitka_dunder_compiled_value = NULL;
 
 %(constant_declarations)s
 
+%(constant_groups)s
+
 static void _createGlobalConstants(void) {
     NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
     NUITKA_MAY_BE_UNUSED PyTracebackObject *exception_tb;
@@ -145,6 +147,27 @@ void createGlobalConstants(void) {
 }
 """
 
+template_constants_group = """
+// Shared constants only used by modules not loaded at program start, created
+// when the first of these is imported.
+static bool constants_group_created_%(group_index)d = false;
+
+void createConstantsGroup_%(group_index)d(void) {
+    if (constants_group_created_%(group_index)d) {
+        return;
+    }
+
+%(group_inits)s
+
+    constants_group_created_%(group_index)d = true;
+}
+"""
+
+template_constants_group_check = """\
+if (constants_group_created_%(group_index)d) {
+%(group_checks)s
+}"""
+
 from . import TemplateDebugWrapper  # isort:skip
 
 TemplateDebugWrapper.checkDebug(globals())
@@ -21,7 +21,7 @@
 
 # Frame in a function
 template_frame_guard_full_block = """\
-MAKE_OR_REUSE_FRAME(%(frame_cache_identifier)s, %(code_identifier)s, %(module_identifier)s, %(locals_size)s);
+MAKE_OR_REUSE_POOLED_FRAME(%(frame_cache_identifier)s, %(frame_pool_identifier)s, %(code_identifier)s, %(module_identifier)s, %(locals_size)s);
 %(frame_identifier)s = %(frame_cache_identifier)s;
 
 // Push the new frame as the currently active one.
@@ -79,11 +79,8 @@ else if (%(exception_tb)s->tb_frame != &%(frame_identifier)s->m_frame) {
 // Attachs locals to frame if any.
 %(attach_locals)s
 
-// Release cached frame.
-if (%(frame_identifier)s == %(frame_cache_identifier)s) {
-    Py_DECREF(%(frame_identifier)s);
-}
-%(frame_cache_identifier)s = NULL;
+// Release cached or pooled frame.
+RELEASE_POOLED_FRAME(&%(frame_cache_identifier)s, &%(frame_pool_identifier)s, %(frame_identifier)s);
 
 assertFrameObject(%(frame_identifier)s);
 
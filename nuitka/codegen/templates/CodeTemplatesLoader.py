@@ -37,7 +37,7 @@ template_metapath_loader_body = """\
 
 /* Table for lookup to find compiled or bytecode modules included in this
  * binary or module, or put along this binary as extension modules. We do
- * our own loading for each of these.
+ * our own loading for each of these. Sorted by name, for binary search.
  */
 %(metapath_module_decls)s
 static struct Nuitka_MetaPathBasedLoaderEntry meta_path_loader_entries[] =
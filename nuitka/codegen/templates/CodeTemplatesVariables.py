@@ -169,16 +169,25 @@ template_read_shared_known = """\
 """
 
 # For module variable values, need to lookup in module dictionary or in
-# built-in dictionary.
+# built-in dictionary. Each access has its own cache, which is valid as long
+# as the dictionary version tags do not change.
 
 # TODO: Only provide fallback for known actually possible values. Do this
 # by keeping track of things that were added by "site.py" mechanisms. Then
 # we can avoid the second call entirely for most cases.
 template_read_mvar_unclear = """\
-%(tmp_name)s = GET_STRING_DICT_VALUE(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s);
+{
+    static struct Nuitka_ModuleVariableCache cache;
+    %(tmp_name)s = GET_MODULE_VARIABLE_VALUE_CACHED(moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, &cache);
+}
+"""
 
-if (unlikely(%(tmp_name)s == NULL)) {
-    %(tmp_name)s = GET_STRING_DICT_VALUE(dict_builtin, (Nuitka_StringObject *)%(var_name)s);
+# Attribute lookups have their own cache too, valid for the type seen last,
+# as long as its version tag does not change.
+template_attribute_lookup_cached = """\
+{
+    static struct Nuitka_AttributeLookupCache cache;
+    %(to_name)s = LOOKUP_ATTRIBUTE_CACHED(%(source_name)s, %(attribute_name)s, &cache);
 }
 """
 
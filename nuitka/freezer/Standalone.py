@@ -48,7 +48,7 @@ from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.Execution import withEnvironmentPathAdded
+from nuitka.utils.Execution import getEnvironmentWithPathAdded
 from nuitka.utils.FileOperations import (
     areSamePaths,
     deleteFile,
@@ -58,17 +58,22 @@ from nuitka.utils.FileOperations import (
     isPathBelow,
     listDir,
     makePath,
+    renameFile,
     withFileLock,
 )
+from nuitka.utils.Hashing import Hash, getFileContentsHash
 from nuitka.utils.ModuleNames import ModuleName
 from nuitka.utils.SharedLibraries import (
+    ElfFileError,
     callInstallNameTool,
+    getElfDynamicInformation,
     getPEFileInformation,
     getWindowsDLLVersion,
+    removeElfRPATH,
     removeSxsFromDLL,
 )
 from nuitka.utils.ThreadedExecutor import ThreadPoolExecutor, waitWorkers
-from nuitka.utils.Timing import TimerReport
+from nuitka.utils.Timing import TimerReport, withPhaseReport
 from nuitka.utils.Utils import getArchitecture
 
 from .DependsExe import getDependsExePath
@@ -559,32 +564,65 @@ _detected_python_rpath = None
 ldd_result_cache = {}
 
 
-def _detectBinaryPathDLLsPosix(dll_filename):
-    # This is complex, as it also includes the caching mechanism
-    # pylint: disable=too-many-branches
+# Do not include kernel / glibc specific libraries. This list has been
+# assembled by looking what are the most common .so files provided by
+# glibc packages from ArchLinux, Debian Stretch and CentOS.
+#
+# Online sources:
+#  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
+#  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
+#  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
+#  - https://packages.debian.org/stretch/amd64/libc6/filelist
+#
+# Note: This list may still be incomplete. Some additional libraries
+# might be provided by glibc - it may vary between the package versions
+# and between Linux distros. It might or might not be a problem in the
+# future, but it should be enough for now.
+_glibc_dll_prefixes = (
+    "ld-linux-x86-64.so",
+    "libc.so.",
+    "libpthread.so.",
+    "libm.so.",
+    "libdl.so.",
+    "libBrokenLocale.so.",
+    "libSegFault.so",
+    "libanl.so.",
+    "libcidn.so.",
+    "libcrypt.so.",
+    "libmemusage.so",
+    "libmvec.so.",
+    "libnsl.so.",
+    "libnss_compat.so.",
+    "libnss_db.so.",
+    "libnss_dns.so.",
+    "libnss_files.so.",
+    "libnss_hesiod.so.",
+    "libnss_nis.so.",
+    "libnss_nisplus.so.",
+    "libpcprofile.so",
+    "libresolv.so.",
+    "librt.so.",
+    "libthread_db-1.0.so",
+    "libthread_db.so.",
+    "libutil.so.",
+)
 
-    if ldd_result_cache.get(dll_filename):
-        return ldd_result_cache[dll_filename]
 
+def _isGlibcDLL(filename):
+    return os.path.basename(filename).startswith(_glibc_dll_prefixes)
+
+
+def _getLddResult(dll_filename, ldd_env):
     # Ask "ldd" about the libraries being used by the created binary, these
     # are the ones that interest us.
     result = set()
 
-    # This is the rpath of the Python binary, which will be effective when
-    # loading the other DLLs too. This happens at least for Python installs
-    # on Travis. pylint: disable=global-statement
-    global _detected_python_rpath
-    if _detected_python_rpath is None and not Utils.isPosixWindows():
-        _detected_python_rpath = getSharedLibraryRPATH(sys.executable) or False
-
-        if _detected_python_rpath:
-            _detected_python_rpath = _detected_python_rpath.replace(
-                b"$ORIGIN", os.path.dirname(sys.executable).encode("utf-8")
-            )
-
-    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
+    with TimerReport("Running ldd for %s took %%.2f seconds" % dll_filename):
         process = subprocess.Popen(
-            args=["ldd", dll_filename], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            args=["ldd", dll_filename],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=ldd_env,
         )
 
         stdout, _stderr = process.communicate()
@@ -613,53 +651,310 @@ def _detectBinaryPathDLLsPosix(dll_filename):
             if filename in ("not found", "ldd"):
                 continue
 
-            # Do not include kernel / glibc specific libraries. This list has been
-            # assembled by looking what are the most common .so files provided by
-            # glibc packages from ArchLinux, Debian Stretch and CentOS.
-            #
-            # Online sources:
-            #  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
-            #  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
-            #  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
-            #  - https://packages.debian.org/stretch/amd64/libc6/filelist
-            #
-            # Note: This list may still be incomplete. Some additional libraries
-            # might be provided by glibc - it may vary between the package versions
-            # and between Linux distros. It might or might not be a problem in the
-            # future, but it should be enough for now.
-            if os.path.basename(filename).startswith(
-                (
-                    "ld-linux-x86-64.so",
-                    "libc.so.",
-                    "libpthread.so.",
-                    "libm.so.",
-                    "libdl.so.",
-                    "libBrokenLocale.so.",
-                    "libSegFault.so",
-                    "libanl.so.",
-                    "libcidn.so.",
-                    "libcrypt.so.",
-                    "libmemusage.so",
-                    "libmvec.so.",
-                    "libnsl.so.",
-                    "libnss_compat.so.",
-                    "libnss_db.so.",
-                    "libnss_dns.so.",
-                    "libnss_files.so.",
-                    "libnss_hesiod.so.",
-                    "libnss_nis.so.",
-                    "libnss_nisplus.so.",
-                    "libpcprofile.so",
-                    "libresolv.so.",
-                    "librt.so.",
-                    "libthread_db-1.0.so",
-                    "libthread_db.so.",
-                    "libutil.so.",
+            if _isGlibcDLL(filename):
+                continue
+
+            result.add(filename)
+
+    return result
+
+
+_ldconfig_dlls = None
+
+
+def _getLdconfigDLLs():
+    """ Map of DLL names to filenames known to the loader cache. """
+
+    # singleton, pylint: disable=global-statement
+    global _ldconfig_dlls
+
+    if _ldconfig_dlls is None:
+        _ldconfig_dlls = {}
+
+        try:
+            process = subprocess.Popen(
+                args=["/sbin/ldconfig", "-p"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError:
+            # Not all systems have it, e.g. with "musl" there is no cache.
+            return _ldconfig_dlls
+
+        stdout, _stderr = process.communicate()
+
+        for line in stdout.splitlines()[1:]:
+            if b" => " not in line:
+                continue
+
+            left, right = line.strip().split(b" => ", 1)
+            dll_name = left.split(b" (", 1)[0]
+
+            _ldconfig_dlls.setdefault(dll_name, []).append(right)
+
+    return _ldconfig_dlls
+
+
+def _expandElfSearchDirectory(directory, binary_filename, is_64bit):
+    # Dynamic string tokens, as the loader expands them, "$PLATFORM" is not
+    # supported, and such directories are ignored.
+    origin = os.path.dirname(os.path.abspath(binary_filename))
+
+    if str is not bytes:
+        origin = origin.encode("utf-8")
+
+    for token, value in (
+        (b"ORIGIN", origin),
+        (b"LIB", b"lib64" if is_64bit else b"lib"),
+    ):
+        directory = directory.replace(b"${" + token + b"}", value)
+        directory = directory.replace(b"$" + token, value)
+
+    if b"$" in directory:
+        return None
+
+    return directory
+
+
+_elf_info_cache = {}
+
+
+def _getElfDynamicInformation(filename):
+    if filename not in _elf_info_cache:
+        _elf_info_cache[filename] = getElfDynamicInformation(filename)
+
+    return _elf_info_cache[filename]
+
+
+def _isCompatibleElfFile(filename, arch):
+    try:
+        return _getElfDynamicInformation(filename)["arch"] == arch
+    except (ElfFileError, IOError, OSError):
+        return False
+
+
+def _resolveElfDLL(dll_name, binary_filename, elf_info, rpath, library_path):
+    # Search like the loader does it, see "man ld.so" for the rules.
+    if b"/" in dll_name:
+        candidates = [dll_name]
+    else:
+        search_dirs = []
+
+        # The "RPATH" is only used, if there is no "RUNPATH".
+        if not elf_info["runpath"]:
+            search_dirs += rpath
+
+        search_dirs += library_path
+        search_dirs += elf_info["runpath"]
+
+        candidates = []
+
+        for search_dir in search_dirs:
+            search_dir = _expandElfSearchDirectory(
+                search_dir, binary_filename, elf_info["arch"][0]
+            )
+
+            if search_dir:
+                candidates.append(os.path.join(search_dir, dll_name))
+
+        candidates += _getLdconfigDLLs().get(dll_name, ())
+
+        for default_dir in (b"/lib64", b"/usr/lib64", b"/lib", b"/usr/lib"):
+            candidates.append(os.path.join(default_dir, dll_name))
+
+    for candidate in candidates:
+        if python_version >= 300:
+            candidate = candidate.decode("utf-8")
+
+        if os.path.isfile(candidate) and _isCompatibleElfFile(
+            candidate, elf_info["arch"]
+        ):
+            return os.path.normpath(os.path.abspath(candidate))
+
+    return None
+
+
+def _getElfResult(dll_filename, ldd_env):
+    """ Find the DLLs used by an ELF binary, without running "ldd".
+
+    Gives the same result as "_getLddResult", but reads the dynamic section
+    of the binaries, and searches the DLLs like the loader does.
+    """
+
+    library_path = [
+        path.encode("utf-8") if str is not bytes else path
+        for path in ldd_env.get("LD_LIBRARY_PATH", "").split(os.pathsep)
+        if path
+    ]
+
+    result = set()
+
+    def addDependencies(binary_filename, rpath):
+        elf_info = _getElfDynamicInformation(binary_filename)
+
+        # The "RPATH" of the loading binaries applies to all it loads, unless
+        # there is a "RUNPATH".
+        if not elf_info["runpath"]:
+            for search_dir in elf_info["rpath"]:
+                search_dir = _expandElfSearchDirectory(
+                    search_dir, binary_filename, elf_info["arch"][0]
                 )
-            ):
+
+                if search_dir:
+                    rpath = rpath + [search_dir]
+
+        for dll_name in elf_info["needed"]:
+            # The loader itself is not shown by "ldd" as a dependency.
+            if dll_name.startswith((b"ld-linux", b"ld64.so", b"ld.so")):
+                continue
+
+            filename = _resolveElfDLL(
+                dll_name=dll_name,
+                binary_filename=binary_filename,
+                elf_info=elf_info,
+                rpath=rpath,
+                library_path=library_path,
+            )
+
+            if filename is None or filename in result or _isGlibcDLL(filename):
                 continue
 
             result.add(filename)
+            addDependencies(filename, rpath)
+
+    addDependencies(dll_filename, [])
+
+    return result
+
+
+def _getDLLDependencies(dll_filename, ldd_env):
+    if Utils.getOS() == "Linux":
+        try:
+            return _getElfResult(dll_filename, ldd_env)
+        except ElfFileError:
+            # Not an ELF file we understand, let "ldd" deal with it.
+            pass
+
+    return _getLddResult(dll_filename, ldd_env)
+
+
+def _getLddCacheFilename(dll_filename, ldd_env):
+    hash_value = Hash()
+
+    # The result of "ldd" depends on the binary, the library search path, and
+    # the system libraries known to the loader.
+    dll_stat = os.stat(dll_filename)
+
+    hash_value.updateFromValues(
+        sys.version,
+        sys.executable,
+        os.path.abspath(dll_filename),
+        dll_stat.st_size,
+        dll_stat.st_mtime,
+        dll_stat.st_ino,
+        ldd_env.get("LD_LIBRARY_PATH", ""),
+    )
+
+    if os.path.exists("/etc/ld.so.cache"):
+        hash_value.updateFromValues(os.stat("/etc/ld.so.cache").st_mtime)
+
+    cache_dir = os.path.join(getCacheDir(), "library_deps", "ldd")
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, hash_value.asHexDigest())
+
+
+def _getLddCacheDependenciesHash(dll_filenames):
+    hash_value = Hash()
+
+    for dll_filename in sorted(dll_filenames):
+        try:
+            dll_stat = os.stat(dll_filename)
+        except OSError:
+            # Removed DLLs make the result outdated too.
+            return None
+
+        hash_value.updateFromValues(
+            dll_filename, dll_stat.st_size, dll_stat.st_mtime, dll_stat.st_ino
+        )
+
+    return hash_value.asHexDigest()
+
+
+def _getLddResultCached(dll_filename, use_cache, update_cache):
+    # This runs in threads, so the environment of the process must not be
+    # modified for it.
+    ldd_env = getEnvironmentWithPathAdded("LD_LIBRARY_PATH", _detected_python_rpath)
+
+    if not use_cache and not update_cache:
+        return _getDLLDependencies(dll_filename, ldd_env)
+
+    cache_filename = _getLddCacheFilename(dll_filename, ldd_env)
+
+    if use_cache and os.path.exists(cache_filename):
+        cache_contents = getFileContents(cache_filename, "rb")
+
+        if str is not bytes:
+            cache_contents = cache_contents.decode("utf8")
+
+        cache_lines = [line for line in cache_contents.split("\n") if line]
+
+        # The first line is the hash of the found DLLs, the result is outdated
+        # if any of them was changed, as their dependencies are included too.
+        if cache_lines and cache_lines[0] == _getLddCacheDependenciesHash(
+            cache_lines[1:]
+        ):
+            return set(cache_lines[1:])
+
+    result = _getDLLDependencies(dll_filename, ldd_env)
+
+    if not update_cache:
+        return result
+
+    dependencies_hash = _getLddCacheDependenciesHash(result)
+
+    # DLLs removed meanwhile, the result is not worth keeping then.
+    if dependencies_hash is None:
+        return result
+
+    cache_contents = "\n".join([dependencies_hash] + sorted(result))
+
+    if str is not bytes:
+        cache_contents = cache_contents.encode("utf8")
+
+    # Write to a temporary file first, other threads or compilations may
+    # read it at the same time.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with withFileLock("writing ldd cache %s" % cache_filename):
+        with open(temp_filename, "wb") as cache_file:
+            cache_file.write(cache_contents)
+
+        renameFile(temp_filename, cache_filename)
+
+    return result
+
+
+def _detectBinaryPathDLLsPosix(dll_filename, use_cache, update_cache):
+    if ldd_result_cache.get(dll_filename):
+        return ldd_result_cache[dll_filename]
+
+    # This is the rpath of the Python binary, which will be effective when
+    # loading the other DLLs too. This happens at least for Python installs
+    # on Travis. pylint: disable=global-statement
+    global _detected_python_rpath
+    if _detected_python_rpath is None and not Utils.isPosixWindows():
+        _detected_python_rpath = getSharedLibraryRPATH(sys.executable) or False
+
+        if _detected_python_rpath:
+            _detected_python_rpath = _detected_python_rpath.replace(
+                b"$ORIGIN", os.path.dirname(sys.executable).encode("utf-8")
+            )
+
+    result = _getLddResultCached(
+        dll_filename=dll_filename, use_cache=use_cache, update_cache=update_cache
+    )
 
     # Allow plugins to prevent inclusion.
     blocked = Plugins.removeDllDependencies(
@@ -674,7 +969,13 @@ def _detectBinaryPathDLLsPosix(dll_filename):
     sub_result = set(result)
 
     for sub_dll_filename in result:
-        sub_result = sub_result.union(_detectBinaryPathDLLsPosix(sub_dll_filename))
+        sub_result = sub_result.union(
+            _detectBinaryPathDLLsPosix(
+                dll_filename=sub_dll_filename,
+                use_cache=use_cache,
+                update_cache=update_cache,
+            )
+        )
 
     return sub_result
 
@@ -1200,12 +1501,17 @@ def detectBinaryDLLs(
 ):
     """ Detect the DLLs used by a binary.
 
-        Using "ldd" (Linux), "pefile" or "depends.exe" (Windows), or
-        "otool" (macOS) the list of used DLLs is retrieved.
+        Reading the ELF files (Linux) or "ldd" (other POSIX), "pefile" or
+        "depends.exe" (Windows), or "otool" (macOS) the list of used DLLs is
+        retrieved.
     """
 
     if Utils.getOS() in ("Linux", "NetBSD", "FreeBSD") or Utils.isPosixWindows():
-        return _detectBinaryPathDLLsPosix(dll_filename=original_filename)
+        return _detectBinaryPathDLLsPosix(
+            dll_filename=original_filename,
+            use_cache=use_cache,
+            update_cache=update_cache,
+        )
     elif Utils.isWin32Windows() and Options.getWindowsDependencyTool() == "pefile":
         with TimerReport(
             "Finding dependencies for %s took %%.2f seconds" % binary_filename
@@ -1331,25 +1637,15 @@ def fixupBinaryDLLPathsMacOS(binary_filename, dll_map, original_location):
 
 
 def getSharedLibraryRPATH(filename):
-    process = subprocess.Popen(
-        ["readelf", "-d", filename],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=False,
-    )
-
-    stdout, stderr = process.communicate()
-    retcode = process.poll()
+    try:
+        elf_info = getElfDynamicInformation(filename)
+    except (ElfFileError, IOError, OSError) as e:
+        sys.exit("Error reading shared library path for %s, %s" % (filename, e))
 
-    if retcode != 0:
-        sys.exit(
-            "Error reading shared library path for %s, tool said %r"
-            % (filename, stderr)
-        )
+    rpath = elf_info["rpath"] or elf_info["runpath"]
 
-    for line in stdout.split(b"\n"):
-        if b"RPATH" in line or b"RUNPATH" in line:
-            return line[line.find(b"[") + 1 : line.rfind(b"]")]
+    if rpath:
+        return b":".join(rpath)
 
     return None
 
@@ -1361,106 +1657,68 @@ def removeSharedLibraryRPATH(filename):
         if Options.isShowInclusion():
             info("Removing 'RPATH' setting from '%s'.", filename)
 
-        if not Utils.isExecutableCommand("chrpath"):
-            sys.exit(
-                """\
-Error, needs 'chrpath' on your system, due to 'RPATH' settings in used shared
-libraries that need to be removed."""
-            )
-
         os.chmod(filename, int("644", 8))
-        process = subprocess.Popen(
-            ["chrpath", "-d", filename],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=False,
-        )
-        process.communicate()
-        retcode = process.poll()
+        removeElfRPATH(filename)
         os.chmod(filename, int("444", 8))
 
-        assert retcode == 0, filename
-
-
-def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
-    # This is terribly complex, because we check the list of used DLLs
-    # trying to avoid duplicates, and detecting errors with them not
-    # being binary identical, so we can report them. And then of course
-    # we also need to handle OS specifics.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-
-    used_dlls = detectUsedDLLs(
-        source_dir=source_dir,
-        standalone_entry_points=standalone_entry_points,
-        use_cache=not Options.shallNotUseDependsExeCachedResults()
-        and not Options.getWindowsDependencyTool() == "depends.exe",
-        update_cache=not Options.shallNotStoreDependsExeCachedResults()
-        and not Options.getWindowsDependencyTool() == "depends.exe",
-    )
 
-    removed_dlls = set()
+def _removeCollidingDLLs(used_dlls):
+    """ Remove DLLs from "used_dlls" that have the same name as others.
 
-    # Fist make checks and remove some.
-    for dll_filename1, sources1 in tuple(iterItems(used_dlls)):
-        if dll_filename1 in removed_dlls:
-            continue
+    Colliding names are an issue to us, as the DLLs are put in one directory.
+    If they are binary identical, that is no problem, happens at least for
+    OSC and Fedora 20, otherwise we warn about it, unless the Windows file
+    version tells us which to use.
+    """
 
-        for dll_filename2, sources2 in tuple(iterItems(used_dlls)):
-            if dll_filename1 == dll_filename2:
-                continue
+    # Group by name first, only the files that collide are then compared by
+    # their contents, with one hash per file.
+    dlls_by_name = OrderedDict()
 
-            if dll_filename2 in removed_dlls:
-                continue
+    for dll_filename in used_dlls:
+        dlls_by_name.setdefault(os.path.basename(dll_filename), []).append(dll_filename)
 
-            # Colliding basenames are an issue to us.
-            if os.path.basename(dll_filename1) != os.path.basename(dll_filename2):
-                continue
+    identical_count = 0
+    conflict_count = 0
 
-            # May already have been removed earlier
-            if dll_filename1 not in used_dlls:
-                continue
+    for dll_name, dll_filenames in iterItems(dlls_by_name):
+        if len(dll_filenames) == 1:
+            continue
 
-            if dll_filename2 not in used_dlls:
-                continue
+        if Options.isShowInclusion():
+            info(
+                "Colliding DLL names for %s, checking identity of %s."
+                % (dll_name, ", ".join("'%s'" % d for d in dll_filenames))
+            )
 
-            dll_name = os.path.basename(dll_filename1)
+        distinct_dlls = OrderedDict()
 
-            if Options.isShowInclusion():
-                info(
-                    """Colliding DLL names for %s, checking identity of \
-'%s' <-> '%s'."""
-                    % (dll_name, dll_filename1, dll_filename2)
-                )
+        for dll_filename in dll_filenames:
+            content_hash = getFileContentsHash(dll_filename)
 
-            # Check that if a DLL has the same name, if it's identical,
-            # happens at least for OSC and Fedora 20.
-            import filecmp
+            if content_hash in distinct_dlls:
+                del used_dlls[dll_filename]
+                identical_count += 1
+            else:
+                distinct_dlls[content_hash] = dll_filename
 
-            if filecmp.cmp(dll_filename1, dll_filename2):
-                del used_dlls[dll_filename2]
-                removed_dlls.add(dll_filename2)
+        distinct_dlls = list(distinct_dlls.values())
+        dll_filename1 = distinct_dlls[0]
 
-                continue
+        for dll_filename2 in distinct_dlls[1:]:
+            conflict_count += 1
 
             # For Win32 we can check out file versions.
             if Utils.isWin32Windows():
                 dll_version1 = getWindowsDLLVersion(dll_filename1)
                 dll_version2 = getWindowsDLLVersion(dll_filename2)
 
-                if dll_version2 < dll_version1:
-                    del used_dlls[dll_filename2]
-                    removed_dlls.add(dll_filename2)
+                if dll_version1 != dll_version2:
+                    if dll_version1 < dll_version2:
+                        dll_filename1, dll_filename2 = dll_filename2, dll_filename1
 
-                    solved = True
-                elif dll_version1 < dll_version2:
-                    del used_dlls[dll_filename1]
-                    removed_dlls.add(dll_filename1)
-
-                    solved = True
-                else:
-                    solved = False
+                    del used_dlls[dll_filename2]
 
-                if solved:
                     warning(
                         "Ignoring conflicting DLLs for '%s' and using newest file version."
                         % dll_name
@@ -1478,31 +1736,58 @@ different from
                 % (
                     dll_name,
                     dll_filename1,
-                    "\n   ".join(sources1),
+                    "\n   ".join(used_dlls[dll_filename1]),
                     dll_filename2,
-                    "\n   ".join(sources2),
+                    "\n   ".join(used_dlls[dll_filename2]),
                 )
             )
 
             del used_dlls[dll_filename2]
-            removed_dlls.add(dll_filename2)
+
+    if (identical_count or conflict_count) and Options.isShowInclusion():
+        info(
+            "Checked DLL name collisions, removed %d identical and %d conflicting DLLs."
+            % (identical_count, conflict_count)
+        )
+
+
+def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
+    # This is terribly complex, because we check the list of used DLLs
+    # trying to avoid duplicates, and detecting errors with them not
+    # being binary identical, so we can report them. And then of course
+    # we also need to handle OS specifics.
+    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+
+    with withPhaseReport("dll_detection"):
+        used_dlls = detectUsedDLLs(
+            source_dir=source_dir,
+            standalone_entry_points=standalone_entry_points,
+            use_cache=not Options.shallNotUseDependsExeCachedResults()
+            and not Options.getWindowsDependencyTool() == "depends.exe",
+            update_cache=not Options.shallNotStoreDependsExeCachedResults()
+            and not Options.getWindowsDependencyTool() == "depends.exe",
+        )
+
+        # Fist make checks and remove some.
+        _removeCollidingDLLs(used_dlls)
 
     dll_map = []
 
-    for dll_filename, sources in iterItems(used_dlls):
-        dll_name = os.path.basename(dll_filename)
+    with withPhaseReport("dll_copying"):
+        for dll_filename, sources in iterItems(used_dlls):
+            dll_name = os.path.basename(dll_filename)
 
-        target_path = os.path.join(dist_dir, dll_name)
+            target_path = os.path.join(dist_dir, dll_name)
 
-        shutil.copyfile(dll_filename, target_path)
+            shutil.copyfile(dll_filename, target_path)
 
-        dll_map.append((dll_filename, dll_name))
+            dll_map.append((dll_filename, dll_name))
 
-        if Options.isShowInclusion():
-            info(
-                "Included used shared library '%s' (used by %s)."
-                % (dll_filename, ", ".join(sources))
-            )
+            if Options.isShowInclusion():
+                info(
+                    "Included used shared library '%s' (used by %s)."
+                    % (dll_filename, ", ".join(sources))
+                )
 
     if Utils.getOS() == "Darwin":
         # For macOS, the binary and the DLLs needs to be changed to reflect
@@ -35,6 +35,11 @@ from nuitka.utils.FileOperations import listDir, relpath
 from nuitka.utils.ModuleNames import ModuleName
 
 
+# When set to a list, successful recursions are recorded in it, with the
+# arguments needed to repeat them, used for parallel optimization.
+recursion_log = None
+
+
 def logRecursion(*args):
     if Options.isShowInclusion():
         info(*args)
@@ -144,6 +149,11 @@ Cannot recurse to import module '%s' (%s) because code is too complex.""",
 
             return None, False
 
+    if recursion_log is not None:
+        recursion_log.append(
+            (module_package, module_filename, module_relpath, module_kind)
+        )
+
     ImportCache.addImportedModule(module)
 
     return module, True
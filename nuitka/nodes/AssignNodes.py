@@ -30,8 +30,6 @@ the traces.
 
 """
 
-from nuitka.ModuleRegistry import getOwnerFromCodeName
-
 from .NodeBases import StatementBase, StatementChildHavingBase
 from .NodeMakingHelpers import (
     makeStatementExpressionOnlyReplacementNode,
@@ -170,13 +168,14 @@ class StatementAssignmentVariable(StatementChildHavingBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementAssignmentVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = args["owner"]
 
         if args["is_temp"] == "True":
             variable = owner.createTempVariable(args["variable_name"])
         else:
             variable = owner.getProvidedVariable(args["variable_name"])
 
+        del args["variable_name"]
         del args["is_temp"]
         del args["owner"]
 
@@ -487,13 +486,14 @@ class StatementDelVariable(StatementBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementDelVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = args["owner"]
 
         if args["is_temp"] == "True":
             variable = owner.createTempVariable(args["variable_name"])
         else:
             variable = owner.getProvidedVariable(args["variable_name"])
 
+        del args["variable_name"]
         del args["is_temp"]
         del args["owner"]
 
@@ -626,6 +626,7 @@ class StatementReleaseVariable(StatementBase):
     def getDetailsForDisplay(self):
         return {
             "variable_name": self.variable.getName(),
+            "is_temp": self.variable.isTempVariable(),
             "owner": self.variable.getOwner().getCodeName(),
         }
 
@@ -633,10 +634,13 @@ class StatementReleaseVariable(StatementBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementReleaseVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = args["owner"]
         assert owner is not None, args["owner"]
 
-        variable = owner.getProvidedVariable(args["variable_name"])
+        if args["is_temp"] == "True":
+            variable = owner.createTempVariable(args["variable_name"])
+        else:
+            variable = owner.getProvidedVariable(args["variable_name"])
 
         return cls(variable=variable, source_ref=source_ref)
 
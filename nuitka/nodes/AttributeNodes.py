@@ -293,6 +293,16 @@ class ExpressionBuiltinSetattr(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            object_arg=args["source"],
+            name=args["attribute"],
+            value=args["value"],
+            source_ref=source_ref,
+        )
+
     def computeExpression(self, trace_collection):
         trace_collection.onExceptionRaiseExit(BaseException)
 
@@ -315,6 +325,13 @@ class ExpressionBuiltinHasattr(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            object_arg=args["source"], name=args["attribute"], source_ref=source_ref
+        )
+
     def computeExpression(self, trace_collection):
         # We do at least for compile time constants optimization here, but more
         # could be done, were we to know shapes.
@@ -367,6 +384,18 @@ class ExpressionAttributeCheck(ExpressionChildHavingBase):
 
         self.attribute_name = attribute_name
 
+    def getDetails(self):
+        return {"attribute_name": self.attribute_name}
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            object_arg=args["source"],
+            attribute_name=args["attribute_name"],
+            source_ref=source_ref,
+        )
+
     def computeExpression(self, trace_collection):
         # We do at least for compile time constants optimization here, but more
         # could be done, were we to know shapes.
@@ -35,6 +35,9 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
             self, value=value, source_ref=source_ref
         )
 
+    def getTypeShape(self):
+        return self.getValue().getTypeShape().getShapeIterNext()
+
     def computeExpression(self, trace_collection):
         return self.getValue().computeExpressionNext1(
             next_node=self, trace_collection=trace_collection
@@ -51,6 +54,9 @@ class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
 
         # TODO: Unused before 3.5 or higher, maybe specialize for it.
         self.expected = int(expected)
+
+        if type(starred) is str:
+            starred = starred == "True"
         self.starred = starred
 
     def getDetails(self):
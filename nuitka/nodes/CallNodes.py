@@ -25,6 +25,8 @@ There will be a method "computeExpressionCall" to aid predicting them in other
 nodes.
 """
 
+from nuitka.PythonVersions import python_version
+
 from .ExpressionBases import ExpressionChildHavingBase, ExpressionChildrenHavingBase
 
 
@@ -182,6 +184,52 @@ class ExpressionCallEmpty(ExpressionChildHavingBase):
         return ()
 
 
+class ExpressionCallComplex(ExpressionChildrenHavingBase):
+    """ Call with star list and/or star dict arguments.
+
+        The star arguments are converted to tuple and dictionary, and merged
+        with the positional and keyword arguments, at run time by a helper.
+    """
+
+    kind = "EXPRESSION_CALL_COMPLEX"
+
+    # Order of evaluation changed in Python3.5.
+    if python_version >= 350:
+        named_children = ("called", "args", "list_star_arg", "kw", "dict_star_arg")
+    else:
+        named_children = ("called", "args", "kw", "list_star_arg", "dict_star_arg")
+
+    getCalled = ExpressionChildrenHavingBase.childGetter("called")
+    getCallArgs = ExpressionChildrenHavingBase.childGetter("args")
+    getCallKw = ExpressionChildrenHavingBase.childGetter("kw")
+    getStarListArg = ExpressionChildrenHavingBase.childGetter("list_star_arg")
+    getStarDictArg = ExpressionChildrenHavingBase.childGetter("dict_star_arg")
+
+    def __init__(self, called, args, kw, list_star_arg, dict_star_arg, source_ref):
+        assert called.isExpression()
+        assert list_star_arg is not None or dict_star_arg is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={
+                "called": called,
+                "args": args,
+                "kw": kw,
+                "list_star_arg": list_star_arg,
+                "dict_star_arg": dict_star_arg,
+            },
+            source_ref=source_ref,
+        )
+
+    def computeExpression(self, trace_collection):
+        # Any code could be run, note that.
+        trace_collection.onControlFlowEscape(self)
+
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
 def makeExpressionCall(called, args, kw, source_ref):
     """ Make the most simple call node possible.
 
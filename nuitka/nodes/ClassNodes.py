@@ -80,7 +80,19 @@ class ExpressionClassBody(MarkNeedsAnnotationsMixin, ExpressionOutlineFunction):
 
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
-        return cls(provider=provider, source_ref=source_ref, **args)
+        result = cls(
+            provider=provider,
+            name=args["name"],
+            doc=args.get("doc"),
+            source_ref=source_ref,
+        )
+
+        # The body is delayed, it needs the locals scope created here.
+        result.restoreBodyFromXML(
+            outline_id=args.get("outline_id"), body=args.get("body")
+        )
+
+        return result
 
     def getDoc(self):
         return self.doc
@@ -158,6 +170,16 @@ class ExpressionBuiltinType3(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            type_name=args["type_name"],
+            bases=args["bases"],
+            type_dict=args["dict"],
+            source_ref=source_ref,
+        )
+
     def computeExpression(self, trace_collection):
         # TODO: Should be compile time computable if bases and dict are.
 
@@ -52,6 +52,16 @@ class ExpressionBuiltinEval(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            source_code=args["source"],
+            globals_arg=args["globals"],
+            locals_arg=args["locals"],
+            source_ref=source_ref,
+        )
+
     def computeExpression(self, trace_collection):
         # TODO: Attempt for constant values to do it.
         return self, None, None
@@ -158,6 +168,16 @@ class StatementExec(StatementChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            source_code=args["source"],
+            globals_arg=args["globals"],
+            locals_arg=args["locals"],
+            source_ref=source_ref,
+        )
+
     def setChild(self, name, value):
         if name in ("globals", "locals"):
             value = convertNoneConstantToNone(value)
@@ -307,6 +327,13 @@ class ExpressionBuiltinCompile(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        args["source_code"] = args.pop("source")
+
+        return cls(source_ref=source_ref, **args)
+
     def computeExpression(self, trace_collection):
         trace_collection.onExceptionRaiseExit(BaseException)
 
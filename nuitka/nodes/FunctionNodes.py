@@ -30,6 +30,7 @@ classes.
 """
 
 from nuitka import Options, Variables
+from nuitka.ModuleRegistry import getOwnerFromCodeName
 from nuitka.PythonVersions import python_version
 from nuitka.specs.ParameterSpecs import ParameterSpec, TooManyArguments, matchCall
 from nuitka.tree.Extractions import updateVariableUsage
@@ -335,6 +336,16 @@ class ExpressionFunctionBodyBase(
         else:
             return provider.getFunctionQualname() + ".<locals>." + function_name
 
+    def _addQualnameProviderDetails(self, result):
+        # Only when tree building changed it, otherwise it's the provider.
+        if python_version >= 340 and self.qualname_provider is not self.provider:
+            result["qualname_provider"] = self.qualname_provider.getCodeName()
+
+    def _restoreQualnameProvider(self, qualname_provider):
+        # From XML, the provider is given by code name only.
+        if qualname_provider is not None:
+            self.qualname_provider = getOwnerFromCodeName(qualname_provider)
+
     def computeExpression(self, trace_collection):
         assert False
 
@@ -392,6 +403,62 @@ class ExpressionFunctionEntryPointBase(EntryPointMixin, ExpressionFunctionBodyBa
 
         return result
 
+    def getDetailsForDisplay(self):
+        result = {
+            "name": self.getName(),
+            "provider": self.provider.getCodeName(),
+            "flags": "" if self.flags is None else ",".join(sorted(self.flags)),
+        }
+
+        if self.code_object:
+            result.update(self.code_object.getDetails())
+
+        self._addAutoReleaseDetails(result)
+        self._addQualnameProviderDetails(result)
+
+        return result
+
+    def _addAutoReleaseDetails(self, result):
+        if self.auto_release:
+            result["auto_release"] = ",".join(
+                sorted(variable.getName() for variable in self.auto_release)
+            )
+
+    def _restoreAutoReleases(self, auto_release):
+        # From XML, the variables are given by name only.
+        if auto_release:
+            for variable_name in auto_release.split(","):
+                self.removeVariableReleases(self.getProvidedVariable(variable_name))
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        code_object_args = {}
+        other_args = {}
+
+        for key, value in args.items():
+            if key.startswith("co_"):
+                code_object_args[key] = value
+            elif key == "code_flags":
+                code_object_args["future_spec"] = fromFlags(args["code_flags"])
+            else:
+                other_args[key] = value
+
+        auto_release = other_args.pop("auto_release", None)
+        qualname_provider = other_args.pop("qualname_provider", None)
+
+        result = cls(
+            provider=provider,
+            code_object=CodeObjectSpec(**code_object_args),
+            auto_release=None,
+            source_ref=source_ref,
+            **other_args
+        )
+
+        result._restoreAutoReleases(auto_release)
+        result._restoreQualnameProvider(qualname_provider)
+
+        return result
+
     def getFunctionLocalsScope(self):
         if self.locals_dict_name is None:
             return None
@@ -545,7 +612,7 @@ class ExpressionFunctionBody(
         result = {
             "name": self.getFunctionName(),
             "provider": self.provider.getCodeName(),
-            "flags": self.flags,
+            "flags": "" if self.flags is None else ",".join(sorted(self.flags)),
         }
 
         result.update(self.parameters.getDetails())
@@ -556,6 +623,9 @@ class ExpressionFunctionBody(
         if self.doc is not None:
             result["doc"] = self.doc
 
+        self._addAutoReleaseDetails(result)
+        self._addQualnameProviderDetails(result)
+
         return result
 
     @classmethod
@@ -584,14 +654,23 @@ class ExpressionFunctionBody(
         if "doc" not in other_args:
             other_args["doc"] = None
 
-        return cls(
+        auto_release = other_args.pop("auto_release", None)
+        qualname_provider = other_args.pop("qualname_provider", None)
+
+        result = cls(
             provider=provider,
             parameters=parameters,
             code_object=code_object,
+            auto_release=None,
             source_ref=source_ref,
             **other_args
         )
 
+        result._restoreAutoReleases(auto_release)
+        result._restoreQualnameProvider(qualname_provider)
+
+        return result
+
     def getParent(self):
         assert False
 
@@ -908,10 +987,14 @@ class ExpressionFunctionRef(ExpressionBase):
 
         addUsedModule(owning_module)
 
+        trace_collection.onUsedFunction(function_body)
+
         needs_visit = owning_module.addUsedFunction(function_body)
 
         if needs_visit:
-            function_body.computeFunctionRaw(trace_collection)
+            from nuitka.optimizations.FunctionWorklist import computeFunction
+
+            computeFunction(function_body, trace_collection)
 
         # TODO: Function collection may now know something.
         return self, None, None
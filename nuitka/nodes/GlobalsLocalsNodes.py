@@ -64,6 +64,12 @@ class ExpressionBuiltinLocalsBase(ExpressionBase):
         del self.locals_scope
         del self.variable_traces
 
+    def getDetails(self):
+        return {"locals_scope": self.locals_scope}
+
+    def getDetailsForDisplay(self):
+        return {"locals_scope": self.locals_scope.getCodeName()}
+
     def mayHaveSideEffects(self):
         return False
 
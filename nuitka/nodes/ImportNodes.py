@@ -468,6 +468,21 @@ class StatementImportStar(StatementChildHavingBase):
         if type(self.target_scope) is GlobalsDictHandle:
             self.target_scope.markAsEscaped()
 
+    def getDetails(self):
+        return {"target_scope": self.target_scope}
+
+    def getDetailsForDisplay(self):
+        return {"target_scope": self.target_scope.getCodeName()}
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            target_scope=args["target_scope"],
+            module_import=args["module"],
+            source_ref=source_ref,
+        )
+
     def getTargetDictScope(self):
         return self.target_scope
 
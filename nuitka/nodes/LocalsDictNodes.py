@@ -62,6 +62,12 @@ class ExpressionLocalsVariableRefOrFallback(ExpressionChildHavingBase):
             "variable_name": self.getVariableName(),
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope": self.locals_scope.getCodeName(),
+            "variable_name": self.getVariableName(),
+        }
+
     def getVariableName(self):
         return self.variable.getName()
 
@@ -220,7 +226,10 @@ class ExpressionLocalsVariableRef(ExpressionBase):
         }
 
     def getDetailsForDisplay(self):
-        return {"variable_name": self.getVariableName()}
+        return {
+            "variable_name": self.getVariableName(),
+            "locals_scope": self.locals_scope.getCodeName(),
+        }
 
     def getVariableName(self):
         return self.variable.getName()
@@ -308,6 +317,12 @@ class ExpressionLocalsVariableCheck(ExpressionBase):
     def getDetails(self):
         return {"locals_scope": self.locals_scope, "variable_name": self.variable_name}
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope": self.locals_scope.getCodeName(),
+            "variable_name": self.variable_name,
+        }
+
     def getVariableName(self):
         return self.variable_name
 
@@ -357,6 +372,12 @@ class StatementLocalsDictOperationSet(StatementChildHavingBase):
             "variable_name": self.getVariableName(),
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope": self.locals_scope.getCodeName(),
+            "variable_name": self.getVariableName(),
+        }
+
     def getVariableName(self):
         return self.variable.getName()
 
@@ -439,6 +460,9 @@ class StatementLocalsDictOperationDel(StatementBase):
         self.variable = locals_scope.getLocalsDictVariable(variable_name)
         self.variable_version = self.variable.allocateTargetNumber()
 
+        if type(tolerant) is str:
+            tolerant = tolerant == "True"
+
         self.tolerant = tolerant
 
         self.previous_trace = None
@@ -453,6 +477,14 @@ class StatementLocalsDictOperationDel(StatementBase):
         return {
             "variable_name": self.getVariableName(),
             "locals_scope": self.locals_scope,
+            "tolerant": self.tolerant,
+        }
+
+    def getDetailsForDisplay(self):
+        return {
+            "variable_name": self.getVariableName(),
+            "locals_scope": self.locals_scope.getCodeName(),
+            "tolerant": self.tolerant,
         }
 
     def getVariableName(self):
@@ -596,6 +628,12 @@ class StatementSetLocalsDictionary(StatementSetLocals):
     def getStatementNiceName(self):
         return "locals dictionary init statement"
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        # The "new_locals" child is always created here.
+        return cls(locals_scope=args["locals_scope"], source_ref=source_ref)
+
 
 class StatementReleaseLocals(StatementBase):
     kind = "STATEMENT_RELEASE_LOCALS"
@@ -635,6 +673,9 @@ class StatementReleaseLocals(StatementBase):
     def getDetails(self):
         return {"locals_scope": self.locals_scope}
 
+    def getDetailsForDisplay(self):
+        return {"locals_scope": self.locals_scope.getCodeName()}
+
     def getLocalsScope(self):
         return self.locals_scope
 
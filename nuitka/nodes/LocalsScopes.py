@@ -162,6 +162,12 @@ class GlobalsDictHandle(object):
 
         self.escaped = False
 
+    def __repr__(self):
+        return "<%s of %s>" % (self.__class__.__name__, self.locals_name)
+
+    def getCodeName(self):
+        return self.locals_name
+
     def markAsEscaped(self):
         self.escaped = True
 
@@ -27,6 +27,7 @@ from nuitka.tree.Extractions import getVariablesWritten
 
 from .Checkers import checkStatementsSequenceOrNone
 from .NodeBases import StatementBase, StatementChildHavingBase
+from .shapes.StandardShapes import ShapeUnknown, shallRefineLoopShapes
 
 
 class StatementLoop(StatementChildHavingBase):
@@ -38,13 +39,14 @@ class StatementLoop(StatementChildHavingBase):
 
     checker = checkStatementsSequenceOrNone
 
-    __slots__ = ("loop_variables", "loop_memory")
+    __slots__ = ("loop_variables", "loop_memory", "loop_restarted")
 
     def __init__(self, body, source_ref):
         StatementChildHavingBase.__init__(self, value=body, source_ref=source_ref)
 
         self.loop_variables = None
         self.loop_memory = None
+        self.loop_restarted = None
 
     def mayReturn(self):
         loop_body = self.getLoopBody()
@@ -103,6 +105,7 @@ class StatementLoop(StatementChildHavingBase):
 
                     self.loop_variables = {}
                     self.loop_memory = {}
+                    self.loop_restarted = set()
 
                     for loop_variable in loop_variables:
                         self.loop_variables[loop_variable] = set()
@@ -126,6 +129,23 @@ class StatementLoop(StatementChildHavingBase):
                         to_remove.append(loop_variable)
                         continue
 
+                    # Unknown shapes may be from earlier passes only, where less
+                    # was known, e.g. about the value entering the loop, but
+                    # they keep themselves alive through the loop. Start over
+                    # once from the entering value, if that one is known now.
+                    if (
+                        ShapeUnknown in current
+                        and shallRefineLoopShapes()
+                        and loop_variable not in self.loop_restarted
+                        and trace_collection.getVariableCurrentTrace(
+                            loop_variable
+                        ).getTypeShape()
+                        is not ShapeUnknown
+                    ):
+                        self.loop_restarted.add(loop_variable)
+                        self.loop_memory[loop_variable] = None
+                        current.clear()
+
                     last_ones = self.loop_memory[loop_variable]
 
                     if last_ones is not True:
@@ -156,6 +176,7 @@ class StatementLoop(StatementChildHavingBase):
                     for loop_variable in to_remove:
                         del self.loop_memory[loop_variable]
                         del self.loop_variables[loop_variable]
+                        self.loop_restarted.discard(loop_variable)
 
                 # Forget all iterator and other value status.
                 trace_collection.resetValueStates()
@@ -57,6 +57,19 @@ class ExpressionModuleAttributeBase(ExpressionBase):
     def getDetails(self):
         return {"variable": self.variable}
 
+    def getDetailsForDisplay(self):
+        return {
+            "variable_name": self.variable.getName(),
+            "owner": self.variable.getOwner().getCodeName(),
+        }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        owner = args["owner"]
+        variable = owner.getProvidedVariable(args["variable_name"])
+
+        return cls(variable=variable, source_ref=source_ref)
+
     def getVariable(self):
         return self.variable
 
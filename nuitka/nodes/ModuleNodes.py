@@ -27,7 +27,11 @@ from nuitka import Options, Variables
 from nuitka.containers.oset import OrderedSet
 from nuitka.importing.Importing import findModule, getModuleNameAndKindFromFilename
 from nuitka.importing.Recursion import decideRecursion, recurseTo
-from nuitka.ModuleRegistry import getModuleByName, getOwnerFromCodeName
+from nuitka.ModuleRegistry import (
+    getModuleByName,
+    getOwnerFromCodeName,
+    withRestoringModule,
+)
 from nuitka.optimizations.TraceCollections import TraceCollectionModule
 from nuitka.PythonVersions import python_version
 from nuitka.SourceCodeReferences import SourceCodeReference, fromFilename
@@ -45,7 +49,7 @@ from .NodeBases import (
     ClosureGiverNodeMixin,
     NodeBase,
     extractKindAndArgsFromXML,
-    fromXML,
+    makeChild,
 )
 
 
@@ -285,6 +289,105 @@ class CompiledPythonModule(
         # Modules are not having any provider, must not be used,
         assert False
 
+    def restoreChildrenFromXML(self, functions_xml, body_xml):
+        """ Restore functions and body of the module from XML roles.
+
+        Notes:
+            Functions are created before the body and their children, as
+            these may reference them. Functions provided by class bodies and
+            other outlines, are created when the outline is restored, for
+            that we use these IDs, as they share the code name of the their
+            provider.
+        """
+
+        # Functions waiting for an outline to be restored, by its ID.
+        pending = {}
+        pending_code_names = {}
+
+        for xml in functions_xml:
+            outline_id = xml.attrib.get("provider_outline")
+
+            if outline_id is None:
+                outline_id = pending_code_names.get(xml.attrib.get("provider"))
+
+            if outline_id is not None:
+                pending_code_names[xml.attrib["code_name"]] = outline_id
+
+            pending.setdefault(outline_id, []).append(xml)
+
+        child_uids = {}
+
+        def restoreFunctions(outline_id, outline):
+            function_work = []
+
+            for xml in pending.pop(outline_id, ()):
+                function = self._restoreFunctionFromXML(
+                    xml=xml, outline=outline, child_uids=child_uids
+                )
+
+                function_work.append((function, xml))
+
+            for function, xml in function_work:
+                for role in xml:
+                    child = makeChild(
+                        provider=function,
+                        child=role,
+                        source_ref=function.getSourceReference(),
+                    )
+
+                    # Empty bodies are the default already.
+                    if child is not None:
+                        function.setChild(role.attrib["name"], child)
+
+        with withRestoringModule(self, outline_handler=restoreFunctions):
+            restoreFunctions(None, None)
+
+            self.setBody(
+                makeChild(provider=self, child=body_xml, source_ref=self.source_ref)
+            )
+
+        assert not pending, pending
+
+        # New children must not reuse the numbers of restored ones.
+        for (entry_point, kind), uid in child_uids.items():
+            entry_point.uids[kind] = uid
+
+    def _restoreFunctionFromXML(self, xml, outline, child_uids):
+        _kind, node_class, func_args, source_ref = extractKindAndArgsFromXML(
+            xml, self.source_ref
+        )
+
+        code_name = func_args.pop("code_name")
+
+        if func_args.pop("provider_outline", None) is not None:
+            func_args["provider"] = outline
+        elif "provider" in func_args:
+            func_args["provider"] = getOwnerFromCodeName(func_args["provider"])
+        else:
+            func_args["provider"] = self
+
+        if "flags" in func_args:
+            if func_args["flags"]:
+                func_args["flags"] = set(func_args["flags"].split(","))
+            else:
+                func_args["flags"] = None
+
+        # Code names are allocated on demand, from counters per kind of the
+        # entry point, and that may happen during creation already, so make
+        # sure the counter gives the original value.
+        entry_point = func_args["provider"].getEntryPoint()
+        uid = int(code_name.rsplit("$$$", 1)[1].split("_")[1])
+
+        entry_point.uids[node_class.kind] = uid - 1
+
+        key = entry_point, node_class.kind
+        child_uids[key] = max(child_uids.get(key, 0), uid)
+
+        function = node_class.fromXML(source_ref=source_ref, **func_args)
+        function.code_name = code_name
+
+        return function
+
     def getFutureSpec(self):
         return self.future_spec
 
@@ -721,39 +824,8 @@ class PythonMainModule(CompiledPythonModule):
 
         addRootModule(result)
 
-        function_work = []
-
-        for xml in args["functions"]:
-            _kind, node_class, func_args, source_ref = extractKindAndArgsFromXML(
-                xml, source_ref
-            )
-
-            if "provider" in func_args:
-                func_args["provider"] = getOwnerFromCodeName(func_args["provider"])
-            else:
-                func_args["provider"] = result
-
-            if "flags" in args:
-                func_args["flags"] = set(func_args["flags"].split(","))
-
-            if "doc" not in args:
-                func_args["doc"] = None
-
-            function = node_class.fromXML(source_ref=source_ref, **func_args)
-
-            # Could do more checks for look up of body here, but so what...
-            function_work.append((function, iter(iter(xml).next()).next()))
-
-        for function, xml in function_work:
-            function.setChild(
-                "body",
-                fromXML(
-                    provider=function, xml=xml, source_ref=function.getSourceReference()
-                ),
-            )
-
-        result.setChild(
-            "body", fromXML(provider=result, xml=args["body"][0], source_ref=source_ref)
+        result.restoreChildrenFromXML(
+            functions_xml=args["functions"], body_xml=args["body"]
         )
 
         return result
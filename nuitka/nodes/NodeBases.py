@@ -25,16 +25,31 @@ expression only stuff.
 
 # from abc import abstractmethod
 
+import base64
+import pickle
 from abc import abstractmethod
+from io import BytesIO
+from types import BuiltinFunctionType
 
 from nuitka import Options, Tracing, TreeXML, Variables
-from nuitka.__past__ import intern, iterItems  # pylint: disable=I0021,redefined-builtin
+from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
+    builtins,
+    intern,
+    iterItems,
+)
+from nuitka.Builtins import (
+    builtin_anon_names,
+    builtin_anon_values,
+    builtin_named_values,
+)
 from nuitka.Errors import NuitkaNodeError
+from nuitka.ModuleRegistry import getOwnerFromCodeName
 from nuitka.PythonVersions import python_version
 from nuitka.SourceCodeReferences import SourceCodeReference
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
 from .FutureSpecs import fromFlags
+from .LocalsScopes import getLocalsDictHandle
 from .NodeMakingHelpers import makeStatementOnlyNodesFromExpressions
 from .NodeMetaClasses import NodeCheckMetaClass, NodeMetaClassBase
 
@@ -1138,6 +1153,77 @@ def extractKindAndArgsFromXML(xml, source_ref):
     return kind, node_class, args, source_ref
 
 
+class _ConstantPickler(pickle.Pickler):
+    """ Pickler for constant values, built-in ones referenced by name.
+
+        Not all of these can be pickled, e.g. "type(None)" or "Ellipsis" on
+        Python2, and they must be the identical objects when loaded.
+    """
+
+    def persistent_id(self, obj):  # pylint: disable=method-hidden
+        if (
+            type(obj) not in (type, BuiltinFunctionType)
+            and obj is not Ellipsis
+            and obj is not NotImplemented
+        ):
+            return None
+
+        if obj in builtin_anon_values:
+            return "anon:" + builtin_anon_values[obj]
+
+        if obj in builtin_named_values:
+            return "named:" + builtin_named_values[obj]
+
+        return None
+
+
+class _ConstantUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):  # pylint: disable=method-hidden
+        kind, name = pid.split(":", 1)
+
+        if kind == "anon":
+            return builtin_anon_names[name]
+        else:
+            return getattr(builtins, name)
+
+
+def encodeConstantForXML(constant):
+    """ Encode a constant value as text, for persistence in XML attributes.
+
+        Unlike the "repr" used for display, this is exact for all constant
+        values, including strings that look like other values.
+    """
+
+    stream = BytesIO()
+    _ConstantPickler(stream, pickle.HIGHEST_PROTOCOL).dump(constant)
+
+    return base64.b64encode(stream.getvalue()).decode("ascii")
+
+
+def decodeConstantFromXML(text):
+    stream = BytesIO(base64.b64decode(text.encode("ascii")))
+
+    return _ConstantUnpickler(stream).load()
+
+
+def _getVariableOwner(provider, owner_code_name, outline_depth):
+    if outline_depth is None:
+        return getOwnerFromCodeName(owner_code_name)
+
+    # Outlines are counted from the inside, they share the code name of their
+    # provider, so that cannot be used.
+    outline_depth = int(outline_depth)
+
+    while True:
+        if provider.isExpressionOutlineFunctionBodyBase():
+            if outline_depth == 0:
+                return provider
+
+            outline_depth -= 1
+
+        provider = provider.getParentVariableProvider()
+
+
 def fromXML(provider, xml, source_ref=None):
     assert xml.tag == "node", xml
 
@@ -1147,21 +1233,46 @@ def fromXML(provider, xml, source_ref=None):
         # TODO: Try and reduce/avoid this, use marshal and/or pickle from a file
         # global stream     instead. For now, this will do. pylint: disable=eval-used
         args["constant"] = eval(args["constant"])
+    elif "constant_pickle" in args:
+        args["constant"] = decodeConstantFromXML(args.pop("constant_pickle"))
+
+    # Locals dictionaries are referenced by their code name.
+    for key in ("locals_scope", "target_scope"):
+        if key in args:
+            args[key] = getLocalsDictHandle(args[key])
 
     if kind in (
         "ExpressionFunctionBody",
+        "ExpressionOutlineFunction",
+        "ExpressionClassBody",
         "PythonMainModule",
         "PythonCompiledModule",
         "PythonCompiledPackage",
         "PythonInternalModule",
     ):
-        delayed = node_class.named_children
+        delayed = getattr(node_class, "named_children", None) or (
+            node_class.named_child,
+        )
 
         if "code_flags" in args:
             args["future_spec"] = fromFlags(args["code_flags"])
     else:
         delayed = ()
 
+    if "provider" in args:
+        provider_code_name = args.pop("provider")
+
+        # Outlines share the code name of their provider, prefer them.
+        if provider is None or provider.getCodeName() != provider_code_name:
+            provider = getOwnerFromCodeName(provider_code_name)
+
+    if "owner" in args:
+        args["owner"] = _getVariableOwner(
+            provider=provider,
+            owner_code_name=args["owner"],
+            outline_depth=args.pop("owner_outline", None),
+        )
+
     for child in xml:
         assert child.tag == "role", child.tag
 
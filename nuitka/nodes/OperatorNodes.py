@@ -80,6 +80,27 @@ class ExpressionOperationBinaryBase(ExpressionChildrenHavingBase):
     def isInplaceSuspect(self):
         return self.inplace_suspect
 
+    def getDetailsForDisplay(self):
+        result = self.getDetails()
+
+        # Tree building decided this, cannot be recovered from the tree.
+        if self.inplace_suspect:
+            result["inplace_suspect"] = "True"
+
+        return result
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        inplace_suspect = args.pop("inplace_suspect", None) == "True"
+
+        result = cls(source_ref=source_ref, **args)
+
+        if inplace_suspect:
+            result.markAsInplaceSuspect()
+
+        return result
+
     # TODO: Make this unnecessary by specializing for all operations.
     def computeExpression(self, trace_collection):
         assert self.operator not in (
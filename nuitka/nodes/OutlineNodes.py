@@ -23,9 +23,12 @@ own anything by themselves. It's just a way of having try/finally for the
 expressions, or multiple returns, without running in a too different context.
 """
 
+from nuitka.ModuleRegistry import onRestoredOutline
+
 from .ExceptionNodes import ExpressionRaiseException
 from .ExpressionBases import ExpressionChildHavingBase
 from .FunctionNodes import ExpressionFunctionBodyBase
+from .NodeBases import makeChild
 
 
 class ExpressionOutlineBody(ExpressionChildHavingBase):
@@ -68,6 +71,13 @@ class ExpressionOutlineBody(ExpressionChildHavingBase):
     def getDetails(self):
         return {"provider": self.provider, "name": self.name}
 
+    def getDetailsForDisplay(self):
+        return {"provider": self.provider.getCodeName(), "name": self.name}
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(provider=provider, source_ref=source_ref, **args)
+
     def getOutlineTempScope(self):
         # We use our own name as a temp_scope, cached from the parent, if the
         # scope is None.
@@ -205,6 +215,28 @@ class ExpressionOutlineFunctionBodyBase(ExpressionFunctionBodyBase):
     def getDetailsForDisplay(self):
         return {"name": self.name, "provider": self.provider.getCodeName()}
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # The body is delayed, it may own variables of the outline.
+        body = args.pop("body", None)
+        outline_id = args.pop("outline_id", None)
+
+        result = cls(provider=provider, source_ref=source_ref, **args)
+
+        result.restoreBodyFromXML(outline_id=outline_id, body=body)
+
+        return result
+
+    def restoreBodyFromXML(self, outline_id, body):
+        # Functions provided by the outline are needed for the body.
+        if outline_id is not None:
+            onRestoredOutline(outline_id, self)
+
+        if body is not None:
+            self.setBody(
+                makeChild(provider=self, child=body, source_ref=self.source_ref)
+            )
+
     def computeExpressionRaw(self, trace_collection):
         # Keep track of these, so they can provide what variables are to be
         # setup.
@@ -182,6 +182,9 @@ class StatementReturnConstant(StatementReturnConstantBase):
     def getDetails(self):
         return {"constant": self.constant}
 
+    def getDetailsForDisplay(self):
+        return {"constant": repr(self.constant)}
+
 
 def makeStatementReturnConstant(constant, source_ref):
     if constant is None:
@@ -256,6 +256,11 @@ class StatementPreserveFrameException(StatementBase):
     def getDetails(self):
         return {"preserver_id": self.preserver_id}
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(preserver_id=int(args["preserver_id"]), source_ref=source_ref)
+
     def getPreserverId(self):
         return self.preserver_id
 
@@ -295,6 +300,11 @@ class StatementRestoreFrameException(StatementBase):
     def getDetails(self):
         return {"preserver_id": self.preserver_id}
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(preserver_id=int(args["preserver_id"]), source_ref=source_ref)
+
     def getPreserverId(self):
         return self.preserver_id
 
@@ -128,6 +128,13 @@ class ExpressionBuiltinSuper(ExpressionChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Only some things need a provider, pylint: disable=unused-argument
+        return cls(
+            super_type=args["type"], super_object=args["object"], source_ref=source_ref
+        )
+
     def computeExpression(self, trace_collection):
         trace_collection.onExceptionRaiseExit(BaseException)
 
@@ -23,7 +23,6 @@ and its expressions, changing the meaning of course dramatically.
 """
 
 from nuitka import Builtins, Variables
-from nuitka.ModuleRegistry import getOwnerFromCodeName
 from nuitka.PythonVersions import python_version
 
 from .DictionaryNodes import (
@@ -271,7 +270,7 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is ExpressionVariableRef, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = args["owner"]
         variable = owner.getProvidedVariable(args["variable_name"])
 
         return cls(variable=variable, source_ref=source_ref)
@@ -488,9 +487,10 @@ class ExpressionTempVariableRef(ExpressionVariableRefBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is ExpressionTempVariableRef, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = args["owner"]
 
-        variable = owner.getTempVariable(None, args["temp_name"])
+        # The reference may be restored before the assignment is.
+        variable = owner.createTempVariable(args["temp_name"])
 
         return cls(variable=variable, source_ref=source_ref)
 
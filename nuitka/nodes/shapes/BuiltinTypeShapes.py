@@ -20,6 +20,7 @@
 """
 
 from nuitka.codegen.c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from nuitka.codegen.c_types.CTypeNuitkaFloats import CTypeNuitkaFloatStruct
 from nuitka.codegen.c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
 from nuitka.codegen.Reports import onMissingOperation
 from nuitka.Options import isExperimental
@@ -109,6 +110,8 @@ mul_shapes_intorlong = {}
 add_shapes_float = {}
 sub_shapes_float = {}
 mul_shapes_float = {}
+truediv_shapes_float = {}
+olddiv_shapes_float = {}
 add_shapes_complex = {}
 sub_shapes_complex = {}
 mul_shapes_complex = {}
@@ -342,6 +345,12 @@ class ShapeTypeInt(ShapeBase):
 
     helper_code = "INT" if python_version < 300 else "LONG"
 
+    if isExperimental("nuitka_ilong"):
+
+        @staticmethod
+        def getCType():
+            return CTypeNuitkaIntOrLongStruct
+
     @staticmethod
     def hasShapeSlotBool():
         return True
@@ -585,6 +594,12 @@ class ShapeTypeFloat(ShapeBase):
 
     helper_code = "FLOAT"
 
+    if isExperimental("nuitka_ifloat"):
+
+        @staticmethod
+        def getCType():
+            return CTypeNuitkaFloatStruct
+
     @staticmethod
     def hasShapeSlotBool():
         return True
@@ -629,6 +644,10 @@ class ShapeTypeFloat(ShapeBase):
     sub_shapes = sub_shapes_float
     mul_shapes = mul_shapes_float
 
+    if isExperimental("nuitka_ifloat"):
+        truediv_shapes = truediv_shapes_float
+        olddiv_shapes = olddiv_shapes_float
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -1706,6 +1725,12 @@ class ShapeTypeXrangeIterator(ShapeIterator):
     def getTypeName():
         return "rangeiterator" if python_version < 300 else "range_iterator"
 
+    if isExperimental("nuitka_ilong"):
+
+        @staticmethod
+        def getShapeIterNext():
+            return ShapeTypeInt
+
     @staticmethod
     def hasShapeSlotBool():
         return True
@@ -2915,6 +2940,64 @@ mul_shapes_float.update(
     }
 )
 
+truediv_shapes_float.update(
+    {
+        # Standard
+        ShapeUnknown: operation_result_unknown,
+        ShapeTypeLongDerived: operation_result_unknown,
+        ShapeTypeIntOrLongDerived: operation_result_unknown,
+        ShapeTypeStrDerived: operation_result_unknown,
+        ShapeTypeUnicodeDerived: operation_result_unknown,
+        ShapeTypeBytesDerived: operation_result_unknown,
+        # floats do math ops
+        ShapeTypeInt: operation_result_zerodiv_float,
+        ShapeTypeLong: operation_result_zerodiv_float,
+        ShapeTypeIntOrLong: operation_result_zerodiv_float,
+        ShapeTypeBool: operation_result_zerodiv_float,
+        ShapeTypeFloat: operation_result_zerodiv_float,
+        ShapeTypeComplex: operation_result_zerodiv_complex,
+        # Unsupported:
+        ShapeTypeStr: operation_result_unsupported_truediv,
+        ShapeTypeBytes: operation_result_unsupported_truediv,
+        ShapeTypeBytearray: operation_result_unsupported_truediv,
+        ShapeTypeUnicode: operation_result_unsupported_truediv,
+        ShapeTypeTuple: operation_result_unsupported_truediv,
+        ShapeTypeList: operation_result_unsupported_truediv,
+        ShapeTypeSet: operation_result_unsupported_truediv,
+        ShapeTypeDict: operation_result_unsupported_truediv,
+        ShapeTypeNoneType: operation_result_unsupported_truediv,
+    }
+)
+
+olddiv_shapes_float.update(
+    {
+        # Standard
+        ShapeUnknown: operation_result_unknown,
+        ShapeTypeLongDerived: operation_result_unknown,
+        ShapeTypeIntOrLongDerived: operation_result_unknown,
+        ShapeTypeStrDerived: operation_result_unknown,
+        ShapeTypeUnicodeDerived: operation_result_unknown,
+        ShapeTypeBytesDerived: operation_result_unknown,
+        # floats do math ops
+        ShapeTypeInt: operation_result_zerodiv_float,
+        ShapeTypeLong: operation_result_zerodiv_float,
+        ShapeTypeIntOrLong: operation_result_zerodiv_float,
+        ShapeTypeBool: operation_result_zerodiv_float,
+        ShapeTypeFloat: operation_result_zerodiv_float,
+        ShapeTypeComplex: operation_result_zerodiv_complex,
+        # Unsupported:
+        ShapeTypeStr: operation_result_unsupported_olddiv,
+        ShapeTypeBytes: operation_result_unsupported_olddiv,
+        ShapeTypeBytearray: operation_result_unsupported_olddiv,
+        ShapeTypeUnicode: operation_result_unsupported_olddiv,
+        ShapeTypeTuple: operation_result_unsupported_olddiv,
+        ShapeTypeList: operation_result_unsupported_olddiv,
+        ShapeTypeSet: operation_result_unsupported_olddiv,
+        ShapeTypeDict: operation_result_unsupported_olddiv,
+        ShapeTypeNoneType: operation_result_unsupported_olddiv,
+    }
+)
+
 add_shapes_complex.update(
     {
         # Standard
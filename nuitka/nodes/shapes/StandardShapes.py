@@ -19,10 +19,20 @@
 
 from nuitka.codegen.c_types.CTypePyObjectPtrs import CTypePyObjectPtr
 from nuitka.codegen.Reports import onMissingOperation
+from nuitka.Options import isExperimental
 
 from .ControlFlowDescriptions import ControlFlowDescriptionFullEscape
 
 
+def shallRefineLoopShapes():
+    """ Decide if loop shapes are traced precisely enough for C types.
+
+    Only the experimental unboxed int and float C types need this so far, so
+    it is not done for others yet.
+    """
+    return isExperimental("nuitka_ilong") or isExperimental("nuitka_ifloat")
+
+
 class ShapeBase(object):
     @staticmethod
     def getTypeName():
@@ -38,6 +48,10 @@ class ShapeBase(object):
     def getShapeIter():
         return ShapeUnknown
 
+    @staticmethod
+    def getShapeIterNext():
+        return ShapeUnknown
+
     @staticmethod
     def hasShapeModule():
         return None
@@ -100,6 +114,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryAddLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryAddLShape(cls)
+
                 return operation_result_unknown
 
             onMissingOperation("Add", cls, right_shape)
@@ -120,6 +137,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinarySubLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinarySubLShape(cls)
+
                 return operation_result_unknown
 
             onMissingOperation("Sub", cls, right_shape)
@@ -140,6 +160,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryMultLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryMultLShape(cls)
+
                 return operation_result_unknown
 
             onMissingOperation("Mult", cls, right_shape)
@@ -160,6 +183,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryFloorDivLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryFloorDivLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -181,6 +207,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryOldDivLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryOldDivLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -202,6 +231,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryTrueDivLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryTrueDivLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -223,6 +255,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryModLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryModLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -244,6 +279,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryPowLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryPowLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -265,6 +303,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryLShiftLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryLShiftLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -286,6 +327,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryRShiftLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryRShiftLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -307,6 +351,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryBitOrLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryBitOrLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -328,6 +375,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryBitAndLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryBitAndLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -349,6 +399,9 @@ class ShapeBase(object):
                 return right_shape.getOperationBinaryBitXorLShape(cls)
 
             if right_shape_type is ShapeLoopInitialAlternative:
+                if shallRefineLoopShapes():
+                    return right_shape.getOperationBinaryBitXorLShape(cls)
+
                 return operation_result_unknown
 
             # TODO: Not yet there.
@@ -554,6 +607,24 @@ class ShapeIterator(ShapeBase):
         return True
 
 
+def _collectInitialShape(type_shapes, operation):
+    result = set()
+
+    for type_shape in type_shapes:
+        try:
+            entry, _description = operation(type_shape)
+        except TypeError:
+            assert False, type_shape
+
+        if entry is ShapeUnknown:
+            return ShapeUnknown
+
+        # Avoid nesting, when the right side was alternatives too.
+        entry.emitAlternatives(result.add)
+
+    return ShapeLoopInitialAlternative(result)
+
+
 class ShapeLoopInitialAlternative(ShapeBase):
     """ Merge of loop wrap around with loop start value.
 
@@ -577,20 +648,7 @@ class ShapeLoopInitialAlternative(ShapeBase):
             type_shape.emitAlternatives(emit)
 
     def _collectInitialShape(self, operation):
-        result = set()
-
-        for type_shape in self.type_shapes:
-            try:
-                entry, _description = operation(type_shape)
-            except TypeError:
-                assert False, type_shape
-
-            if entry is ShapeUnknown:
-                return ShapeUnknown
-
-            result.add(entry)
-
-        return ShapeLoopInitialAlternative(result)
+        return _collectInitialShape(self.type_shapes, operation)
 
     def getOperationBinaryAddShape(self, right_shape):
         if right_shape is ShapeUnknown:
@@ -802,6 +860,128 @@ class ShapeLoopInitialAlternative(ShapeBase):
     def getComparisonNeqShape(self, right_shape):
         return self.getComparisonLtShape(right_shape)
 
+    # Special methods to be called by other shapes encountering this type on
+    # the right side.
+    def getOperationBinaryAddLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinaryAddShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinarySubLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinarySubShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryMultLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinaryMultShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryFloorDivLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryFloorDivShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryOldDivLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryOldDivShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryTrueDivLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryTrueDivShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryModLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinaryModShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryPowLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinaryPowShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryLShiftLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryLShiftShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryRShiftLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryRShiftShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryBitOrLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryBitOrShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryBitAndLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryBitAndShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinaryBitXorLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(
+                operation=left_shape.getOperationBinaryBitXorShape
+            ),
+            ControlFlowDescriptionFullEscape,
+        )
+
 
 class ShapeLoopCompleteAlternative(ShapeBase):
     """ Merge of loop wrap around with loop start value.
@@ -836,6 +1016,13 @@ class ShapeLoopCompleteAlternative(ShapeBase):
             if entry is ShapeUnknown:
                 return operation_result_unknown
 
+            # Incomplete on the right side, then the result is that too.
+            if type(entry) is ShapeLoopInitialAlternative and shallRefineLoopShapes():
+                return (
+                    _collectInitialShape(self.type_shapes, operation),
+                    ControlFlowDescriptionFullEscape,
+                )
+
             if single:
                 if result is None:
                     # First entry, fine.
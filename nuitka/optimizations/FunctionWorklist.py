@@ -0,0 +1,161 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Worklist of functions that need to be computed in an optimization pass.
+
+Every global optimization pass normally computes all used functions again,
+until a pass makes no more changes. For a function, that did not change in
+the last pass, and whose inputs did not change either, this gives the same
+result again. The inputs considered are the usage state of the variables it
+traces, i.e. who writes and uses them, and the functions it references,
+which includes the ones it calls directly.
+
+Functions not in the worklist are not computed, but the modules and functions
+they used in their last computation are marked as used again, so they stay
+part of the compilation.
+
+This is only enabled with the experimental flag "optimization_worklist".
+"""
+
+from nuitka import Options, Variables
+from nuitka.ModuleRegistry import addUsedModule
+
+# Functions to compute in the current pass, None for all of them.
+dirty_functions = None
+
+# Functions that changed in the current pass.
+changed_functions = set()
+
+# Count of signaled changes, to detect changes during function computation.
+signal_count = 0
+
+
+def isWorklistEnabled():
+    return Options.isExperimental("optimization_worklist")
+
+
+def onSignal():
+    # Singleton, pylint: disable=global-statement
+    global signal_count
+    signal_count += 1
+
+
+def startPass(use_worklist):
+    """ Start an optimization pass.
+
+    Args:
+        use_worklist - only compute functions from the worklist
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global dirty_functions
+
+    if not use_worklist or not isWorklistEnabled():
+        dirty_functions = None
+    else:
+        dirty_functions = _getNextDirtyFunctions()
+
+    changed_functions.clear()
+
+    if isWorklistEnabled():
+        Variables.changed_usage_variables = set()
+
+
+def markFunctionChanged(function_body):
+    changed_functions.add(function_body)
+
+
+def markAllFunctionsChanged():
+    changed_functions.add(None)
+
+
+def _getNextDirtyFunctions():
+    if None in changed_functions:
+        return None
+
+    changed_variables = Variables.changed_usage_variables
+
+    result = set(changed_functions)
+
+    for function_body in _getComputedFunctions():
+        if function_body in result:
+            continue
+
+        trace_collection = function_body.trace_collection
+
+        for used_function in trace_collection.getUsedFunctions():
+            if used_function in changed_functions:
+                result.add(function_body)
+                break
+        else:
+            for variable, _version in trace_collection.getVariableTracesAll():
+                if variable in changed_variables:
+                    result.add(function_body)
+                    break
+
+    return result
+
+
+def _getComputedFunctions():
+    # Cyclic dependency.
+    from nuitka.ModuleRegistry import getDoneModules
+
+    for module in getDoneModules():
+        if module.isCompiledPythonModule():
+            for function_body in module.getUsedFunctions():
+                if function_body.trace_collection is not None:
+                    yield function_body
+
+
+def computeFunction(function_body, trace_collection):
+    """ Compute a function, unless it is not in the worklist.
+
+    Args:
+        function_body - function body to compute
+        trace_collection - trace collection of the function reference
+    """
+
+    if (
+        dirty_functions is not None
+        and function_body.trace_collection is not None
+        and function_body not in dirty_functions
+    ):
+        _reuseFunction(function_body, trace_collection)
+    else:
+        old_signal_count = signal_count
+
+        function_body.computeFunctionRaw(trace_collection)
+
+        if signal_count != old_signal_count:
+            changed_functions.add(function_body)
+
+
+def _reuseFunction(function_body, trace_collection):
+    # Replay what the last computation of the function used, through the
+    # collection of the reference, the old parents may be outdated.
+    function_collection = function_body.trace_collection
+
+    for module_name, module_relpath in function_collection.getUsedModules():
+        trace_collection.onUsedModule(module_name, module_relpath)
+
+    for used_function in function_collection.getUsedFunctions():
+        owning_module = used_function.getParentModule()
+
+        addUsedModule(owning_module)
+
+        if owning_module.addUsedFunction(used_function):
+            computeFunction(used_function, trace_collection)
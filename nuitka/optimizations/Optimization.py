@@ -31,9 +31,11 @@ from nuitka.importing import ImportCache
 from nuitka.nodes.LocalsScopes import LocalsDictHandle, getLocalsDictHandles
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
+from nuitka.tree.ModuleCache import isModuleCacheEnabled, storeModuleTrees
 from nuitka.utils import MemoryUsage
+from nuitka.utils.Timing import withPhaseReport
 
-from . import Graphs, TraceCollections
+from . import FunctionWorklist, Graphs, OptimizationTrace, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
 
@@ -73,6 +75,9 @@ def signalChange(tags, source_ref, message):
                 )
             )
 
+    OptimizationTrace.onSignal(tags, source_ref, message)
+    FunctionWorklist.onSignal()
+
     tag_set.onSignal(tags)
 
 
@@ -93,15 +98,23 @@ def optimizeCompiledPythonModule(module):
     if _progress and Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
+    OptimizationTrace.onModuleOptimizationStart(module)
+    step = 0
+
     while True:
         tag_set.clear()
 
+        step += 1
+        OptimizationTrace.onModuleStepStart(step)
+
         try:
             module.computeModule()
         except BaseException:
             info("Interrupted while working on '%s'." % module)
             raise
 
+        OptimizationTrace.onModuleStepEnd(step, tag_set)
+
         Graphs.onModuleOptimizationStep(module)
 
         # Search for local change tags.
@@ -116,6 +129,8 @@ def optimizeCompiledPythonModule(module):
         # Otherwise we did stuff, so note that for return value.
         touched = True
 
+    OptimizationTrace.onModuleOptimizationEnd(module, step, touched)
+
     if _progress and Options.isShowMemory():
         memory_watch.finish()
 
@@ -129,6 +144,21 @@ def optimizeCompiledPythonModule(module):
     return touched
 
 
+def preOptimizeCompiledPythonModule(module):
+    """ Optimize a module on its own, outside of the optimization passes.
+
+    This is used by worker processes of the parallel optimization, where
+    only this module is considered.
+    """
+
+    # The tag set is global, so it can react to changes without context.
+    # pylint: disable=global-statement
+    global tag_set
+    tag_set = TagSet()
+
+    optimizeCompiledPythonModule(module)
+
+
 def optimizeUncompiledPythonModule(module):
     full_name = module.getFullName()
     if _progress:
@@ -313,6 +343,7 @@ def optimizeLocalsDictsHandles():
 
         if locals_scope.isMarkedForPropagation():
             locals_scope.finalize()
+            FunctionWorklist.markAllFunctionsChanged()
 
             del locals_scopes[locals_scope_name]
 
@@ -350,6 +381,7 @@ def optimizeLocalsDictsHandles():
 
         if propagate:
             locals_scope.markForLocalsDictPropagation()
+            FunctionWorklist.markAllFunctionsChanged()
 
     return changed
 
@@ -437,17 +469,23 @@ def optimizeVariables(module):
     try:
         try:
             for function_body in module.getUsedFunctions():
+                function_changed = False
+
                 if Variables.complete:
                     if optimizeUnusedUserVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                     if optimizeUnusedClosureVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                     if optimizeVariableReleases(function_body):
-                        changed = True
+                        function_changed = True
 
                 if optimizeUnusedTempVariables(function_body):
+                    function_changed = True
+
+                if function_changed:
+                    FunctionWorklist.markFunctionChanged(function_body)
                     changed = True
         except Exception:
             print("Problem with", function_body)
@@ -606,17 +644,34 @@ def _checkXMLPersistence():
     ModuleRegistry.startTraversal()
 
 
+def _makeOptimizationPass(pass_number, initial_pass):
+    with withPhaseReport("optimization_pass", pass_number=pass_number):
+        OptimizationTrace.onPassStart(pass_number)
+
+        # The first passes change everything, after that only functions with
+        # changed inputs need to be computed again.
+        FunctionWorklist.startPass(use_worklist=pass_number > 2)
+
+        finished = makeOptimizationPass(initial_pass=initial_pass)
+
+        OptimizationTrace.onPassEnd(pass_number, finished)
+
+    return finished
+
+
 def optimize(output_filename):
     Graphs.startGraph()
+    OptimizationTrace.startTrace()
 
     # First pass.
     if _progress:
         info("PASS 1:")
 
-    makeOptimizationPass(initial_pass=True)
+    _makeOptimizationPass(pass_number=1, initial_pass=True)
     Variables.complete = True
 
-    finished = makeOptimizationPass(initial_pass=False)
+    finished = _makeOptimizationPass(pass_number=2, initial_pass=False)
+    pass_number = 2
 
     if Options.isExperimental("check_xml_persistence"):
         _checkXMLPersistence()
@@ -629,12 +684,19 @@ def optimize(output_filename):
             and module.getCompilationMode() == "bytecode"
         ):
             demoteCompiledModuleToBytecode(module)
+            FunctionWorklist.markAllFunctionsChanged()
 
     if _progress:
         info("PASS 2 ... :")
 
     # Second, "endless" pass.
     while not finished:
-        finished = makeOptimizationPass(initial_pass=False)
+        pass_number += 1
+
+        finished = _makeOptimizationPass(pass_number=pass_number, initial_pass=False)
+
+    if isModuleCacheEnabled():
+        storeModuleTrees(ModuleRegistry.getDoneModules(), complete=True)
 
     Graphs.endGraph(output_filename)
+    OptimizationTrace.endTrace()
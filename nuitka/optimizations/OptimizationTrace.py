@@ -0,0 +1,136 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Timeline of the optimization in Chrome trace event format.
+
+This records the optimization passes, the optimization of each module in
+them, the micro passes done until it converged, and the tags signaled with
+their source references, so it becomes visible, which modules take many
+micro passes, and why.
+
+The format is the JSON one of "chrome://tracing" and Perfetto, with
+duration events for passes, modules and micro passes, and instant events
+for the signaled tags.
+"""
+
+import inspect
+import json
+import os
+from timeit import default_timer as timer
+
+from nuitka import Options
+
+trace_events = None
+start_time = None
+
+
+def _getTimestamp():
+    # Microseconds is what the format uses.
+    return (timer() - start_time) * 1000000
+
+
+def _addEvent(phase, name, category, args):
+    event = {
+        "ph": phase,
+        "name": name,
+        "cat": category,
+        "ts": _getTimestamp(),
+        "pid": os.getpid(),
+        "tid": 0,
+    }
+
+    if args:
+        event["args"] = args
+
+    trace_events.append(event)
+
+
+def startTrace():
+    # We maintain this globally to make it accessible, pylint: disable=global-statement
+    global trace_events, start_time
+
+    if Options.getOptimizationTraceFilename() is not None:
+        trace_events = []
+        start_time = timer()
+
+
+def endTrace():
+    if trace_events is None:
+        return
+
+    with open(Options.getOptimizationTraceFilename(), "w") as trace_file:
+        json.dump(
+            {"traceEvents": trace_events, "displayTimeUnit": "ms"},
+            trace_file,
+            indent=0,
+        )
+
+
+def onPassStart(pass_number):
+    if trace_events is not None:
+        _addEvent("B", "pass %d" % pass_number, "pass", None)
+
+
+def onPassEnd(pass_number, finished):
+    if trace_events is not None:
+        _addEvent("E", "pass %d" % pass_number, "pass", {"finished": finished})
+
+
+def onModuleOptimizationStart(module):
+    if trace_events is not None:
+        _addEvent("B", module.getFullName().asString(), "module", None)
+
+
+def onModuleOptimizationEnd(module, steps, touched):
+    if trace_events is not None:
+        _addEvent(
+            "E",
+            module.getFullName().asString(),
+            "module",
+            {"steps": steps, "touched": touched},
+        )
+
+
+def onModuleStepStart(step):
+    if trace_events is not None:
+        _addEvent("B", "step %d" % step, "step", None)
+
+
+def onModuleStepEnd(step, tags):
+    if trace_events is not None:
+        _addEvent("E", "step %d" % step, "step", {"tags": sorted(tags)})
+
+
+def onSignal(tags, source_ref, message):
+    if trace_events is not None:
+        if inspect.isfunction(message):
+            message = message()
+
+        if type(tags) is not str:
+            tags = " ".join(tags)
+
+        _addEvent(
+            "i",
+            tags,
+            "signal",
+            {
+                "source_ref": source_ref.getAsString()
+                if source_ref is not None
+                else None,
+                "message": message,
+            },
+        )
@@ -0,0 +1,201 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Parallel optimization of modules in worker processes.
+
+The optimization of a module is mostly local to it, so worker processes can
+build and optimize the modules independently, and store the result in the
+module cache. The recursions done by a worker are reported back, and become
+new jobs, until all modules are covered. Modules already in the module cache
+are not optimized again, the recursions recorded for them are used.
+
+Live node trees cannot be shared between processes, so cross module facts
+are not synchronized with the workers. They optimize like the first pass
+does, without complete knowledge of variable usages, which is only correct
+and not depending on other modules. Afterwards the normal optimization is
+still done, with all modules, but it restores them from the module cache and
+has little left to do. Its passes are where "Variables.complete" and the
+module variable traces are established for all modules, and its trees then
+replace the cache entries of the workers, so later compilations restore them.
+
+This requires the module cache and is only enabled with the experimental
+flag "parallel_optimization".
+"""
+
+import multiprocessing
+import os
+import sys
+import traceback
+from collections import deque
+
+from nuitka import Options, Variables
+from nuitka.importing import Recursion
+from nuitka.Tracing import general
+from nuitka.tree import Building
+from nuitka.tree.ModuleCache import (
+    getRestoredRecursions,
+    isModuleCacheEnabled,
+    storeModuleTrees,
+)
+
+from .Optimization import preOptimizeCompiledPythonModule
+
+
+def isParallelOptimizationEnabled():
+    return (
+        Options.isExperimental("parallel_optimization")
+        and isModuleCacheEnabled()
+        and Options.getJobLimit() > 1
+    )
+
+
+def _createProcessPool(jobs):
+    # The workers must inherit the state of the main process, e.g. options
+    # and plugins, which only forking gives.
+    if sys.platform == "win32":
+        return None
+
+    # Every job gets a fresh process, so modules created by earlier jobs do
+    # not accumulate in the workers.
+    if hasattr(multiprocessing, "get_context"):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return None
+
+        return multiprocessing.get_context("fork").Pool(jobs, maxtasksperchild=1)
+    else:
+        return multiprocessing.Pool(jobs, maxtasksperchild=1)
+
+
+def _preOptimizeModule(job):
+    """ Build and optimize a module, running in a worker process.
+
+    Args:
+        job - tuple of kind and arguments of the module to do
+    Returns:
+        list - recursions done, as arguments to repeat them
+    """
+
+    job_kind, job_args = job
+
+    Recursion.recursion_log = []
+
+    if job_kind == "main":
+        module = Building.buildModuleTree(
+            filename=job_args,
+            package=None,
+            is_top=True,
+            is_main=not Options.shallMakeModule(),
+        )
+    else:
+        module_package, module_filename, module_relpath, module_kind = job_args
+
+        module, _added = Recursion.recurseTo(
+            module_package=module_package,
+            module_filename=module_filename,
+            module_relpath=module_relpath,
+            module_kind=module_kind,
+            reason="Parallel optimization.",
+        )
+
+    if module is None or not module.isCompiledPythonModule():
+        return Recursion.recursion_log
+
+    # Optimized before, restoring does not recurse, but it was recorded.
+    restored_recursions = getRestoredRecursions(module)
+
+    if restored_recursions is not None:
+        return Recursion.recursion_log + restored_recursions
+
+    # Must not use knowledge of other modules.
+    assert not Variables.complete
+
+    preOptimizeCompiledPythonModule(module)
+
+    storeModuleTrees((module,), complete=False)
+
+    return Recursion.recursion_log
+
+
+def _preOptimizeModuleChecked(job):
+    try:
+        return _preOptimizeModule(job), None
+    # Catch all the things, pylint: disable=broad-except
+    except (Exception, SystemExit):
+        # The normal optimization will do the module again, but report the
+        # problem, it may not be the same there.
+        return [], traceback.format_exc().rstrip()
+
+
+def _getJobDescription(job):
+    job_kind, job_args = job
+
+    if job_kind == "main":
+        return job_args
+    else:
+        return job_args[1]
+
+
+def preOptimizeModules(filename):
+    """ Optimize the main module and all it recurses to in worker processes.
+
+    Args:
+        filename - filename of the main module, like for "createNodeTree"
+    """
+
+    jobs = Options.getJobLimit()
+    pool = _createProcessPool(jobs)
+
+    if pool is None:
+        return
+
+    def addJob(job):
+        pending.append((job, pool.apply_async(_preOptimizeModuleChecked, (job,))))
+
+    seen = set([os.path.abspath(filename)])
+    pending = deque()
+    count = 0
+
+    addJob(("main", filename))
+
+    while pending:
+        job, result = pending.popleft()
+        recursions, error = result.get()
+        count += 1
+
+        if error is not None:
+            general.warning(
+                "Parallel optimization of '%s' failed:\n%s"
+                % (_getJobDescription(job), error)
+            )
+
+        for recursion in recursions:
+            module_filename, module_kind = recursion[1], recursion[3]
+
+            if module_kind != "py" or os.path.abspath(module_filename) in seen:
+                continue
+
+            seen.add(os.path.abspath(module_filename))
+
+            addJob(("module", recursion))
+
+    pool.close()
+    pool.join()
+
+    if Options.isShowProgress():
+        general.info(
+            "Pre-optimized %d modules with %d worker processes." % (count, jobs)
+        )
@@ -28,6 +28,7 @@ from logging import debug
 
 from nuitka import Tracing, Variables
 from nuitka.__past__ import iterItems  # Python3 compatibility.
+from nuitka.containers.oset import OrderedSet
 from nuitka.importing.ImportCache import getImportedModuleByNameAndPath
 from nuitka.ModuleRegistry import addUsedModule
 from nuitka.nodes.NodeMakingHelpers import getComputationResult
@@ -408,6 +409,9 @@ class TraceCollectionBase(CollectionTracingMixin):
     def onUsedModule(self, module_name, module_relpath):
         return self.parent.onUsedModule(module_name, module_relpath)
 
+    def onUsedFunction(self, function_body):
+        return self.parent.onUsedFunction(function_body)
+
     @staticmethod
     def mustAlias(a, b):
         if a.isExpressionVariableRef() and b.isExpressionVariableRef():
@@ -795,6 +799,25 @@ class TraceCollectionFunction(CollectionStartpointMixin, TraceCollectionBase):
             else:
                 function_body.locals_scope = None
 
+        # Modules and functions used, to replay them when the function is
+        # not computed again, see "FunctionWorklist" module.
+        self.used_modules = OrderedSet()
+        self.used_functions = OrderedSet()
+
+    def onUsedModule(self, module_name, module_relpath):
+        self.used_modules.add((module_name, module_relpath))
+
+        return self.parent.onUsedModule(module_name, module_relpath)
+
+    def getUsedModules(self):
+        return self.used_modules
+
+    def onUsedFunction(self, function_body):
+        self.used_functions.add(function_body)
+
+    def getUsedFunctions(self):
+        return self.used_functions
+
 
 class TraceCollectionModule(CollectionStartpointMixin, TraceCollectionBase):
     def __init__(self, module):
@@ -817,3 +840,7 @@ class TraceCollectionModule(CollectionStartpointMixin, TraceCollectionBase):
 
         module = getImportedModuleByNameAndPath(module_name, module_relpath)
         addUsedModule(module)
+
+    def onUsedFunction(self, function_body):
+        # Module code is always computed, nothing to record.
+        pass
@@ -37,6 +37,7 @@ from nuitka.nodes.shapes.StandardShapes import (
     ShapeLoopCompleteAlternative,
     ShapeLoopInitialAlternative,
     ShapeUnknown,
+    shallRefineLoopShapes,
 )
 from nuitka.utils import InstanceCounters
 
@@ -448,13 +449,27 @@ class ValueTraceMerge(ValueTraceBase):
     def getTypeShape(self):
         type_shapes = set()
 
+        initial = False
+        refine = shallRefineLoopShapes()
+
         for trace in self.previous:
             type_shape = trace.getTypeShape()
 
             if type_shape is ShapeUnknown:
                 return ShapeUnknown
 
-            type_shapes.add(type_shape)
+            # Loop alternatives are merged by their shapes, but if one is not
+            # complete yet, the result is not either.
+            if refine and type(type_shape) is ShapeLoopInitialAlternative:
+                initial = True
+                type_shape.emitAlternatives(type_shapes.add)
+            elif refine and type(type_shape) is ShapeLoopCompleteAlternative:
+                type_shape.emitAlternatives(type_shapes.add)
+            else:
+                type_shapes.add(type_shape)
+
+        if initial:
+            return ShapeLoopInitialAlternative(type_shapes)
 
         # TODO: Find the lowest common denominator.
         if len(type_shapes) == 1:
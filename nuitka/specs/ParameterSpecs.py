@@ -87,6 +87,15 @@ class ParameterSpec(object):
             else:
                 ps_kw_only_args = ps_kw_only_args.split(",")
 
+        if type(ps_pos_only_args) is str:
+            if ps_pos_only_args == "":
+                ps_pos_only_args = ()
+            else:
+                ps_pos_only_args = ps_pos_only_args.split(",")
+
+        if type(ps_default_count) is str:
+            ps_default_count = int(ps_default_count)
+
         assert None not in ps_normal_args
 
         self.owner = None
@@ -133,7 +142,7 @@ class ParameterSpec(object):
         return {
             "ps_name": self.name,
             "ps_normal_args": ",".join(self.normal_args),
-            "ps_pos_only_args": self.pos_only_args,
+            "ps_pos_only_args": ",".join(self.pos_only_args),
             "ps_kw_only_args": ",".join(self.kw_only_args),
             "ps_list_star_arg": self.list_star_arg
             if self.list_star_arg is not None
@@ -95,6 +95,16 @@ The optimization tests, execute these to check if Nuitka does optimize certain
 constructs fully away. Default is %default.""",
     )
 
+    parser.add_option(
+        "--skip-module-cache-tests",
+        action="store_false",
+        dest="module_cache_tests",
+        default=True,
+        help="""\
+The module cache tests, execute these to check if Nuitka restores optimized
+module trees from its cache when compiling again. Default is %default.""",
+    )
+
     parser.add_option(
         "--skip-standalone-tests",
         action="store_false",
@@ -632,6 +642,14 @@ def main():
                 setExtraFlags(where, "optimizations", flags)
                 executeSubTest("./tests/optimizations/run_all.py search")
 
+        if options.module_cache_tests and not options.coverage:
+            print(
+                "Running the module cache tests with options '%s' with %s:"
+                % (flags, use_python)
+            )
+            setExtraFlags(None, "module_cache", flags)
+            executeSubTest("./tests/module_cache/run_all.py")
+
         if options.standalone_tests and not options.coverage:
             print(
                 "Running the standalone tests with options '%s' with %s:"
@@ -111,8 +111,10 @@ from nuitka.PythonVersions import python_version
 from nuitka.utils import MemoryUsage
 from nuitka.utils.FileOperations import splitPath
 from nuitka.utils.ModuleNames import ModuleName
+from nuitka.utils.Timing import withPhaseReport
 
 from . import SyntaxErrors
+from .ModuleCache import isModuleCacheEnabled, restoreModuleTree
 from .ReformulationAssertStatements import buildAssertNode
 from .ReformulationAssignmentStatements import (
     buildAnnAssignNode,
@@ -971,6 +973,21 @@ class CodeTooComplexCode(Exception):
 
 
 def createModuleTree(module, source_ref, source_code, is_main):
+    with withPhaseReport("tree_building", module_name=str(module.getFullName())):
+        _createModuleTree(
+            module=module,
+            source_ref=source_ref,
+            source_code=source_code,
+            is_main=is_main,
+        )
+
+
+def _createModuleTree(module, source_ref, source_code, is_main):
+    if isModuleCacheEnabled() and restoreModuleTree(
+        module=module, source_code=source_code
+    ):
+        return
+
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
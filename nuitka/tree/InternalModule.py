@@ -29,6 +29,9 @@ from nuitka.SourceCodeReferences import fromFilename
 
 internal_source_ref = fromFilename("internal").atInternal()
 
+# Singleton getters by name, for use when restoring from the module cache.
+_once_getters = {}
+
 
 def once_decorator(func):
     """ Cache result of a function call without arguments.
@@ -48,9 +51,33 @@ def once_decorator(func):
 
         return func.cached_value
 
+    _once_getters[func.__name__] = func, replacement
+
     return replacement
 
 
+def getInternalHelperGetterName(function_body):
+    """ Get the name of the getter that created an internal helper function.
+
+    Args:
+        function_body - function body owned by the internal module
+    Returns:
+        str - name to use with "getInternalHelperByGetterName"
+    """
+
+    for getter_name, (func, _replacement) in _once_getters.items():
+        if func.cached_value is function_body:
+            return getter_name
+
+    assert False, function_body
+
+
+def getInternalHelperByGetterName(getter_name):
+    _func, replacement = _once_getters[getter_name]
+
+    return replacement()
+
+
 @once_decorator
 def getInternalModule():
     """ Get the singleton internal module.
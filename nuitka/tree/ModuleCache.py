@@ -0,0 +1,597 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache of optimized module trees.
+
+After optimization finished, the module trees are saved as XML in the cache
+directory, and when the same module is compiled again, it is restored from
+there instead of being built from source. The key is a hash of the source
+code, the Nuitka and Python versions, and the options that influence tree
+building and optimization.
+
+What a module imports is not part of the key, as it is only known after the
+optimization. Instead, the entry records the used modules with a hash of
+their source code, and is not used if any of them changed. Other than that,
+the optimization of a module does not use facts from the trees of other
+modules, e.g. attribute values of imported modules, otherwise these would
+have to be recorded as well.
+
+The restored tree is already optimized, so the optimization only needs to
+compute it once, to establish the variable traces and to follow imports,
+without the repeated micro passes until nothing changes anymore.
+
+This builds on the XML persistence of the node tree, which is not complete
+for all nodes yet, therefore it is only enabled with the experimental flag
+"module_cache".
+"""
+
+import copy
+import os
+import sys
+
+from nuitka import Options, TreeXML, Variables
+from nuitka.__past__ import iterItems
+from nuitka.importing.ImportCache import getImportedModuleByNameAndPath
+from nuitka.nodes.FutureSpecs import fromFlags
+from nuitka.nodes.LocalsScopes import getLocalsDictHandles
+from nuitka.nodes.NodeBases import encodeConstantForXML
+from nuitka.Tracing import general
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import (
+    deleteFile,
+    getFileContents,
+    makePath,
+    relpath,
+    renameFile,
+)
+from nuitka.utils.Hashing import Hash, getFileContentsHash
+from nuitka.utils.ModuleNames import ModuleName
+from nuitka.Version import getNuitkaVersion
+
+from .InternalModule import (
+    getInternalHelperByGetterName,
+    getInternalHelperGetterName,
+    getInternalModule,
+)
+from .Operations import VisitorNoopMixin, visitTree
+
+# Increase this, whenever the XML format changes in incompatible ways, so old
+# cache entries are not considered anymore.
+_cache_format_version = 3
+
+# Cache keys of modules, computed when their tree was created.
+_module_cache_keys = {}
+
+# Recursions recorded in the cache entries of restored modules.
+_restored_recursions = {}
+
+# Modules restored from entries of fully optimized trees, these need not be
+# stored again.
+_restored_complete_modules = set()
+
+_options_key_values = None
+
+
+def isModuleCacheEnabled():
+    return Options.isExperimental("module_cache")
+
+
+def _getCacheDirectory():
+    result = os.path.join(getCacheDir(), "module-cache")
+
+    makePath(result)
+
+    return result
+
+
+def _getCacheFilename(cache_key):
+    return os.path.join(_getCacheDirectory(), cache_key + ".xml")
+
+
+def _getUserPluginHashes():
+    # User plugins can change the module trees in arbitrary ways, and their
+    # code may change without their filenames changing.
+    result = []
+
+    for user_plugin in sorted(Options.getUserPlugins()):
+        plugin_filename = user_plugin.split("=", 1)[0]
+
+        if os.path.isfile(plugin_filename):
+            result.append((user_plugin, getFileContentsHash(plugin_filename)))
+        else:
+            result.append((user_plugin, ""))
+
+    return result
+
+
+def getOptionsKeyValues():
+    # singleton, pylint: disable=global-statement
+    global _options_key_values
+
+    if _options_key_values is None:
+        _options_key_values = (
+            sorted(Options.getPythonFlags()),
+            Options.isFullCompat(),
+            Options.isDebug(),
+            Options.getFileReferenceMode(),
+            Options.isStandaloneMode(),
+            Options.shallMakeModule(),
+            sorted(Options.getExperimentalIndications()),
+            sorted(Options.getPluginsEnabled()),
+            sorted(Options.getPluginsDisabled()),
+            _getUserPluginHashes(),
+            Options.shallFollowStandardLibrary(),
+            Options.shallFollowNoImports(),
+            Options.shallFollowAllImports(),
+            sorted(Options.getShallFollowModules()),
+            sorted(Options.getShallFollowInNoCase()),
+            sorted(Options.getShallFollowExtra()),
+            sorted(Options.getShallFollowExtraFilePatterns()),
+        )
+
+    return _options_key_values
+
+
+def getModuleCacheKey(module, source_code):
+    """ Compute the cache key for a module tree.
+
+    Args:
+        module - module node the tree is for
+        source_code - source code after plugins had their say on it
+    Returns:
+        str - hex digest to use as the cache key
+    """
+
+    hash_value = Hash()
+
+    hash_value.updateFromValues(
+        _cache_format_version,
+        getNuitkaVersion(),
+        sys.version,
+        sys.executable,
+        module.__class__.__name__,
+        module.getFullName(),
+        module.getCompileTimeFilename(),
+        module.isTopModule(),
+        module.getCompilationMode(),
+        source_code,
+    )
+
+    hash_value.updateFromValues(*getOptionsKeyValues())
+
+    return hash_value.asHexDigest()
+
+
+class _ClosureTakingVisitor(VisitorNoopMixin):
+    """ Re-establish the closure taking of restored variable references.
+
+        The XML only references variables by owner and name, the providers
+        between the user and the owner must take the variable again, just
+        like tree building does it.
+    """
+
+    def onEnterNode(self, node):
+        variable = getattr(node, "variable", None)
+
+        if not isinstance(variable, Variables.Variable):
+            return
+
+        # Module variables and those of locals dictionaries are not closure
+        # taken, the locals dictionary of a class body is not a provider.
+        if variable.isModuleVariable() or variable.isLocalsDictVariable():
+            return
+
+        owner = variable.getOwner()
+        provider = node.getParentVariableProvider()
+
+        # Tree building only tracks users of variables from the source code.
+        if not variable.isTempVariable():
+            variable.addVariableUser(provider)
+
+        # The function referencing a closure variable also provides it, that
+        # is how it becomes part of the frame locals. Outlines reference it
+        # from their provider, so that one provides it as well.
+        referencing = not variable.isTempVariable()
+
+        while provider is not owner and not provider.isCompiledPythonModule():
+            if referencing:
+                if not provider.hasProvidedVariable(variable.getName()):
+                    provider.registerProvidedVariable(variable)
+
+            # Outlines take no closure, they use the one of their provider.
+            if not provider.isExpressionOutlineFunctionBodyBase():
+                provider.addClosureVariable(variable)
+
+                referencing = False
+
+            provider = provider.getParentVariableProvider()
+
+
+_internal_prefix = "__internal__$$$"
+
+
+def _iterInternalHelperReferences(xml):
+    for node_xml in xml.iter("node"):
+        if node_xml.attrib["kind"] != "ExpressionFunctionRef":
+            continue
+
+        if node_xml.attrib["code_name"].startswith(_internal_prefix):
+            yield node_xml
+
+
+def _resolveInternalHelperReferences(xml):
+    for node_xml in _iterInternalHelperReferences(xml):
+        getter_name = node_xml.attrib["code_name"][len(_internal_prefix) :]
+
+        node_xml.attrib["code_name"] = getInternalHelperByGetterName(
+            getter_name
+        ).getCodeName()
+
+
+def _getDependencyHash(filename):
+    # Packages are represented by their directory.
+    if os.path.isdir(filename):
+        filename = os.path.join(filename, "__init__.py")
+
+    if not os.path.isfile(filename):
+        return ""
+
+    return getFileContentsHash(filename)
+
+
+def _isCompiledDependency(module_name, module_relpath):
+    try:
+        used_module = getImportedModuleByNameAndPath(module_name, module_relpath)
+    except KeyError:
+        return False
+
+    return used_module.isCompiledPythonModule()
+
+
+def _addDependencies(module, xml):
+    # The optimization of a module uses what it imports, e.g. whether a module
+    # is found at all, so the modules used must still be the same.
+    for module_name, module_relpath in module.getUsedModules():
+        filename = os.path.abspath(module_relpath)
+
+        dependency = TreeXML.Element(
+            "dependency",
+            module_name=module_name.asString(),
+            filename=filename,
+            hash=_getDependencyHash(filename),
+        )
+
+        # Compiled modules were recursed to, restoring does not do that.
+        if _isCompiledDependency(module_name, module_relpath):
+            dependency.attrib["compiled"] = "True"
+
+        xml.append(dependency)
+
+
+def _checkDependencies(xml):
+    for dependency in xml:
+        if dependency.tag != "dependency":
+            continue
+
+        if (
+            _getDependencyHash(dependency.attrib["filename"])
+            != dependency.attrib["hash"]
+        ):
+            if Options.isShowProgress():
+                general.info(
+                    "Not using module cache entry, changed dependency '%s'."
+                    % dependency.attrib["module_name"]
+                )
+
+            return False
+
+    return True
+
+
+def _getRecursions(xml):
+    result = []
+
+    for dependency in xml:
+        if dependency.tag != "dependency" or "compiled" not in dependency.attrib:
+            continue
+
+        filename = dependency.attrib["filename"]
+
+        result.append(
+            (
+                ModuleName(dependency.attrib["module_name"]).getPackageName(),
+                filename,
+                relpath(filename),
+                "py",
+            )
+        )
+
+    return result
+
+
+def getRestoredRecursions(module):
+    """ Recursions of a module restored from the module cache.
+
+    Args:
+        module - module node to get the recursions of
+    Returns:
+        list - arguments for "recurseTo" for the compiled modules it used,
+        or None if the module was not restored from the cache
+    """
+
+    return _restored_recursions.get(module)
+
+
+def _restoreModuleTree(module, cache_filename):
+    text = getFileContents(cache_filename, "rb")
+
+    if str is not bytes:
+        text = text.decode("utf8")
+
+    xml = TreeXML.fromString(text)
+
+    # Check what we can before touching the module.
+    if xml.attrib["kind"] != module.__class__.__name__:
+        return False
+
+    roles = dict((role.attrib["name"], role) for role in xml if role.tag == "role")
+
+    if "body" not in roles or "functions" not in roles:
+        return False
+
+    if not _checkDependencies(xml):
+        return False
+
+    # Internal helpers are created on demand and their code names depend on
+    # the order of that, so they are stored by the name of their getter.
+    _resolveInternalHelperReferences(xml)
+
+    # Tree building normally determines these, while parsing the source code.
+    module.future_spec = fromFlags(xml.attrib.get("code_flags", ""))
+
+    if xml.attrib.get("needs_annotations") == "True":
+        module.markAsNeedsAnnotationsDictionary()
+
+    module.restoreChildrenFromXML(
+        functions_xml=roles["functions"], body_xml=roles["body"]
+    )
+
+    visitTree(module, _ClosureTakingVisitor())
+
+    _restored_recursions[module] = _getRecursions(xml)
+
+    if xml.attrib.get("complete") == "True":
+        _restored_complete_modules.add(module)
+
+    return True
+
+
+def restoreModuleTree(module, source_code):
+    """ Restore the module tree from the cache if possible.
+
+    Args:
+        module - module node to restore body and functions of
+        source_code - source code after plugins had their say on it
+    Returns:
+        bool - module tree was restored
+    """
+
+    cache_key = getModuleCacheKey(module, source_code)
+    _module_cache_keys[module] = cache_key
+
+    cache_filename = _getCacheFilename(cache_key)
+
+    if not os.path.exists(cache_filename):
+        return False
+
+    # Restoring changes the module and creates locals scopes, which must be
+    # undone, if the module is to be built from source code after all.
+    module_state = dict(
+        (key, copy.copy(value)) for key, value in iterItems(module.__dict__)
+    )
+    locals_dict_names = set(getLocalsDictHandles())
+
+    try:
+        result = _restoreModuleTree(module, cache_filename)
+    except Exception as e:  # Catch all the things, pylint: disable=broad-except
+        module.__dict__.clear()
+        module.__dict__.update(module_state)
+
+        # Internal helpers created on the way are kept, these are still used.
+        locals_dict_handles = getLocalsDictHandles()
+        locals_dict_prefix = "locals_%s" % module.getCodeName()
+
+        for locals_dict_name in set(locals_dict_handles) - locals_dict_names:
+            if locals_dict_name.startswith(locals_dict_prefix):
+                del locals_dict_handles[locals_dict_name]
+
+        # Make sure the next run does not use the entry again.
+        deleteFile(cache_filename, must_exist=False)
+
+        general.warning(
+            "Failed to restore module '%s' from module cache (%s), removed '%s'."
+            % (module.getFullName(), e, cache_filename)
+        )
+
+        return False
+
+    if not result:
+        # Outdated entries would not be replaced otherwise.
+        deleteFile(cache_filename, must_exist=False)
+    elif Options.isShowProgress():
+        general.info("Restored module '%s' from module cache." % module.getFullName())
+
+    return result
+
+
+def _getOutlineOwnerDepth(node, owner):
+    # Number of outlines between the node and the outline owning its variable,
+    # or None if it is not contained in it without a function between.
+    provider = node.getParentVariableProvider()
+    depth = 0
+
+    while provider is not owner:
+        if not provider.isExpressionOutlineFunctionBodyBase():
+            return None
+
+        depth += 1
+        provider = provider.getParentVariableProvider()
+
+    return depth
+
+
+def _iterNodesWithXml(node, xml):
+    yield node, xml
+
+    for (_name, children), role_xml in zip(node.getVisitableNodesNamed(), xml):
+        if children is None:
+            continue
+
+        if type(children) not in (list, tuple):
+            children = (children,)
+
+        for child, child_xml in zip(children, role_xml):
+            for result in _iterNodesWithXml(child, child_xml):
+                yield result
+
+
+def _markOutlines(module, xml):
+    # Outlines share the code name of their provider, so they get an ID, and
+    # variables owned by them get the depth of the outline, counted from the
+    # inside.
+    outline_ids = {}
+
+    for node, node_xml in _iterNodesWithXml(module, xml):
+        if node.isExpressionOutlineFunctionBodyBase():
+            outline_ids[node] = node_xml.attrib["outline_id"] = str(len(outline_ids))
+
+        if "owner" in node_xml.attrib:
+            owner = node.variable.getOwner()
+
+            if owner.isExpressionOutlineFunctionBodyBase():
+                depth = _getOutlineOwnerDepth(node, owner)
+
+                if depth is None:
+                    return None
+
+                node_xml.attrib["owner_outline"] = str(depth)
+
+    return outline_ids
+
+
+def _encodeConstants(module, xml):
+    # The "repr" of constants used for display cannot be restored exactly.
+    for node, node_xml in _iterNodesWithXml(module, xml):
+        if "constant" in node_xml.attrib:
+            del node_xml.attrib["constant"]
+
+            node_xml.attrib["constant_pickle"] = encodeConstantForXML(
+                node.getDetails()["constant"]
+            )
+
+
+def _makeModuleXml(module, complete):
+    """ Create the XML for a module, or None if it cannot be restored. """
+
+    xml = module.asXml()
+
+    outline_ids = _markOutlines(module, xml)
+
+    if outline_ids is None:
+        return None
+
+    _encodeConstants(module, xml)
+
+    xml.attrib["needs_annotations"] = str(module.needsAnnotationsDictionary())
+    xml.attrib["complete"] = str(complete)
+
+    internal_module = getInternalModule()
+
+    for node_xml in _iterInternalHelperReferences(xml):
+        function_body = internal_module.getFunctionFromCodeName(
+            node_xml.attrib["code_name"]
+        )
+
+        node_xml.attrib["code_name"] = _internal_prefix + getInternalHelperGetterName(
+            function_body
+        )
+
+    # The code names of functions are allocated on demand in tree order, which
+    # is not the order of restoring them, so make them explicit.
+    for role in xml:
+        if role.attrib["name"] == "functions":
+            for function, function_xml in zip(module.getFunctions(), role):
+                function_xml.attrib["code_name"] = function.getCodeName()
+
+                provider = function.getParentVariableProvider()
+
+                if provider.isExpressionOutlineFunctionBodyBase():
+                    function_xml.attrib["provider_outline"] = outline_ids[provider]
+
+    _addDependencies(module, xml)
+
+    return xml
+
+
+def storeModuleTrees(modules, complete):
+    """ Store the optimized trees of modules in the cache.
+
+    Trees of a complete optimization replace entries that were only from a
+    partial one, e.g. done by parallel optimization, which in turn only adds
+    entries not yet in the cache.
+
+    Args:
+        modules - iterable of modules, only compiled ones are considered
+        complete - bool, the trees are from the complete optimization
+    """
+
+    for module in modules:
+        if not module.isCompiledPythonModule():
+            continue
+
+        cache_key = _module_cache_keys.get(module)
+
+        # Only modules created from source code have a key.
+        if cache_key is None:
+            continue
+
+        cache_filename = _getCacheFilename(cache_key)
+
+        if complete:
+            if module in _restored_complete_modules:
+                continue
+        elif os.path.exists(cache_filename):
+            continue
+
+        xml = _makeModuleXml(module, complete)
+
+        if xml is None:
+            continue
+
+        text = TreeXML.toString(xml)
+
+        if str is not bytes:
+            text = text.encode("utf8")
+
+        # Write to a temporary file first, so other compilations running at the
+        # same time do not see incomplete entries.
+        temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+        with open(temp_filename, "wb") as output_file:
+            output_file.write(text)
+
+        renameFile(temp_filename, cache_filename)
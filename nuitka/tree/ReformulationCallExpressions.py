@@ -23,7 +23,7 @@ source code comments with developer manual sections.
 """
 
 from nuitka.nodes.AssignNodes import StatementAssignmentVariable
-from nuitka.nodes.CallNodes import makeExpressionCall
+from nuitka.nodes.CallNodes import ExpressionCallComplex, makeExpressionCall
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
 from nuitka.nodes.ContainerMakingNodes import ExpressionMakeTuple
 from nuitka.nodes.FunctionNodes import (
@@ -36,21 +36,7 @@ from nuitka.nodes.ReturnNodes import StatementReturn
 from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
 from nuitka.PythonVersions import python_version
 
-from .ComplexCallHelperFunctions import (
-    getFunctionCallHelperDictionaryUnpacking,
-    getFunctionCallHelperKeywordsStarDict,
-    getFunctionCallHelperKeywordsStarList,
-    getFunctionCallHelperKeywordsStarListStarDict,
-    getFunctionCallHelperPosKeywordsStarDict,
-    getFunctionCallHelperPosKeywordsStarList,
-    getFunctionCallHelperPosKeywordsStarListStarDict,
-    getFunctionCallHelperPosStarDict,
-    getFunctionCallHelperPosStarList,
-    getFunctionCallHelperPosStarListStarDict,
-    getFunctionCallHelperStarDict,
-    getFunctionCallHelperStarList,
-    getFunctionCallHelperStarListStarDict,
-)
+from .ComplexCallHelperFunctions import getFunctionCallHelperDictionaryUnpacking
 from .ReformulationDictionaryCreation import buildDictionaryUnpackingArgs
 from .ReformulationSequenceCreation import buildListUnpacking
 from .TreeHelpers import (
@@ -224,80 +210,43 @@ def _makeCallNode(
 
         return result
     else:
-        # Dispatch to complex helper function for each case. These do
-        # re-formulation of complex calls according to developer manual.
-
-        key = (
-            bool(positional_args),
-            bool(keys),
-            list_star_arg is not None,
-            dict_star_arg is not None,
-        )
-
-        table = {
-            (True, True, True, False): getFunctionCallHelperPosKeywordsStarList,
-            (True, False, True, False): getFunctionCallHelperPosStarList,
-            (False, True, True, False): getFunctionCallHelperKeywordsStarList,
-            (False, False, True, False): getFunctionCallHelperStarList,
-            (True, True, False, True): getFunctionCallHelperPosKeywordsStarDict,
-            (True, False, False, True): getFunctionCallHelperPosStarDict,
-            (False, True, False, True): getFunctionCallHelperKeywordsStarDict,
-            (False, False, False, True): getFunctionCallHelperStarDict,
-            (True, True, True, True): getFunctionCallHelperPosKeywordsStarListStarDict,
-            (True, False, True, True): getFunctionCallHelperPosStarListStarDict,
-            (False, True, True, True): getFunctionCallHelperKeywordsStarListStarDict,
-            (False, False, True, True): getFunctionCallHelperStarListStarDict,
-        }
-
-        get_helper = table[key]
-
-        helper_args = [called]
-
+        # Complex calls with star arguments, these are handled by a helper at
+        # run time, that also merges positional and keyword arguments.
         if positional_args:
-            helper_args.append(
-                makeSequenceCreationOrConstant(
-                    sequence_kind="tuple",
-                    elements=positional_args,
-                    source_ref=source_ref,
-                )
+            args = makeSequenceCreationOrConstant(
+                sequence_kind="tuple", elements=positional_args, source_ref=source_ref
             )
-
-        # Order of evaluation changed in Python3.5.
-        if python_version >= 350 and list_star_arg is not None:
-            helper_args.append(list_star_arg)
+        else:
+            args = None
 
         if keys:
-            helper_args.append(
-                makeDictCreationOrConstant(
-                    keys=keys, values=values, source_ref=source_ref
-                )
+            kw = makeDictCreationOrConstant(
+                keys=keys, values=values, source_ref=source_ref
             )
+        else:
+            kw = None
 
-        # Order of evaluation changed in Python3.5.
-        if python_version < 350 and list_star_arg is not None:
-            helper_args.append(list_star_arg)
-
-        if dict_star_arg is not None:
-            helper_args.append(dict_star_arg)
-
-        result = ExpressionFunctionCall(
-            function=ExpressionFunctionCreation(
-                function_ref=ExpressionFunctionRef(
-                    function_body=get_helper(), source_ref=source_ref
-                ),
-                defaults=(),
-                kw_defaults=None,
-                annotations=None,
-                source_ref=source_ref,
-            ),
-            values=helper_args,
+        result = ExpressionCallComplex(
+            called=called,
+            args=args,
+            kw=kw,
+            list_star_arg=list_star_arg,
+            dict_star_arg=dict_star_arg,
             source_ref=source_ref,
         )
 
         # Bug compatible line numbers before Python 3.8
         if python_version < 380:
+            # Order of evaluation changed in Python3.5, this is the last one.
+            if dict_star_arg is not None:
+                last_arg = dict_star_arg
+            elif python_version >= 350 and kw is not None:
+                last_arg = kw
+            else:
+                last_arg = list_star_arg
+
             result.setCompatibleSourceReference(
-                source_ref=helper_args[-1].getCompatibleSourceReference()
+                source_ref=last_arg.getCompatibleSourceReference()
             )
 
         return result
@@ -179,6 +179,30 @@ def withEnvironmentPathAdded(env_var_name, path):
             os.environ[env_var_name] = old_path
 
 
+def getEnvironmentWithPathAdded(env_var_name, path):
+    """ Copy of the environment with a path added to a variable.
+
+    Unlike "withEnvironmentPathAdded" this does not modify the process
+    environment, so it can be used from multiple threads.
+    """
+
+    if type(path) in (tuple, list):
+        path = os.pathsep.join(path)
+
+    result = dict(os.environ)
+
+    if path:
+        if str is not bytes and type(path) is bytes:
+            path = path.decode("utf-8")
+
+        if env_var_name in result:
+            result[env_var_name] += os.pathsep + path
+        else:
+            result[env_var_name] = path
+
+    return result
+
+
 @contextmanager
 def withEnvironmentVarOverriden(env_var_name, value):
     if env_var_name in os.environ:
@@ -0,0 +1,81 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Hash tools we use in Nuitka.
+
+Mostly to compute keys for caches, where we want to hash from several
+values of different types, e.g. source code, option values, and file
+contents, in a way that is stable across runs and Python versions.
+"""
+
+import hashlib
+
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
+
+
+class Hash(object):
+    __slots__ = ("hash",)
+
+    def __init__(self):
+        self.hash = hashlib.md5()
+
+    def updateFromValues(self, *values):
+        for value in values:
+            if type(value) is int:
+                value = str(value)
+
+            if type(value) in (str, unicode):
+                if str is not bytes or type(value) is unicode:
+                    value = value.encode("utf8")
+
+                self.hash.update(value)
+            elif type(value) is bytes:
+                self.hash.update(value)
+            elif type(value) in (tuple, list):
+                self.updateFromValues(*value)
+            else:
+                self.updateFromValues(repr(value))
+
+            # Separate values, so that "ab","c" and "a","bc" differ.
+            self.hash.update(b"\0")
+
+    def updateFromFile(self, filename):
+        with open(filename, "rb") as input_file:
+            while True:
+                chunk = input_file.read(65536)
+
+                if not chunk:
+                    break
+
+                self.hash.update(chunk)
+
+    def asHexDigest(self):
+        return self.hash.hexdigest()
+
+
+def getFileContentsHash(filename):
+    result = Hash()
+    result.updateFromFile(filename=filename)
+
+    return result.asHexDigest()
+
+
+def getStringHash(value):
+    result = Hash()
+    result.updateFromValues(value)
+
+    return result.asHexDigest()
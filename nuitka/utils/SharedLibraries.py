@@ -20,6 +20,7 @@
 """
 
 import os
+import struct
 import subprocess
 import sys
 from logging import warning
@@ -327,3 +328,205 @@ def callInstallNameToolAddRPath(filename, rpath):
 
     if result != 0:
         sys.exit("Error, call to 'install_name_tool' to add rpath failed.")
+
+
+# ELF constants used, see "elf.h" for these.
+_ELF_MAGIC = b"\x7fELF"
+_ELF_CLASS_64 = 2
+_ELF_DATA_BIG_ENDIAN = 2
+_ELF_PT_LOAD = 1
+_ELF_PT_DYNAMIC = 2
+_ELF_DT_NULL = 0
+_ELF_DT_NEEDED = 1
+_ELF_DT_STRTAB = 5
+_ELF_DT_RPATH = 15
+_ELF_DT_RUNPATH = 29
+
+
+class ElfFileError(Exception):
+    """ Not an ELF file, or not one we understand. """
+
+
+def _readElfStruct(elf_file, offset, fmt):
+    elf_file.seek(offset)
+
+    size = struct.calcsize(fmt)
+    data = elf_file.read(size)
+
+    if len(data) != size:
+        raise ElfFileError("Truncated ELF file")
+
+    return struct.unpack(fmt, data)
+
+
+def _readElfString(elf_file, offset):
+    elf_file.seek(offset)
+
+    result = b""
+
+    while True:
+        chunk = elf_file.read(256)
+
+        if not chunk:
+            raise ElfFileError("Unterminated string in ELF file")
+
+        end = chunk.find(b"\0")
+
+        if end != -1:
+            return result + chunk[:end]
+
+        result += chunk
+
+
+def _readElfDynamicSection(elf_file):
+    ident = elf_file.read(16)
+
+    if len(ident) != 16 or ident[:4] != _ELF_MAGIC:
+        raise ElfFileError("Not an ELF file")
+
+    is_64bit = ident[4:5] == struct.pack("B", _ELF_CLASS_64)
+    endian = ">" if ident[5:6] == struct.pack("B", _ELF_DATA_BIG_ENDIAN) else "<"
+
+    (machine,) = _readElfStruct(elf_file, 18, endian + "H")
+
+    if is_64bit:
+        (phoff,) = _readElfStruct(elf_file, 32, endian + "Q")
+        phentsize, phnum = _readElfStruct(elf_file, 54, endian + "HH")
+        phdr_format = endian + "IIQQQQQQ"
+        dyn_format = endian + "qQ"
+    else:
+        (phoff,) = _readElfStruct(elf_file, 28, endian + "I")
+        phentsize, phnum = _readElfStruct(elf_file, 42, endian + "HH")
+        phdr_format = endian + "IIIIIIII"
+        dyn_format = endian + "iI"
+
+    loads = []
+    dynamic = None
+
+    for count in range(phnum):
+        values = _readElfStruct(elf_file, phoff + count * phentsize, phdr_format)
+
+        if is_64bit:
+            p_type, _p_flags, p_offset, p_vaddr, _p_paddr, p_filesz = values[:6]
+        else:
+            p_type, p_offset, p_vaddr, _p_paddr, p_filesz = values[:5]
+
+        if p_type == _ELF_PT_LOAD:
+            loads.append((p_vaddr, p_offset, p_filesz))
+        elif p_type == _ELF_PT_DYNAMIC:
+            dynamic = (p_offset, p_filesz)
+
+    entries = []
+
+    if dynamic is not None:
+        dyn_offset, dyn_size = dynamic
+        dyn_entry_size = struct.calcsize(dyn_format)
+
+        count = dyn_size // dyn_entry_size
+        values = _readElfStruct(elf_file, dyn_offset, endian + dyn_format[1:] * count)
+
+        for tag, value in zip(values[::2], values[1::2]):
+            if tag == _ELF_DT_NULL:
+                break
+
+            entries.append((tag, value))
+
+    return {
+        "arch": (is_64bit, machine),
+        "loads": loads,
+        "dynamic": dynamic,
+        "dyn_format": dyn_format,
+        "entries": entries,
+    }
+
+
+def getElfDynamicInformation(filename):
+    """ Return the dynamic linking information of an ELF binary.
+
+    Args:
+        filename - The file to be investigated.
+
+    Returns:
+        dict with "needed" (list of DLL names), "rpath" and "runpath" (lists
+        of directories as given, possibly with "$ORIGIN"), and "arch", which
+        is only to compare with other binaries.
+
+    Notes:
+        Raises "ElfFileError" for files that are not ELF, or not understood.
+        Names and directories are bytes, like they are in the file.
+    """
+
+    with open(filename, "rb") as elf_file:
+        elf_info = _readElfDynamicSection(elf_file)
+        entries = elf_info["entries"]
+
+        # The string table is given by address, find it in the file.
+        strtab_offset = None
+
+        for tag, value in entries:
+            if tag == _ELF_DT_STRTAB:
+                for p_vaddr, p_offset, p_filesz in elf_info["loads"]:
+                    if p_vaddr <= value < p_vaddr + p_filesz:
+                        strtab_offset = value - p_vaddr + p_offset
+                        break
+
+        result = {"needed": [], "rpath": [], "runpath": [], "arch": elf_info["arch"]}
+
+        if strtab_offset is None:
+            return result
+
+        for tag, value in entries:
+            if tag == _ELF_DT_NEEDED:
+                result["needed"].append(_readElfString(elf_file, strtab_offset + value))
+            elif tag == _ELF_DT_RPATH:
+                result["rpath"] += _readElfString(
+                    elf_file, strtab_offset + value
+                ).split(b":")
+            elif tag == _ELF_DT_RUNPATH:
+                result["runpath"] += _readElfString(
+                    elf_file, strtab_offset + value
+                ).split(b":")
+
+    return result
+
+
+def removeElfRPATH(filename):
+    """ Remove "RPATH" and "RUNPATH" entries of an ELF binary.
+
+    Args:
+        filename - The file to be modified, must be writable.
+
+    Returns:
+        bool - entries were removed
+
+    Notes:
+        Like "chrpath -d" does it, the remaining dynamic entries are moved
+        up, and the space at the end is filled with terminating entries.
+    """
+
+    with open(filename, "r+b") as elf_file:
+        elf_info = _readElfDynamicSection(elf_file)
+        entries = elf_info["entries"]
+        dyn_format = elf_info["dyn_format"]
+
+        kept = [
+            (tag, value)
+            for tag, value in entries
+            if tag not in (_ELF_DT_RPATH, _ELF_DT_RUNPATH)
+        ]
+
+        if len(kept) == len(entries):
+            return False
+
+        dyn_offset, dyn_size = elf_info["dynamic"]
+        dyn_entry_size = struct.calcsize(dyn_format)
+
+        elf_file.seek(dyn_offset)
+
+        for tag, value in kept:
+            elf_file.write(struct.pack(dyn_format, tag, value))
+
+        for _count in range(dyn_size // dyn_entry_size - len(kept)):
+            elf_file.write(struct.pack(dyn_format, _ELF_DT_NULL, 0))
+
+    return True
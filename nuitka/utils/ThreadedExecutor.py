@@ -23,28 +23,35 @@ stub that does not thread at all.
 
 from threading import RLock, current_thread
 
-_use_threaded_executor = False
-
 try:
-    if _use_threaded_executor:
-        from concurrent.futures import (
-            ThreadPoolExecutor,
-            wait,
-            as_completed,
-            FIRST_EXCEPTION,
-        )  # pylint: disable=I0021,import-error,no-name-in-module,unused-import
+    from concurrent.futures import (
+        FIRST_EXCEPTION,
+        ThreadPoolExecutor,
+        wait,
+    )  # pylint: disable=I0021,import-error,no-name-in-module
+
+    def waitWorkers(workers):
+        """ Wait for workers and yield their results in submission order.
 
-        def waitWorkers(workers):
-            wait(workers, return_when=FIRST_EXCEPTION)
+        Should one of the workers raise an exception, the ones not started yet
+        are cancelled, and the exception is raised, without waiting for the
+        others to complete.
+        """
 
-            for future in as_completed(workers):
-                yield future.result()
+        wait(workers, return_when=FIRST_EXCEPTION)
 
+        for future in workers:
+            if future.done() and future.exception() is not None:
+                for other in workers:
+                    other.cancel()
 
-except ImportError:
-    _use_threaded_executor = False
+                future.result()
 
-if not _use_threaded_executor:
+        for future in workers:
+            yield future.result()
+
+
+except ImportError:
     # No backport installed, use stub for at least Python 2.6, and potentially
     # also Python 2.7, we might want to tell the user about it though, that
     # we think it should be installed. pylint: disable=function-redefined
@@ -70,6 +77,8 @@ if not _use_threaded_executor:
         if workers:
             return iter(workers[0].results)
 
+        return iter(())
+
 
 def getThreadIdent():
     return current_thread()
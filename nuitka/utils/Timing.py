@@ -21,10 +21,17 @@ Mostly for measurements of Nuitka of itself, e.g. how long did it take to
 call an external tool.
 """
 
+import json
+import os
+import sys
+from contextlib import contextmanager
 from logging import info
 from timeit import default_timer as timer
 
-from nuitka.Options import isShowProgress
+from nuitka.Options import getReportFilename, isShowProgress
+from nuitka.Version import getNuitkaVersion
+
+from .MemoryUsage import getOwnProcessMemoryUsage
 
 
 class StopWatch(object):
@@ -70,3 +77,107 @@ class TimerReport(object):
 
         if exception_type is None and isShowProgress():
             info(self.message % self.timer.delta())
+
+
+# Phases recorded for "--report", in order of completion.
+_phase_reports = []
+_phase_depth = 0
+_report_start_time = None
+
+
+def _getCpuTimes():
+    times = os.times()
+
+    # Own user and system time, and that of waited for child processes.
+    return times[0] + times[1], times[2] + times[3]
+
+
+@contextmanager
+def withPhaseReport(phase, **details):
+    """ Record time and memory usage of a compilation phase for "--report".
+
+    Args:
+        phase - name of the phase, e.g. "scons"
+        details - extra values to report, e.g. the module name
+    Notes:
+        Phases can be nested, e.g. tree building of modules happens during
+        the optimization passes, so the times of nested ones are included
+        in the outer ones.
+    """
+
+    # Using globals to keep it simple, pylint: disable=global-statement
+    global _phase_depth, _report_start_time
+
+    if getReportFilename() is None:
+        yield
+        return
+
+    start_time = timer()
+    start_cpu_time, start_children_cpu_time = _getCpuTimes()
+
+    if _report_start_time is None:
+        _report_start_time = start_time
+
+    depth = _phase_depth
+    _phase_depth += 1
+
+    try:
+        yield
+    finally:
+        _phase_depth -= 1
+
+        end_cpu_time, end_children_cpu_time = _getCpuTimes()
+
+        phase_report = {
+            "phase": phase,
+            "depth": depth,
+            "start": start_time - _report_start_time,
+            "wall_time": timer() - start_time,
+            "cpu_time": end_cpu_time - start_cpu_time,
+            "children_cpu_time": end_children_cpu_time - start_children_cpu_time,
+            "memory_usage": getOwnProcessMemoryUsage(),
+        }
+        phase_report.update(details)
+
+        _phase_reports.append(phase_report)
+
+
+def writePhaseReport():
+    """ Write the phases recorded so far to the "--report" filename.
+
+    Notes:
+        Memory usage is the peak resident set size on all but Windows,
+        where it is the current private usage of the process.
+    """
+
+    report_filename = getReportFilename()
+
+    if report_filename is None:
+        return
+
+    phases = sorted(_phase_reports, key=lambda phase_report: phase_report["start"])
+
+    # Totals per phase, e.g. tree building of all modules.
+    totals = {}
+
+    for phase_report in phases:
+        total = totals.setdefault(
+            phase_report["phase"],
+            {"count": 0, "wall_time": 0.0, "cpu_time": 0.0, "children_cpu_time": 0.0},
+        )
+
+        total["count"] += 1
+
+        for key in ("wall_time", "cpu_time", "children_cpu_time"):
+            total[key] += phase_report[key]
+
+    report = {
+        "nuitka_version": getNuitkaVersion(),
+        "python_version": sys.version.split()[0],
+        "memory_usage": getOwnProcessMemoryUsage(),
+        "phases": phases,
+        "totals": totals,
+    }
+
+    with open(report_filename, "w") as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
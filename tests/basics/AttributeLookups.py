@@ -0,0 +1,76 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Attribute lookups that change the class while looking at the instance.
+
+"""
+
+from __future__ import print_function
+
+
+class ClassValue(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "<ClassValue %s>" % self.name
+
+
+class ChangingClass(object):
+    value = ClassValue("original")
+
+
+class KeyChangingClass(str):
+    # Equal hash as the looked up attribute name, so the instance dictionary
+    # lookup compares with it, and that removes the class value.
+    def __hash__(self):
+        return hash("value")
+
+    def __eq__(self, other):
+        if ChangingClass.value.name == "original":
+            ChangingClass.value = ClassValue("replacement")
+
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+def getValue(instance):
+    return instance.value
+
+
+instance = ChangingClass()
+print("Initial lookup:", getValue(instance))
+
+instance.__dict__[KeyChangingClass("other")] = 1
+print("Lookup with class change:", getValue(instance))
+print("Lookup after class change:", getValue(instance))
+
+
+class ClassWithAVeryLongNameThatIsLongerThanFiftyCharactersForSure(object):
+    pass
+
+
+def getMissing(instance):
+    return instance.missing
+
+
+try:
+    getMissing(ClassWithAVeryLongNameThatIsLongerThanFiftyCharactersForSure())
+except AttributeError as e:
+    print("Missing attribute gives:", e)
@@ -0,0 +1,295 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test the limits of int and float values that are not objects.
+
+Local variables with only int or float values can be held in C values, this
+is to cover where that cannot be done, and the objects must take over.
+"""
+
+from __future__ import print_function
+
+
+def intAddLoop():
+    x = 9223372036854775804
+    step = 1
+
+    for _i in range(6):
+        x = x + step
+        print("add", x, type(x))
+
+    return x
+
+
+def intSubLoop():
+    x = -9223372036854775806
+    step = 1
+
+    for _i in range(6):
+        x = x - step
+        print("sub", x, type(x))
+
+    return x
+
+
+def intMultLoop():
+    x = 7
+    factor = 1 << 20
+
+    for _i in range(5):
+        x = x * factor
+        print("mult", x, type(x))
+
+    return x
+
+
+def intMultNegative():
+    x = -9223372036854775806
+    y = 0
+    one = 1
+    minus_one = -1
+
+    for _i in range(3):
+        x = x - one
+        y = x * minus_one
+        print("mult by -1", x, y, type(y))
+
+    x = -2147483647
+
+    for _i in range(3):
+        x = x - one
+        y = x * minus_one
+        print("mult 32 bits by -1", x, y, type(y))
+
+    return x
+
+
+def intBackIntoRange():
+    x = 2147483646
+    one = 1
+
+    for _i in range(2):
+        x = x + one
+        print("32 bits", x, type(x))
+
+    x = 9223372036854775806
+
+    for _i in range(2):
+        x = x + one
+        print("up", x, type(x))
+
+    for _i in range(3):
+        x = x - one
+        print("down", x, type(x))
+
+    return x
+
+
+def floatTrueDivZero():
+    y = 1.5
+    z = 1.0
+    half = 0.5
+    minus_one = -1.0
+
+    for _i in range(3):
+        z = z - half
+
+        try:
+            y = y / z
+        except ZeroDivisionError as e:
+            print("division by zero", repr(e))
+
+        print("kept", y, z)
+
+    z = half - half
+
+    for _i in range(2):
+        z = z * minus_one
+
+        try:
+            y = y / z
+        except ZeroDivisionError as e:
+            print("division by signed zero", repr(e))
+
+        print("kept", y, z)
+
+    return y
+
+
+def floatDivLoop():
+    y = 100.0
+    z = 3.0
+
+    for _i in range(3):
+        y = y / z
+        z = z - 1.0
+        print("div", y, z)
+
+    return y
+
+
+def floatDivLoopZero():
+    y = 1.0
+    z = 2.0
+
+    try:
+        for _i in range(5):
+            z = z - 1.0
+            y = y / z
+            print("div", y, z)
+    except ZeroDivisionError:
+        print("division by zero in loop at", y, z)
+
+    return y
+
+
+def floatLimits():
+    y = 4.49423283715579e307
+    two = 2.0
+
+    for _i in range(3):
+        y = y * two
+        print("grow", y)
+
+    y = y - y
+    print("nan", y != y)
+
+    y = 8.900295434028806e-308
+
+    for _i in range(4):
+        y = y / two
+        print("shrink", repr(y), y > 0.0)
+
+    return y
+
+
+def boolLoopCarried():
+    flag = False
+    count = 0
+
+    for value in (1, 0, 3, None, 5):
+        try:
+            flag = not flag
+            count = count + value
+        except TypeError as e:
+            print("bool kept through exception", flag, count, repr(e))
+
+        print("bool", flag, type(flag))
+
+    return flag
+
+
+def boolLoopShapeChange():
+    flag = True
+
+    for i in range(4):
+        print("bool changing", flag, type(flag))
+
+        if i == 1:
+            flag = 2
+        elif i == 2:
+            flag = 2.5
+        else:
+            flag = not flag
+
+    return flag
+
+
+def intLoopException():
+    x = 9223372036854775805
+    one = 1
+    divisor = 2
+
+    for _i in range(5):
+        try:
+            x = x + one
+            x = x // divisor
+            divisor = divisor - one
+        except ZeroDivisionError as e:
+            print("int kept through exception", x, divisor, repr(e))
+
+        print("int", x, type(x))
+
+    return x
+
+
+def intLoopShapeChange():
+    x = 1
+    half = 0.5
+
+    for i in range(6):
+        if i == 2:
+            x = x * half
+        elif i == 4:
+            x = str(x)
+        else:
+            x = x + x
+
+        print("int changing", x, type(x))
+
+    return x
+
+
+def floatLoopException():
+    y = 1.5
+    step = 0.75
+    values = (2.0, 0.0, "a", 4.0)
+
+    for value in values:
+        try:
+            y = y - step
+            y = y / value
+        except (ZeroDivisionError, TypeError) as e:
+            print("float kept through exception", y, repr(e))
+
+        print("float", y, type(y))
+
+    return y
+
+
+def floatLoopShapeChange():
+    y = 2.0
+    two = 2
+
+    for i in range(5):
+        if i == 1:
+            y = int(y)
+        elif i == 3:
+            y = [y]
+        else:
+            y = y * two
+
+        print("float changing", y, type(y))
+
+    return y
+
+
+intAddLoop()
+intSubLoop()
+intMultLoop()
+intMultNegative()
+intBackIntoRange()
+floatTrueDivZero()
+floatDivLoop()
+floatDivLoopZero()
+floatLimits()
+boolLoopCarried()
+boolLoopShapeChange()
+intLoopException()
+intLoopShapeChange()
+floatLoopException()
+floatLoopShapeChange()
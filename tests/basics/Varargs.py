@@ -68,3 +68,24 @@ print("Function with plain arg, varargs list and varargs dict:")
 list_dict_args_function(2, z=3)
 list_dict_args_function(2, 3)
 list_dict_args_function(a=2, b=3, c=4)
+
+print("Function with large star list argument:")
+
+
+def large_list_dict_args_function(*arg_list, **arg_dict):
+    return len(arg_list), arg_list[-1], arg_dict
+
+
+print(large_list_dict_args_function(1, *range(3000000)))
+print(large_list_dict_args_function(1, *range(3000000), a=1))
+print(max(1, *range(3000000)))
+
+print("Method with large star list argument, called from uncompiled code:")
+
+
+class LargeArgsMethodClass(object):
+    def method(self, *arg_list, **arg_dict):
+        return len(arg_list), arg_list[-1], arg_dict
+
+
+exec("print(LargeArgsMethodClass().method(1, *range(3000000), a=1))")
@@ -45,6 +45,7 @@ from nuitka.tools.testing.Common import (
     hasDebugPython,
     my_print,
     setup,
+    withExtendedExtraOptions,
 )
 
 
@@ -112,13 +113,27 @@ def main():
                 my_print("Skipped (no debug Python)")
                 continue
 
-            compareWithCPython(
-                dirname=None,
-                filename=filename,
-                extra_flags=extra_flags,
-                search_mode=search_mode,
-                needs_2to3=decideNeeds2to3(filename),
-            )
+            # The unboxed int and float types are experimental, this test is
+            # for them.
+            if filename == "UnboxedNumbers.py":
+                with withExtendedExtraOptions(
+                    "--experimental=nuitka_ilong", "--experimental=nuitka_ifloat"
+                ):
+                    compareWithCPython(
+                        dirname=None,
+                        filename=filename,
+                        extra_flags=extra_flags,
+                        search_mode=search_mode,
+                        needs_2to3=decideNeeds2to3(filename),
+                    )
+            else:
+                compareWithCPython(
+                    dirname=None,
+                    filename=filename,
+                    extra_flags=extra_flags,
+                    search_mode=search_mode,
+                    needs_2to3=decideNeeds2to3(filename),
+                )
 
             if search_mode.abortIfExecuted():
                 break
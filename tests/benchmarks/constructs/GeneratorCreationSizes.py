@@ -0,0 +1,48 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+def smallGenerator(a):
+    yield a
+
+def largeGenerator(a, b, c, d, e, f, g, h):
+    i = a + b
+    j = c + d
+    k = e + f
+    l = g + h
+    yield i + j + k + l
+
+def calledRepeatedly():
+    # We measure making generators of different sizes that are alive at the
+    # same time, which makes them reuse the memory of one another.
+# construct_begin
+    small = smallGenerator(1)
+    large = largeGenerator(1, 2, 3, 4, 5, 6, 7, 8)
+    del small
+# construct_alternative
+    large = None
+# construct_end
+
+    return large
+
+import itertools
+for x in itertools.repeat(None, 50000):
+    calledRepeatedly()
+
+print("OK.")
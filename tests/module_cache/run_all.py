@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Test that compiling twice uses the module cache with optimized trees.
+
+The first compilation optimizes the modules in parallel worker processes,
+which store their partial results in the cache, to be completed by the main
+process. The second compilation must restore all modules from the cache and
+not store any of them again, as their entries were complete already.
+"""
+
+import os
+import subprocess
+import sys
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    ),
+)
+
+# isort:start
+
+from nuitka import TreeXML
+from nuitka.tools.testing.Common import getTempDir, my_print, reportSkip, setup
+from nuitka.utils.FileOperations import getFileContents, listDir
+
+
+def compileMainProgram(output_dir, show_progress):
+    command = [
+        os.environ["PYTHON"],
+        os.path.join("..", "..", "bin", "nuitka"),
+        "--generate-c-only",
+        "--recurse-all",
+        "--experimental=module_cache",
+        "--experimental=parallel_optimization",
+        "--jobs=2",
+        "--output-dir=%s" % output_dir,
+        "ModuleCacheMain.py",
+    ]
+
+    if show_progress:
+        command.insert(2, "--show-progress")
+
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+    output, _err = process.communicate()
+
+    if str is not bytes:
+        output = output.decode("utf8")
+
+    if process.returncode != 0:
+        my_print(output)
+        sys.exit("Error, compilation failed.")
+
+    return output
+
+
+def getCacheEntries(cache_dir):
+    return dict(
+        (filename, getFileContents(path, "rb"))
+        for path, filename in listDir(os.path.join(cache_dir, "module-cache"))
+        if filename.endswith(".xml")
+    )
+
+
+def getGeneratedCode(output_dir):
+    build_dir = os.path.join(output_dir, "ModuleCacheMain.build")
+
+    return dict(
+        (filename, getFileContents(path))
+        for path, filename in listDir(build_dir)
+        if filename.startswith("module.") and filename.endswith(".c")
+    )
+
+
+def main():
+    setup(needs_io_encoding=True)
+
+    # Parallel optimization needs forked worker processes, and the cache
+    # directory is only taken from the environment like this on Linux.
+    if not sys.platform.startswith("linux"):
+        reportSkip("Module cache location not controllable", ".", "run_all.py")
+        return
+
+    tmp_dir = getTempDir()
+
+    os.environ["XDG_CACHE_HOME"] = os.path.join(tmp_dir, "cache")
+    cache_dir = os.path.join(os.environ["XDG_CACHE_HOME"], "Nuitka")
+
+    output_dir = os.path.join(tmp_dir, "output")
+
+    my_print("Compiling with empty module cache.")
+    compileMainProgram(output_dir=output_dir, show_progress=False)
+
+    entries = getCacheEntries(cache_dir)
+    generated_code = getGeneratedCode(output_dir)
+
+    # The main program and the module it uses.
+    assert len(entries) == 2, sorted(entries)
+
+    for filename, contents in sorted(entries.items()):
+        if str is not bytes:
+            contents = contents.decode("utf8")
+
+        assert TreeXML.fromString(contents).attrib["complete"] == "True", filename
+
+    my_print("Compiling again, restoring from module cache.")
+    output = compileMainProgram(output_dir=output_dir, show_progress=True)
+
+    for module_name in ("__main__", "ModuleCacheUsed"):
+        assert (
+            "Restored module '%s' from module cache." % module_name in output
+        ), module_name
+
+    assert getCacheEntries(cache_dir) == entries, "Cache entries were stored again."
+    assert getGeneratedCode(output_dir) == generated_code, "Generated code differs."
+
+    my_print("OK.")
+
+
+if __name__ == "__main__":
+    main()
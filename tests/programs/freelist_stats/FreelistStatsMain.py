@@ -0,0 +1,111 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Free list statistics and limits.
+
+Compiled with "--freelist-stats" and limits for the free lists of frames and
+generators, the program runs itself again in a child process and checks the
+statistics reported at its exit.
+"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+# Limits given at build time for the test.
+checked_limits = {"frame": 3, "generator": 5}
+
+
+def recurse(n):
+    if n == 0:
+        return 0
+
+    return recurse(n - 1) + 1
+
+
+def generator(value):
+    yield value
+
+
+def runProgram():
+    # Many frames alive at the same time, released when returning.
+    print("Recursion:", recurse(50))
+
+    # Many generators alive at the same time, released when deleted.
+    generators = [generator(i) for i in range(50)]
+    print("Generators:", sum(next(g) for g in generators))
+    del generators
+
+
+def getFreeListStats(report):
+    lines = report.splitlines()
+
+    header_index = lines.index("Nuitka free list statistics:")
+    columns = lines[header_index + 1].replace("high water", "high_water").split()
+
+    result = {}
+
+    for line in lines[header_index + 2 :]:
+        if line.startswith("Limits are set at build time"):
+            break
+
+        values = line.split()
+        result[values[0]] = dict(zip(columns[1:], (int(v) for v in values[1:])))
+
+    return result
+
+
+def checkFreeListStats(report):
+    stats = getFreeListStats(report)
+
+    for kind, limit in checked_limits.items():
+        assert stats[kind]["limit"] == limit, (kind, stats[kind])
+
+        # More objects were released than the limit allows to keep, but the
+        # free list never held more than that.
+        assert stats[kind]["high_water"] == limit, (kind, stats[kind])
+        assert stats[kind]["deletes"] > 0, (kind, stats[kind])
+        assert stats[kind]["misses"] > 0, (kind, stats[kind])
+
+    for kind, kind_stats in stats.items():
+        assert kind_stats["high_water"] <= kind_stats["limit"], (kind, kind_stats)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["child"]:
+        runProgram()
+    else:
+        is_compiled = type(recurse).__name__ == "compiled_function"
+
+        if is_compiled:
+            command = [sys.argv[0], "child"]
+        else:
+            command = [sys.executable, os.path.abspath(__file__), "child"]
+
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        output, report = process.communicate()
+
+        assert process.returncode == 0, report
+        print(output.decode("utf8"), end="")
+
+        # Only compiled programs report free lists.
+        if is_compiled:
+            checkFreeListStats(report.decode("utf8"))
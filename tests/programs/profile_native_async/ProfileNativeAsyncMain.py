@@ -0,0 +1,183 @@
+#     Copyright 2020, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Coroutines, asyncgens and generators suspending inside own frames.
+
+Compiled with "--profile-native", the program runs itself again in a child
+process and checks the profile written at its exit. Entering and leaving of
+profiled frames must not get out of step when resuming them, and every
+resumption counts as a call from the resuming code, just like "cProfile"
+does, which is used instead when not compiled.
+"""
+
+import asyncio
+import os
+import pstats
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+async def waiter(value):
+    await asyncio.sleep(0)
+    return value
+
+
+async def waitingContraction():
+    return [await waiter(i) for i in range(3)]
+
+
+async def asyncGenerator():
+    for i in range(3):
+        yield await waiter(i)
+
+
+async def consumeAsyncGenerator():
+    return [value async for value in asyncGenerator()]
+
+
+async def raisingWaiter():
+    await asyncio.sleep(0)
+    raise ValueError("raised after suspension")
+
+
+async def catchingContraction():
+    try:
+        return [await raisingWaiter() for _i in range(3)]
+    except ValueError as e:
+        return repr(e)
+
+
+def generator():
+    for i in range(3):
+        yield [i * j for j in range(3)]
+
+
+async def main():
+    print("Contraction:", await waitingContraction())
+    print("Asyncgen:", await consumeAsyncGenerator())
+    print("Exception:", await catchingContraction())
+    print("Generator:", list(generator()))
+
+
+def runProgram():
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(main())
+    loop.close()
+
+
+def runProfiledProgram():
+    temp_dir = tempfile.mkdtemp()
+    profile_filename = os.path.join(temp_dir, "profile.pstats")
+
+    env = dict(os.environ)
+
+    if type(main).__name__ == "compiled_function":
+        command = [sys.argv[0], "child"]
+        env["NUITKA_PROFILE_FILENAME"] = profile_filename
+    else:
+        command = [
+            sys.executable,
+            "-m",
+            "cProfile",
+            "-o",
+            profile_filename,
+            os.path.abspath(__file__),
+            "child",
+        ]
+
+    try:
+        output = subprocess.check_output(command, env=env)
+        stats = pstats.Stats(profile_filename).stats
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return output.decode("utf8"), stats
+
+
+def getFunctionLabels(stats):
+    result = {}
+
+    for key in stats:
+        if key[0].endswith("ProfileNativeAsyncMain.py"):
+            result[key] = key[2]
+
+    # Contractions are named by the function they belong to.
+    for key, value in stats.items():
+        if result.get(key) == "<listcomp>":
+            (caller,) = value[4]
+            result[key] = "<listcomp> in " + result[caller]
+
+    return result
+
+
+checked_functions = {
+    "main": (8, {}),
+    "waiter": (12, {"<listcomp> in waitingContraction": 6, "asyncGenerator": 6}),
+    "waitingContraction": (4, {"main": 4}),
+    "<listcomp> in waitingContraction": (4, {"waitingContraction": 4}),
+    "asyncGenerator": (7, {"<listcomp> in consumeAsyncGenerator": 7}),
+    "consumeAsyncGenerator": (4, {"main": 4}),
+    "<listcomp> in consumeAsyncGenerator": (4, {"consumeAsyncGenerator": 4}),
+    "raisingWaiter": (2, {"<listcomp> in catchingContraction": 2}),
+    "catchingContraction": (2, {"main": 2}),
+    "<listcomp> in catchingContraction": (2, {"catchingContraction": 2}),
+    "generator": (4, {"main": 4}),
+    "<listcomp> in generator": (3, {"generator": 3}),
+}
+
+
+def getCallCounts(stats):
+    labels = getFunctionLabels(stats)
+
+    result = {}
+
+    for key, value in stats.items():
+        label = labels.get(key)
+
+        if label not in checked_functions:
+            continue
+
+        # The callers of "main" are not compiled code, those are different.
+        callers = dict(
+            (labels[caller], caller_value[0])
+            for caller, caller_value in value[4].items()
+            if labels.get(caller) in checked_functions
+        )
+
+        result[label] = (value[1], callers)
+
+    return result
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["child"]:
+        runProgram()
+    else:
+        # Only the profile of the child is checked, avoid leaving a file behind.
+        os.environ["NUITKA_PROFILE_FILENAME"] = os.devnull
+
+        output, stats = runProfiledProgram()
+        print(output, end="")
+
+        call_counts = getCallCounts(stats)
+
+        for label, (calls, callers) in sorted(call_counts.items()):
+            print(label, "called", calls, "times from", sorted(callers.items()))
+
+        assert call_counts == checked_functions, call_counts
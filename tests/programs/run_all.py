@@ -166,6 +166,22 @@ def main():
             elif sys.platform == "darwin" and python_version >= "3.8":
                 reportSkip("Hangs for unknown reasons", ".", filename)
                 continue
+        elif filename == "profile_native_async":
+            if python_version < "3.6":
+                reportSkip("Uses await in contractions", ".", filename)
+                continue
+
+            os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + " --profile-native"
+        elif filename == "freelist_stats":
+            os.environ["NUITKA_EXTRA_OPTIONS"] = (
+                extra_options
+                + " --freelist-stats --freelist-limit=frame=3"
+                + " --freelist-limit=generator=5"
+            )
+
+            # The program checks the report of a child process, its own is
+            # only for compiled programs.
+            extra_flags.append("ignore_stderr")
         else:
             os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
 